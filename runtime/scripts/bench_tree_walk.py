@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark task_walk.find_dirs against Path.rglob on a synthetic tree.
+
+Builds a GAIA-like tree of about ``--files`` files in a temporary directory.
+Most of the files sit where stale_cache_cleanup has nothing to do: ``.git``
+objects, a virtualenv, ``node_modules`` and ``archive``. The rest are
+component sources with ``__pycache__`` folders. The script then times the
+``__pycache__`` search both ways.
+
+Usage:
+    python runtime/scripts/bench_tree_walk.py [--files 200000] [--workers 4] [--repeat 3]
+
+Exit 0 when both walks agree on every __pycache__ outside pruned subtrees.
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from runtime.task_walk import PruneRules, find_dirs  # noqa: E402
+
+FILES_PER_DIR = 50
+
+# Share of files per top-level area; the rest go to component sources.
+LAYOUT = {
+    ".git/objects": 0.35,
+    ".venv/lib/python3.11/site-packages": 0.25,
+    "_AURORA/node_modules": 0.15,
+    "archive": 0.10,
+}
+
+
+def build_tree(root, total_files):
+    """Create the synthetic tree under root; return the file count made."""
+    areas = dict(LAYOUT)
+    areas["components"] = 1.0 - sum(LAYOUT.values())
+    made = 0
+    for area, share in areas.items():
+        dirs = max(1, int(total_files * share) // FILES_PER_DIR)
+        for i in range(dirs):
+            if area == "components":
+                directory = root / f"_C{i % 12:02d}" / f"pkg{i // 12 % 40}" / f"mod{i}"
+            else:
+                directory = root / area / f"d{i % 64:02d}" / f"sub{i}"
+            directory.mkdir(parents=True, exist_ok=True)
+            for j in range(FILES_PER_DIR - 1):
+                (directory / f"f{j}.py").touch()
+            # One __pycache__ per leaf, pruned or not, so rglob sees them all.
+            (directory / "__pycache__").mkdir(exist_ok=True)
+            (directory / "__pycache__" / "f0.cpython-311.pyc").touch()
+            made += FILES_PER_DIR
+    return made
+
+
+def timed(fn, repeat):
+    """Return (best seconds, result) over repeat runs."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--keep", metavar="DIR", help="build the tree in DIR and keep it")
+    args = parser.parse_args()
+
+    root = Path(args.keep) if args.keep else Path(tempfile.mkdtemp(prefix="gaia_walk_bench_"))
+    try:
+        started = time.perf_counter()
+        made = build_tree(root, args.files)
+        print(f"built {made} files under {root} in {time.perf_counter() - started:.1f}s")
+
+        rules = PruneRules()
+        rglob_s, rglob_found = timed(
+            lambda: [str(p) for p in root.rglob("__pycache__")], args.repeat
+        )
+        serial_s, serial_found = timed(
+            lambda: find_dirs(root, {"__pycache__"}, prune=rules, max_workers=1), args.repeat
+        )
+        parallel_s, parallel_found = timed(
+            lambda: find_dirs(root, {"__pycache__"}, prune=rules, max_workers=args.workers),
+            args.repeat,
+        )
+
+        def kept(path):
+            parts = Path(path).relative_to(root).parts[:-1]
+            return not any(rules.prunes(part) for part in parts)
+
+        expected = sorted(p for p in rglob_found if kept(p))
+        print(f"{'walker':<28}{'seconds':>10}{'dirs found':>12}{'speedup':>10}")
+        for label, seconds, found in (
+            ("Path.rglob", rglob_s, rglob_found),
+            ("find_dirs (1 worker)", serial_s, serial_found),
+            (f"find_dirs ({args.workers} workers)", parallel_s, parallel_found),
+        ):
+            print(f"{label:<28}{seconds:>10.3f}{len(found):>12}{rglob_s / seconds:>9.1f}x")
+
+        agree = sorted(serial_found) == expected and sorted(parallel_found) == expected
+        print("results agree" if agree else "RESULTS DIFFER")
+        return 0 if agree else 1
+    finally:
+        if not args.keep:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
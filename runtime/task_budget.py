@@ -0,0 +1,379 @@
+"""Per-task resource budgets for the GAIA task runner.
+
+A task registered with ``max_rss_mb``, ``max_cpu_seconds`` or
+``max_open_files`` runs in a child Python interpreter whose limits are
+lowered with ``resource.setrlimit`` before the task starts, so a runaway
+task is stopped by the kernel instead of exhausting the daemon:
+
+- ``max_rss_mb`` caps ``RLIMIT_AS`` at the child's address space after
+  start-up plus the budget. Linux does not enforce ``RLIMIT_RSS``, so the
+  budget bounds the memory the task may *add*; allocations beyond it raise
+  ``MemoryError``.
+- ``max_cpu_seconds`` sets ``RLIMIT_CPU`` (rounded up to whole seconds);
+  the kernel sends ``SIGXCPU`` at the limit and ``SIGKILL`` a second later.
+- ``max_open_files`` sets ``RLIMIT_NOFILE``: no descriptor numbered at or
+  above the limit can be opened (stdio counts).
+
+The child is started with ``os.posix_spawn`` rather than ``os.fork``: the
+daemon runs many threads (lane pools, watcher, control socket, metrics,
+probes), and a forked copy inherits whatever locks they held at that
+instant (logging, state store, import lock) and can deadlock before the
+task even starts. A fresh interpreter holds no such locks. The price is
+that the task is pickled to the child, so it must be a module-level
+callable, as for the process executor.
+
+The parent reaps the child with ``os.wait4`` and records its peak RSS and
+CPU time whether the task succeeded, failed or was killed, so budgets can
+be sized from real measurements. The peak is that of the child process,
+interpreter start-up (and the task's imports) included. A child that
+outlives its deadline (``timeout``, or DEFAULT_TIMEOUT_SECONDS) is killed.
+
+Spawning and rlimits require a POSIX platform; elsewhere
+``BUDGETS_AVAILABLE`` is False and budgeted tasks run unconfined (the
+runner logs a warning).
+
+Usage:
+    from runtime.task_budget import ResourceBudget, run_with_budget
+    usage = {}
+    output = run_with_budget(module_level_fn, ResourceBudget(max_rss_mb=512), usage=usage)
+    usage["resources"]["peak_rss_mb"]
+"""
+
+from __future__ import annotations
+
+import errno
+import json
+import math
+import os
+import pickle
+import select
+import signal
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits
+    resource = None  # type: ignore[assignment]
+
+#: True where budgets can be enforced (posix_spawn and rlimits available).
+BUDGETS_AVAILABLE = hasattr(os, "posix_spawn") and resource is not None
+
+#: Wall-clock deadline for a budgeted child when the caller sets none.
+DEFAULT_TIMEOUT_SECONDS = 3600.0
+
+# Descriptors the child reads its job from and writes its outcome to.
+_JOB_FD = 3
+_RESULT_FD = 4
+
+
+class BudgetExceededError(RuntimeError):
+    """Raised when a budgeted task is stopped for exceeding a limit.
+
+    Attributes:
+        resource: ``"memory"``, ``"cpu"`` or ``"open_files"``.
+        limit: The configured limit (MiB, seconds or descriptors).
+    """
+
+    def __init__(self, resource_name: str, limit: Optional[float], detail: str) -> None:
+        """Build the error message from the exhausted resource.
+
+        Args:
+            resource_name: ``"memory"``, ``"cpu"`` or ``"open_files"``.
+            limit: The configured limit, if known.
+            detail: What the child reported or how it died.
+        """
+        super().__init__(f"{resource_name} budget exceeded (limit {limit}): {detail}")
+        self.resource = resource_name
+        self.limit = limit
+
+
+class BudgetedTaskError(RuntimeError):
+    """Raised when a budgeted task fails in its child for another reason."""
+
+
+@dataclass(frozen=True)
+class ResourceBudget:
+    """Kernel-enforced limits for one task execution.
+
+    Attributes:
+        max_rss_mb: Memory the task may allocate beyond the inherited
+            daemon image, in MiB, or None.
+        max_cpu_seconds: CPU time (user + system) the task may use, or None.
+        max_open_files: ``RLIMIT_NOFILE`` for the task, or None.
+    """
+
+    max_rss_mb: Optional[float] = None
+    max_cpu_seconds: Optional[float] = None
+    max_open_files: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        """Validate the limits.
+
+        Raises:
+            ValueError: If a limit is not positive or max_open_files < 4.
+        """
+        for name in ("max_rss_mb", "max_cpu_seconds"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be > 0, got {value}")
+        if self.max_open_files is not None and self.max_open_files < 4:
+            # stdio plus the result pipe must fit.
+            raise ValueError(f"max_open_files must be >= 4, got {self.max_open_files}")
+
+    def limits(self) -> Dict[str, float]:
+        """Return the configured limits, keyed by field name."""
+        return {
+            name: value
+            for name, value in (
+                ("max_rss_mb", self.max_rss_mb),
+                ("max_cpu_seconds", self.max_cpu_seconds),
+                ("max_open_files", self.max_open_files),
+            )
+            if value is not None
+        }
+
+
+def run_with_budget(
+    fn: Callable[[], Any],
+    budget: ResourceBudget,
+    timeout: Optional[float] = None,
+    usage: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """Run ``fn`` in a child interpreter under ``budget`` and return its output.
+
+    Args:
+        fn: Picklable zero-argument callable (a module-level function or
+            a ``functools.partial`` of one). Its return value must be
+            picklable too; anything else is converted to JSON-safe values.
+        budget: Limits applied in the child before fn starts.
+        timeout: Kill the child with SIGKILL after this many seconds
+            (DEFAULT_TIMEOUT_SECONDS when None).
+        usage: Dict receiving ``cpu_seconds`` and a ``resources`` summary
+            (``peak_rss_mb`` of the child process, ``cpu_seconds``,
+            ``open_files`` at exit, ``limits``), even when this raises.
+
+    Returns:
+        fn's return value.
+
+    Raises:
+        BudgetExceededError: If the child hit one of the limits.
+        BudgetedTaskError: If fn raised, or the child died otherwise.
+        TimeoutError: If the timeout expired first.
+        pickle.PicklingError: If fn cannot be sent to the child.
+    """
+    usage = {} if usage is None else usage
+    timeout = DEFAULT_TIMEOUT_SECONDS if timeout is None else timeout
+    job = pickle.dumps(
+        {
+            "sys_path": list(sys.path),
+            "limits": (budget.max_rss_mb, budget.max_cpu_seconds, budget.max_open_files),
+            "fn": pickle.dumps(fn),
+        }
+    )
+    job_read, job_write = os.pipe()
+    read_fd, write_fd = os.pipe()
+    try:
+        pid = os.posix_spawn(
+            sys.executable,
+            [sys.executable, os.path.abspath(__file__)],
+            os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, job_read, _JOB_FD),
+                (os.POSIX_SPAWN_DUP2, write_fd, _RESULT_FD),
+            ],
+        )
+    finally:
+        os.close(job_read)
+        os.close(write_fd)
+    try:
+        view = memoryview(job)
+        while view:
+            view = view[os.write(job_write, view) :]
+    except OSError:
+        pass  # the child died before reading its job; reaped below
+    finally:
+        os.close(job_write)
+    chunks = []
+    timed_out = False
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                os.kill(pid, signal.SIGKILL)
+                timed_out = True
+                break
+            ready, _, _ = select.select([read_fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(read_fd, 1 << 16)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(read_fd)
+        _, status, rusage = os.wait4(pid, 0)
+
+    cpu_seconds = rusage.ru_utime + rusage.ru_stime
+    payload: Dict[str, Any] = {}
+    if chunks and not timed_out:
+        try:
+            payload = pickle.loads(b"".join(chunks))
+        except Exception:  # noqa: BLE001 - truncated by a kill mid-write
+            payload = {}
+    # ru_maxrss is bytes on macOS and KiB elsewhere.
+    peak_kb = rusage.ru_maxrss / 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+    usage["cpu_seconds"] = cpu_seconds
+    usage["resources"] = {
+        "peak_rss_mb": round(peak_kb / 1024, 1),
+        "cpu_seconds": cpu_seconds,
+        "open_files": payload.get("open_files"),
+        "limits": budget.limits(),
+    }
+
+    if timed_out:
+        raise TimeoutError(f"budgeted child {pid} killed after {timeout}s")
+    kind = payload.get("status")
+    if kind == "ok":
+        return payload.get("output")
+    if kind == "budget":
+        name = payload["resource"]
+        raise BudgetExceededError(name, _limit_for(budget, name), payload.get("error", ""))
+    if kind == "error":
+        raise BudgetedTaskError(payload.get("error", "task failed"))
+    if os.WIFSIGNALED(status):
+        sig = os.WTERMSIG(status)
+        cpu_limit = budget.max_cpu_seconds
+        hit_cpu_limit = bool(cpu_limit) and cpu_seconds >= cpu_limit
+        if sig == signal.SIGXCPU or (sig == signal.SIGKILL and hit_cpu_limit):
+            raise BudgetExceededError("cpu", cpu_limit, f"killed by {signal.Signals(sig).name}")
+        raise BudgetedTaskError(f"budgeted child killed by {signal.Signals(sig).name}")
+    code = os.waitstatus_to_exitcode(status)
+    raise BudgetedTaskError(f"budgeted child exited with status {code}")
+
+
+def _child_main() -> None:
+    """Read the job, apply the limits, run fn and write the outcome; never returns."""
+    code = 0
+    try:
+        with os.fdopen(_JOB_FD, "rb") as fh:
+            job = pickle.load(fh)
+        sys.path[:] = job["sys_path"]
+        budget = ResourceBudget(*job["limits"])
+        try:
+            fn = pickle.loads(job["fn"])
+        except Exception as exc:  # noqa: BLE001 - reported like a task error
+            payload: Dict[str, Any] = {
+                "status": "error",
+                "error": f"could not load task: {type(exc).__name__}: {exc}",
+            }
+        else:
+            restore_as = _apply_limits(budget)
+            try:
+                payload = {"status": "ok", "output": fn()}
+            except BaseException as exc:  # noqa: BLE001 - report everything to the parent
+                exhausted = _exhausted_resource(exc)
+                payload = {
+                    "status": "budget" if exhausted else "error",
+                    "resource": exhausted,
+                    "error": f"{type(exc).__name__}: {exc}" if str(exc) else type(exc).__name__,
+                }
+            if restore_as is not None:
+                # Headroom for pickling the result; the task itself has finished.
+                resource.setrlimit(resource.RLIMIT_AS, restore_as)
+        payload["open_files"] = _count_open_files()
+        try:
+            data = pickle.dumps(payload)
+        except Exception:  # noqa: BLE001
+            payload["output"] = json.loads(json.dumps(payload.get("output"), default=str))
+            data = pickle.dumps(payload)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(_RESULT_FD, view) :]
+    except BaseException:  # noqa: BLE001
+        code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code)
+
+
+def _apply_limits(budget: ResourceBudget) -> Optional[tuple]:
+    """Lower this process's rlimits to the budget.
+
+    Returns:
+        The original ``RLIMIT_AS`` pair if it was lowered, else None.
+    """
+    resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+    restore_as = None
+    if budget.max_rss_mb is not None:
+        vsz_mb = _virtual_size_mb()
+        if vsz_mb is not None:
+            original = resource.getrlimit(resource.RLIMIT_AS)
+            soft = int((vsz_mb + budget.max_rss_mb) * 1024 * 1024)
+            if original[1] != resource.RLIM_INFINITY:
+                soft = min(soft, original[1])
+            resource.setrlimit(resource.RLIMIT_AS, (soft, original[1]))
+            restore_as = original
+    if budget.max_cpu_seconds is not None:
+        soft = max(1, math.ceil(budget.max_cpu_seconds))
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        new_hard = soft + 1 if hard == resource.RLIM_INFINITY else min(hard, soft + 1)
+        resource.setrlimit(resource.RLIMIT_CPU, (min(soft, new_hard), new_hard))
+    if budget.max_open_files is not None:
+        _, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        limit = budget.max_open_files
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (limit, limit))
+    return restore_as
+
+
+def _exhausted_resource(exc: BaseException) -> Optional[str]:
+    """Return the budget an exception (or its cause chain) points at."""
+    seen = set()
+    current: Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, MemoryError):
+            return "memory"
+        if isinstance(current, OSError) and current.errno in (errno.EMFILE, errno.ENFILE):
+            return "open_files"
+        current = current.__cause__ or current.__context__
+    return None
+
+
+def _limit_for(budget: ResourceBudget, resource_name: str) -> Optional[float]:
+    """Return the configured limit for a resource name."""
+    return {
+        "memory": budget.max_rss_mb,
+        "cpu": budget.max_cpu_seconds,
+        "open_files": budget.max_open_files,
+    }.get(resource_name)
+
+
+def _virtual_size_mb() -> Optional[float]:
+    """Return this process's virtual size in MiB, or None without ``/proc``."""
+    try:
+        with open("/proc/self/statm", "rb") as fh:
+            pages = int(fh.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def _count_open_files() -> Optional[int]:
+    """Return the number of open descriptors, where ``/proc`` exposes it."""
+    try:
+        return len(os.listdir("/proc/self/fd")) - 1  # minus listdir's own fd
+    except OSError:
+        return None
+
+
+if __name__ == "__main__":  # pragma: no cover - entry point of budgeted children
+    _child_main()
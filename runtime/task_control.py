@@ -0,0 +1,279 @@
+"""Unix-socket control plane for a running GAIA task runner daemon.
+
+The daemon listens on a local Unix-domain socket. Each connection sends one
+command line and receives one JSON line back:
+
+    run <task>        queue a task to run as soon as possible
+    pause [<task>]    pause the whole scheduler, or disable one task
+    resume [<task>]   resume the scheduler, or re-enable one task
+    stats             execution, lane and cache metrics plus scheduler state
+    results [<task>]  latest result of every task (or one task)
+    tasks             registered tasks with their schedule and next due time
+    ping              liveness check
+
+A global ``pause`` lasts only as long as the daemon process. ``pause <task>``
+disables the task, and that is saved to the runner's state file: the task
+stays disabled across restarts until ``resume <task>``.
+
+Requests are served on their own threads and only touch the runner through
+short, lock-protected calls. ``run`` enqueues rather than executes, so a
+client never waits on, or blocks, task execution.
+
+Usage:
+    from runtime.task_control import send_command, start_control_server
+    server = start_control_server(runner, Path(".gaia_task_runner.sock"))
+    send_command(Path(".gaia_task_runner.sock"), "run health_check")
+    server.shutdown()
+
+    python -m runtime.task_runner ctl stats
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Union
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle with task_runner
+    from runtime.task_runner import TaskRunner
+
+logger = logging.getLogger("gaia.runtime.task_control")
+
+#: Longest command line accepted from a client, in bytes.
+MAX_REQUEST_BYTES = 4096
+
+#: False where Python has no Unix-domain sockets (Windows).
+CONTROL_AVAILABLE = hasattr(socket, "AF_UNIX")
+
+
+class ControlError(RuntimeError):
+    """Raised by send_command() when the daemon reports an error."""
+
+
+def handle_command(runner: "TaskRunner", line: str) -> Dict[str, Any]:
+    """Execute one control command against ``runner``.
+
+    Args:
+        runner: The daemon's runner.
+        line: Command text, e.g. ``"run health_check"``.
+
+    Returns:
+        JSON-serialisable response with ``ok`` and either the command's
+        payload or an ``error`` message.
+    """
+    words = line.split()
+    if not words:
+        return {"ok": False, "error": "empty command"}
+    command, args = words[0].lower(), words[1:]
+    handler = _COMMANDS.get(command)
+    if handler is None:
+        expected = ", ".join(sorted(_COMMANDS))
+        return {"ok": False, "error": f"unknown command {command!r}; expected one of {expected}"}
+    try:
+        return {"ok": True, **handler(runner, args)}
+    except KeyError as exc:
+        return {"ok": False, "error": f"unknown task {exc.args[0]!r}"}
+    except (TypeError, ValueError) as exc:
+        return {"ok": False, "error": str(exc)}
+
+
+def _one_task(args: List[str], command: str) -> str:
+    """Return the single task-name argument of a command."""
+    if len(args) != 1:
+        raise ValueError(f"usage: {command} <task>")
+    return args[0]
+
+
+def _cmd_run(runner: "TaskRunner", args: List[str]) -> Dict[str, Any]:
+    name = _one_task(args, "run")
+    runner.trigger(name)
+    return {"queued": name, "paused": runner.paused}
+
+
+def _cmd_pause(runner: "TaskRunner", args: List[str]) -> Dict[str, Any]:
+    if args:
+        runner.disable(_one_task(args, "pause"))
+        return {"disabled": args[0]}
+    runner.pause()
+    return {"paused": True}
+
+
+def _cmd_resume(runner: "TaskRunner", args: List[str]) -> Dict[str, Any]:
+    if args:
+        runner.enable(_one_task(args, "resume"))
+        return {"enabled": args[0]}
+    runner.resume()
+    return {"paused": False}
+
+
+def _cmd_stats(runner: "TaskRunner", args: List[str]) -> Dict[str, Any]:
+    return {
+        "paused": runner.paused,
+        "next_due_seconds": runner.seconds_until_next_due(),
+        "tasks": runner.get_stats(),
+        "lanes": runner.get_lane_stats(),
+        "cache": runner.get_cache_stats(),
+    }
+
+
+def _cmd_results(runner: "TaskRunner", args: List[str]) -> Dict[str, Any]:
+    results = runner.get_results()
+    if args:
+        name = _one_task(args, "results")
+        if name not in results:
+            raise KeyError(name)
+        results = {name: results[name]}
+    return {"results": results}
+
+
+def _cmd_tasks(runner: "TaskRunner", args: List[str]) -> Dict[str, Any]:
+    return {
+        "tasks": {
+            task.name: {
+                "enabled": task.enabled,
+                "priority": task.priority,
+                "schedule": task.cron.expression if task.cron else task.effective_interval(),
+                "last_run": task.last_run,
+                "pending_runs": task.pending_runs,
+            }
+            for task in runner.list_tasks()
+        }
+    }
+
+
+def _cmd_ping(runner: "TaskRunner", args: List[str]) -> Dict[str, Any]:
+    return {"pid": os.getpid()}
+
+
+_COMMANDS: Dict[str, Callable[["TaskRunner", List[str]], Dict[str, Any]]] = {
+    "run": _cmd_run,
+    "pause": _cmd_pause,
+    "resume": _cmd_resume,
+    "stats": _cmd_stats,
+    "results": _cmd_results,
+    "tasks": _cmd_tasks,
+    "ping": _cmd_ping,
+}
+
+
+class _ControlHandler(socketserver.StreamRequestHandler):
+    """Serve one command line per connection."""
+
+    server: "ControlServer"
+
+    def handle(self) -> None:
+        raw = self.rfile.readline(MAX_REQUEST_BYTES)
+        line = raw.decode("utf-8", errors="replace").strip()
+        response = handle_command(self.server.runner, line)
+        logger.debug("control %r -> ok=%s", line, response["ok"])
+        self.wfile.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+
+
+class ControlServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix-socket server bound to a TaskRunner.
+
+    Args:
+        path: Socket file to bind.
+        runner: Runner the commands act on.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: Union[str, Path], runner: "TaskRunner") -> None:
+        """Bind the socket, replacing a stale socket file if present.
+
+        Args:
+            path: Socket file to bind.
+            runner: Runner the commands act on.
+
+        Raises:
+            RuntimeError: If another daemon is already serving ``path``.
+        """
+        self.path = Path(path)
+        self.runner = runner
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _remove_stale_socket(self.path)
+        super().__init__(str(self.path), _ControlHandler)
+        os.chmod(self.path, 0o600)
+
+    def server_close(self) -> None:
+        """Close the socket and remove its file."""
+        super().server_close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _remove_stale_socket(path: Path) -> None:
+    """Unlink a socket file nobody is listening on.
+
+    Raises:
+        RuntimeError: If a live server answers on ``path``.
+    """
+    if not path.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        path.unlink()
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"A task runner is already listening on {path}")
+
+
+def start_control_server(runner: "TaskRunner", path: Union[str, Path]) -> ControlServer:
+    """Serve control commands for ``runner`` on a background thread.
+
+    Args:
+        runner: Runner the commands act on.
+        path: Socket file to bind (mode 0600).
+
+    Returns:
+        The running server; call ``shutdown()`` then ``server_close()``
+        to stop it.
+
+    Raises:
+        RuntimeError: If Unix sockets are unavailable or another daemon
+            already serves ``path``.
+    """
+    if not CONTROL_AVAILABLE:
+        raise RuntimeError("Unix-domain sockets are not available on this platform")
+    server = ControlServer(path, runner)
+    thread = threading.Thread(target=server.serve_forever, name="gaia-control", daemon=True)
+    thread.start()
+    logger.info("Control socket listening on %s", path)
+    return server
+
+
+def send_command(path: Union[str, Path], command: str, timeout: float = 10.0) -> Dict[str, Any]:
+    """Send one command to a running daemon and return its response.
+
+    Args:
+        path: The daemon's control socket.
+        command: Command line, e.g. ``"pause warden_scan"``.
+        timeout: Seconds to wait for the connection and the reply.
+
+    Returns:
+        The decoded response (``ok`` is True).
+
+    Raises:
+        ControlError: If the daemon rejected the command.
+        OSError: If no daemon is listening on ``path``.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+        sock.sendall(command.encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            response = json.loads(reader.readline() or b"{}")
+    if not response.get("ok"):
+        raise ControlError(response.get("error", "no response from daemon"))
+    return response
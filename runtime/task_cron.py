@@ -0,0 +1,232 @@
+"""Cron-expression schedules for the GAIA task runner.
+
+Parses standard five-field cron expressions (minute, hour, day of month,
+month, day of week) plus the ``@daily``-style aliases and the bare words
+used by the legacy ``register_task(schedule="hourly")`` API. Each field is
+expanded once, at parse time, into a sorted tuple of allowed values, so
+computing the next fire time is a handful of bisects rather than a
+re-parse or a minute-by-minute scan. Parsed schedules are cached by
+expression text.
+
+Fire times are evaluated in local time, so ``"0 3 * * *"`` means 03:00 on
+the host's clock, including across DST changes.
+
+Usage:
+    from runtime.task_cron import parse_schedule
+    cron = parse_schedule("0 3 * * *")      # or "@daily", "hourly", ...
+    cron.next_fire(time.time())             # Unix time of the next 03:00
+"""
+
+from __future__ import annotations
+
+import functools
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+#: ``@alias`` and legacy schedule words mapped to their cron expression.
+ALIASES: Dict[str, str] = {
+    "yearly": "0 0 1 1 *",
+    "annually": "0 0 1 1 *",
+    "monthly": "0 0 1 * *",
+    "weekly": "0 0 * * 0",
+    "daily": "0 0 * * *",
+    "midnight": "0 0 * * *",
+    "hourly": "0 * * * *",
+}
+
+_MONTH_NAMES = {
+    name: i + 1
+    for i, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+    )
+}
+_DAY_NAMES = {name: i for i, name in enumerate(("sun", "mon", "tue", "wed", "thu", "fri", "sat"))}
+
+# (name, low, high, names) per field, in expression order. Day of week
+# accepts 7 as an alias for Sunday.
+_FIELDS = (
+    ("minute", 0, 59, {}),
+    ("hour", 0, 23, {}),
+    ("day of month", 1, 31, {}),
+    ("month", 1, 12, _MONTH_NAMES),
+    ("day of week", 0, 7, _DAY_NAMES),
+)
+
+#: Give up searching for a fire time after this many years (e.g. Feb 30).
+_SEARCH_YEARS = 8
+
+
+class CronSchedule:
+    """A parsed cron expression with precomputed field sets.
+
+    Use parse_schedule() rather than constructing directly so identical
+    expressions share one cached instance.
+
+    Args:
+        expression: Five-field cron expression (aliases already resolved).
+
+    Raises:
+        ValueError: If the expression is malformed or can never fire.
+    """
+
+    def __init__(self, expression: str) -> None:
+        """Parse and validate the expression.
+
+        Args:
+            expression: Five-field cron expression.
+
+        Raises:
+            ValueError: If the expression is malformed or can never fire.
+        """
+        parts = expression.split()
+        if len(parts) != len(_FIELDS):
+            raise ValueError(
+                f"Cron expression {expression!r} must have 5 fields "
+                "(minute hour day-of-month month day-of-week)"
+            )
+        self.expression = " ".join(parts)
+        fields = [_parse_field(part, *spec) for part, spec in zip(parts, _FIELDS)]
+        self.minutes, self.hours, self.days, self.months = fields[:4]
+        self.weekdays = tuple(sorted({0 if d == 7 else d for d in fields[4]}))
+        # Vixie cron: when both day fields are restricted, either may match.
+        self._dom_any = parts[2] == "*"
+        self._dow_any = parts[4] == "*"
+        self.next_fire(datetime(2000, 1, 1).timestamp())
+
+    def __repr__(self) -> str:
+        return f"CronSchedule({self.expression!r})"
+
+    def next_fire(self, after: float) -> float:
+        """Return the first fire time strictly after ``after``.
+
+        Args:
+            after: Unix timestamp to search from.
+
+        Returns:
+            Unix timestamp of the next matching minute in local time.
+
+        Raises:
+            ValueError: If no matching time exists within the search window.
+        """
+        candidate = datetime.fromtimestamp(after).replace(second=0, microsecond=0)
+        candidate += timedelta(minutes=1)
+        limit = candidate.year + _SEARCH_YEARS
+        while candidate.year <= limit:
+            month = _next_value(self.months, candidate.month)
+            if month is None:
+                candidate = datetime(candidate.year + 1, self.months[0], 1)
+                continue
+            if month != candidate.month:
+                candidate = datetime(candidate.year, month, 1)
+                continue
+            if not self._day_matches(candidate):
+                candidate = datetime(candidate.year, candidate.month, candidate.day) + timedelta(days=1)
+                continue
+            hour = _next_value(self.hours, candidate.hour)
+            if hour is None:
+                candidate = datetime(candidate.year, candidate.month, candidate.day) + timedelta(days=1)
+                continue
+            if hour != candidate.hour:
+                candidate = candidate.replace(hour=hour, minute=0)
+                continue
+            minute = _next_value(self.minutes, candidate.minute)
+            if minute is None:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                continue
+            candidate = candidate.replace(minute=minute)
+            fire = candidate.timestamp()
+            if fire > after:
+                return fire
+            # Repeated wall-clock hour after a DST fall-back.
+            candidate += timedelta(minutes=1)
+        raise ValueError(f"Cron expression {self.expression!r} never fires")
+
+    def _day_matches(self, moment: datetime) -> bool:
+        """Apply the day-of-month / day-of-week rules to a date."""
+        in_dom = moment.day in self.days
+        in_dow = (moment.isoweekday() % 7) in self.weekdays
+        if self._dom_any or self._dow_any:
+            return in_dom and in_dow
+        return in_dom or in_dow
+
+
+@functools.lru_cache(maxsize=256)
+def parse_schedule(text: str) -> CronSchedule:
+    """Parse a cron expression, ``@alias`` or legacy schedule word.
+
+    Results are cached, so repeated registrations of the same schedule
+    share one parsed instance.
+
+    Args:
+        text: E.g. ``"0 3 * * *"``, ``"@daily"``, ``"hourly"``.
+
+    Returns:
+        The parsed CronSchedule.
+
+    Raises:
+        ValueError: If the text is not a valid schedule.
+    """
+    key = text.strip().lower()
+    alias = ALIASES.get(key[1:] if key.startswith("@") else key)
+    if alias is not None:
+        return CronSchedule(alias)
+    if key.startswith("@"):
+        raise ValueError(f"Unknown schedule alias {text!r}; expected one of @{', @'.join(ALIASES)}")
+    return CronSchedule(key)
+
+
+def _parse_field(text: str, name: str, low: int, high: int, names: Dict[str, int]) -> Tuple[int, ...]:
+    """Expand one cron field into its sorted allowed values.
+
+    Args:
+        text: Field text, e.g. ``"*/15"``, ``"1-5"``, ``"mon,wed"``.
+        name: Field name for error messages.
+        low: Smallest allowed value.
+        high: Largest allowed value.
+        names: Symbolic names accepted for values (months, weekdays).
+
+    Returns:
+        Sorted tuple of allowed values.
+
+    Raises:
+        ValueError: If the field is malformed or out of range.
+    """
+    values = set()
+    for item in text.split(","):
+        base, _, step_text = item.partition("/")
+        step = _parse_int(step_text, name) if step_text else 1
+        if step < 1:
+            raise ValueError(f"Cron {name} step must be >= 1 in {text!r}")
+        if base == "*":
+            start, end = low, high
+        elif "-" in base:
+            first, _, last = base.partition("-")
+            start, end = _parse_value(first, name, names), _parse_value(last, name, names)
+        else:
+            start = _parse_value(base, name, names)
+            end = high if step_text else start
+        if not low <= start <= end <= high:
+            raise ValueError(f"Cron {name} value {item!r} outside {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return tuple(sorted(values))
+
+
+def _parse_value(text: str, name: str, names: Dict[str, int]) -> int:
+    """Parse a single numeric or symbolic field value."""
+    symbolic = names.get(text.lower())
+    return symbolic if symbolic is not None else _parse_int(text, name)
+
+
+def _parse_int(text: str, name: str) -> int:
+    """Parse an integer, raising ValueError naming the field."""
+    try:
+        return int(text)
+    except ValueError:
+        raise ValueError(f"Invalid cron {name} value {text!r}") from None
+
+
+def _next_value(allowed: Tuple[int, ...], current: int) -> Optional[int]:
+    """Return the smallest allowed value >= current, or None."""
+    index = bisect_left(allowed, current)
+    return allowed[index] if index < len(allowed) else None
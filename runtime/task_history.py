@@ -0,0 +1,324 @@
+"""Append-only execution history for the GAIA task runner.
+
+Every task result is appended to a small SQLite database so older runs
+remain queryable after ``TaskRunner.get_results()`` has moved on. Retention
+is enforced by age and by a per-task run count, and outputs larger than a
+threshold are zlib-compressed into a separate table so the run index stays
+compact.
+
+Usage:
+    from runtime.task_history import TaskHistoryStore, parse_duration
+    history = TaskHistoryStore(".gaia_task_history.db", max_age_seconds=30 * 86400)
+    history.append(result_dict)
+    history.query("health_check", since_seconds=parse_duration("7d"))
+    history.summary("health_check", since_seconds=parse_duration("7d"))
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger("gaia.runtime.task_history")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    duration_seconds REAL,
+    cpu_seconds REAL,
+    error TEXT,
+    meta TEXT,
+    output_inline TEXT,
+    output_id INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_task_started ON runs (task, started_at);
+CREATE INDEX IF NOT EXISTS runs_started ON runs (started_at);
+CREATE TABLE IF NOT EXISTS outputs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    data BLOB NOT NULL
+);
+"""
+
+#: Result keys stored in dedicated columns; anything else goes to ``meta``.
+_COLUMN_KEYS = {"task", "status", "timestamp", "duration_seconds", "cpu_seconds", "error", "output"}
+
+_DURATION_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*$")
+_DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_duration(text: str) -> float:
+    """Parse a short duration such as ``"90s"``, ``"12h"`` or ``"7d"``.
+
+    Args:
+        text: Number followed by an optional unit (s, m, h, d, w).
+
+    Returns:
+        Duration in seconds.
+
+    Raises:
+        ValueError: If the text is not a recognised duration.
+    """
+    match = _DURATION_RE.match(text)
+    if not match:
+        raise ValueError(f"Invalid duration {text!r}; expected e.g. 30m, 12h, 7d")
+    return float(match.group(1)) * _DURATION_UNITS[match.group(2)]
+
+
+class TaskHistoryStore:
+    """SQLite-backed, retention-bounded history of task results.
+
+    Args:
+        path: Database file; created on first use.
+        max_age_seconds: Runs older than this are pruned. None keeps all.
+        max_runs_per_task: Only the newest N runs per task are kept.
+            None disables the count limit.
+        inline_output_bytes: Serialised outputs up to this size are stored
+            in the run row; larger ones are compressed out-of-line.
+        prune_every: Enforce retention after this many appends.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_age_seconds: Optional[float] = 30 * 86400,
+        max_runs_per_task: Optional[int] = 1000,
+        inline_output_bytes: int = 512,
+        prune_every: int = 100,
+    ) -> None:
+        """Open (or create) the history database and apply retention.
+
+        Args:
+            path: Database file.
+            max_age_seconds: Age-based retention limit.
+            max_runs_per_task: Count-based retention limit.
+            inline_output_bytes: Threshold for out-of-line storage.
+            prune_every: Appends between retention passes.
+        """
+        self.path = Path(path)
+        self._max_age = max_age_seconds
+        self._max_runs = max_runs_per_task
+        self._inline_bytes = inline_output_bytes
+        self._prune_every = max(1, prune_every)
+        self._appends = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        self.prune()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def append(self, result: Dict[str, Any]) -> None:
+        """Store one task result.
+
+        Args:
+            result: A result dict as produced by TaskRunner, with at least
+                ``task``, ``status`` and ``timestamp``.
+        """
+        started_at = _to_epoch(result.get("timestamp"))
+        meta = {k: v for k, v in result.items() if k not in _COLUMN_KEYS}
+        output_inline: Optional[str] = None
+        blob: Optional[bytes] = None
+        if result.get("output") is not None:
+            encoded = json.dumps(result["output"], default=str)
+            if len(encoded) <= self._inline_bytes:
+                output_inline = encoded
+            else:
+                blob = zlib.compress(encoded.encode("utf-8"), 6)
+
+        with self._lock, self._conn:
+            output_id = None
+            if blob is not None:
+                output_id = self._conn.execute(
+                    "INSERT INTO outputs (data) VALUES (?)", (blob,)
+                ).lastrowid
+            self._conn.execute(
+                "INSERT INTO runs (task, status, started_at, duration_seconds, cpu_seconds,"
+                " error, meta, output_inline, output_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    result.get("task"),
+                    result.get("status"),
+                    started_at,
+                    result.get("duration_seconds"),
+                    result.get("cpu_seconds"),
+                    result.get("error"),
+                    json.dumps(meta, default=str) if meta else None,
+                    output_inline,
+                    output_id,
+                ),
+            )
+            self._appends += 1
+            due_for_prune = self._appends % self._prune_every == 0
+        if due_for_prune:
+            self.prune()
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Apply age and count retention and drop orphaned outputs.
+
+        Args:
+            now: Reference Unix time (defaults to the current time).
+
+        Returns:
+            Number of runs deleted.
+        """
+        now = time.time() if now is None else now
+        deleted = 0
+        with self._lock, self._conn:
+            if self._max_age is not None:
+                deleted += self._conn.execute(
+                    "DELETE FROM runs WHERE started_at < ?", (now - self._max_age,)
+                ).rowcount
+            if self._max_runs is not None:
+                deleted += self._conn.execute(
+                    "DELETE FROM runs WHERE id IN ("
+                    " SELECT id FROM (SELECT id, ROW_NUMBER() OVER"
+                    " (PARTITION BY task ORDER BY started_at DESC, id DESC) AS rn FROM runs)"
+                    " WHERE rn > ?)",
+                    (self._max_runs,),
+                ).rowcount
+            if deleted:
+                self._conn.execute(
+                    "DELETE FROM outputs WHERE id NOT IN"
+                    " (SELECT output_id FROM runs WHERE output_id IS NOT NULL)"
+                )
+        return deleted
+
+    def query(
+        self,
+        task: Optional[str] = None,
+        since_seconds: Optional[float] = None,
+        limit: Optional[int] = None,
+        include_output: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Return stored runs, newest first.
+
+        Args:
+            task: Restrict to one task name; None for all tasks.
+            since_seconds: Only runs started within this many seconds.
+            limit: Maximum number of runs returned.
+            include_output: Decompress and include each run's ``output``.
+
+        Returns:
+            List of result-shaped dicts with ``timestamp`` in ISO 8601.
+        """
+        where, params = self._filters(task, since_seconds)
+        sql = (
+            "SELECT r.*, o.data AS output_blob FROM runs r"
+            " LEFT JOIN outputs o ON o.id = r.output_id"
+            f"{where} ORDER BY r.started_at DESC, r.id DESC"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        runs = []
+        for row in rows:
+            run: Dict[str, Any] = {
+                "task": row["task"],
+                "status": row["status"],
+                "timestamp": datetime.fromtimestamp(row["started_at"]).astimezone().isoformat(),
+                "duration_seconds": row["duration_seconds"],
+                "cpu_seconds": row["cpu_seconds"],
+            }
+            if row["error"] is not None:
+                run["error"] = row["error"]
+            if row["meta"]:
+                run.update(json.loads(row["meta"]))
+            if include_output:
+                if row["output_blob"] is not None:
+                    run["output"] = json.loads(zlib.decompress(row["output_blob"]))
+                elif row["output_inline"] is not None:
+                    run["output"] = json.loads(row["output_inline"])
+            runs.append(run)
+        return runs
+
+    def summary(
+        self, task: Optional[str] = None, since_seconds: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Aggregate stored runs per task.
+
+        Args:
+            task: Restrict to one task name; None for all tasks.
+            since_seconds: Only runs started within this many seconds.
+
+        Returns:
+            Dict mapping task name to ``runs``, ``statuses``,
+            ``success_rate``, ``mean_duration_seconds``,
+            ``max_duration_seconds`` and ``last_run`` (ISO 8601).
+        """
+        where, params = self._filters(task, since_seconds)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT r.task, r.status, COUNT(*) AS n, AVG(r.duration_seconds) AS mean,"
+                " MAX(r.duration_seconds) AS max, MAX(r.started_at) AS last"
+                f" FROM runs r{where} GROUP BY r.task, r.status",
+                params,
+            ).fetchall()
+
+        out: Dict[str, Dict[str, Any]] = {}
+        weighted: Dict[str, float] = {}
+        timed: Dict[str, int] = {}
+        for row in rows:
+            entry = out.setdefault(
+                row["task"],
+                {"runs": 0, "statuses": {}, "max_duration_seconds": None, "last": 0.0},
+            )
+            entry["runs"] += row["n"]
+            entry["statuses"][row["status"]] = row["n"]
+            entry["last"] = max(entry["last"], row["last"])
+            if row["mean"] is not None:
+                weighted[row["task"]] = weighted.get(row["task"], 0.0) + row["mean"] * row["n"]
+                timed[row["task"]] = timed.get(row["task"], 0) + row["n"]
+                current = entry["max_duration_seconds"]
+                entry["max_duration_seconds"] = row["max"] if current is None else max(current, row["max"])
+
+        for name, entry in out.items():
+            entry["success_rate"] = entry["statuses"].get("success", 0) / entry["runs"]
+            entry["mean_duration_seconds"] = (
+                weighted[name] / timed[name] if timed.get(name) else None
+            )
+            entry["last_run"] = datetime.fromtimestamp(entry.pop("last")).astimezone().isoformat()
+        return out
+
+    @staticmethod
+    def _filters(task: Optional[str], since_seconds: Optional[float]) -> tuple:
+        """Build the WHERE clause shared by query() and summary()."""
+        clauses = []
+        params: List[Any] = []
+        if task is not None:
+            clauses.append("r.task = ?")
+            params.append(task)
+        if since_seconds is not None:
+            clauses.append("r.started_at >= ?")
+            params.append(time.time() - since_seconds)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+
+def _to_epoch(timestamp: Any) -> float:
+    """Convert an ISO 8601 result timestamp to Unix time (now if absent)."""
+    if isinstance(timestamp, str):
+        try:
+            return datetime.fromisoformat(timestamp).timestamp()
+        except ValueError:
+            logger.debug("Unparseable result timestamp %r", timestamp)
+    return time.time()
@@ -0,0 +1,165 @@
+"""Input fingerprints for the GAIA task runner.
+
+A task can declare the files and directories it reads (``registry.json``,
+``.gaia_changes``, project folders). Fingerprinting those inputs with a
+handful of ``stat`` calls tells the runner whether anything changed since
+the previous run, without reading file contents.
+
+Each path contributes its modification time, size and inode. A directory
+contributes its own stat, which changes when entries are added, removed or
+renamed directly inside it. A missing path contributes a fixed marker, so
+creating or deleting an input also counts as a change.
+
+fingerprint_tree() extends this to whole directory trees, descending with
+``os.scandir`` up to an optional depth and skipping the contents (not the
+existence) of bulky directories such as ``.git`` and ``node_modules``.
+InputSet bundles such a declaration for ``TaskRunner.register(inputs=...)``.
+
+Usage:
+    from runtime.task_inputs import InputSet, fingerprint_paths, fingerprint_tree
+    before = fingerprint_paths(["registry.json", ".gaia_changes"])
+    ...
+    changed = fingerprint_paths(["registry.json", ".gaia_changes"]) != before
+    fingerprint_tree(["src"], max_depth=3)
+    InputSet(["registry.json", "projects"], max_depth=1).fingerprint()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, FrozenSet, Iterable, List, Optional, Sequence, Tuple, Union
+
+#: Directory names whose contents fingerprint_tree() does not descend into.
+DEFAULT_PRUNE: FrozenSet[str] = frozenset(
+    {".git", "__pycache__", "node_modules", ".venv", "venv", ".mypy_cache", ".pytest_cache", ".tox"}
+)
+
+PathLike = Union[str, Path]
+
+
+def fingerprint_paths(paths: Iterable[Union[str, Path]]) -> str:
+    """Return a digest of the stat metadata of ``paths``.
+
+    Args:
+        paths: Files or directories to fingerprint, in a stable order.
+
+    Returns:
+        Hex digest that changes when any path's mtime, size or inode
+        changes, or when a path appears or disappears.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        digest.update(os.fsencode(str(path)))
+        try:
+            st = os.stat(path)
+        except OSError:
+            digest.update(b"\0missing\0")
+            continue
+        digest.update(f"\0{st.st_mtime_ns}:{st.st_size}:{st.st_ino}\0".encode("ascii"))
+    return digest.hexdigest()
+
+
+def fingerprint_tree(
+    paths: Iterable[PathLike],
+    max_depth: Optional[int] = None,
+    prune: FrozenSet[str] = DEFAULT_PRUNE,
+) -> str:
+    """Return a digest of the stat metadata of ``paths`` and their contents.
+
+    Entries are visited in sorted order so the digest is stable. Symlinks
+    are recorded but not followed below the top level.
+
+    Args:
+        paths: Files or directory roots.
+        max_depth: How many directory levels below each root to include;
+            0 fingerprints the roots only, None descends without limit.
+        prune: Directory names whose existence is recorded but whose stat
+            and contents are ignored.
+
+    Returns:
+        Hex digest that changes when any visited entry's mtime, size or
+        inode changes, or when an entry appears or disappears.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for root in paths:
+        root = os.fspath(root)
+        digest.update(os.fsencode(root))
+        try:
+            st = os.stat(root)
+        except OSError:
+            digest.update(b"\0missing\0")
+            continue
+        _feed(digest, "", st)
+        if max_depth == 0 or not os.path.isdir(root):
+            continue
+        stack: List[Tuple[str, int]] = [(root, 1)]
+        while stack:
+            directory, depth = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                digest.update(b"\0unreadable\0")
+                continue
+            for entry in entries:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                name = os.path.relpath(entry.path, root)
+                if is_dir and entry.name in prune:
+                    # Existence only: churn inside (.git, caches) is not an input.
+                    digest.update(os.fsencode(name) + b"\0pruned\0")
+                    continue
+                _feed(digest, name, st)
+                if is_dir and (max_depth is None or depth < max_depth):
+                    stack.append((entry.path, depth + 1))
+    return digest.hexdigest()
+
+
+def _feed(digest: Any, name: str, st: os.stat_result) -> None:
+    """Add one entry's identity and stat fields to a digest."""
+    digest.update(os.fsencode(name))
+    digest.update(f"\0{st.st_mtime_ns}:{st.st_size}:{st.st_ino}\0".encode("ascii"))
+
+
+@dataclass(frozen=True)
+class InputSet:
+    """The filesystem inputs a task's result depends on.
+
+    Attributes:
+        paths: Files or directories, or a zero-argument callable returning
+            them (for inputs only known at run time, e.g. the project
+            folders listed in ``registry.json``).
+        max_depth: Directory levels fingerprinted below each path; None
+            walks whole trees.
+        prune: Directory names whose existence alone is fingerprinted.
+    """
+
+    paths: Union[Sequence[PathLike], Callable[[], Iterable[PathLike]]]
+    max_depth: Optional[int] = None
+    prune: FrozenSet[str] = field(default=DEFAULT_PRUNE)
+
+    def __post_init__(self) -> None:
+        """Freeze static paths and validate max_depth.
+
+        Raises:
+            ValueError: If max_depth is negative.
+        """
+        if not callable(self.paths):
+            object.__setattr__(self, "paths", tuple(str(p) for p in self.paths))
+        if self.max_depth is not None and self.max_depth < 0:
+            raise ValueError(f"max_depth must be >= 0, got {self.max_depth}")
+
+    def resolve(self) -> List[str]:
+        """Return the concrete paths to fingerprint, in a stable order."""
+        paths = self.paths() if callable(self.paths) else self.paths
+        return [str(p) for p in paths]
+
+    def fingerprint(self) -> str:
+        """Fingerprint the current state of the inputs."""
+        return fingerprint_tree(self.resolve(), max_depth=self.max_depth, prune=self.prune)
@@ -0,0 +1,255 @@
+"""Cross-process locking for the GAIA task runner.
+
+Two mechanisms keep concurrent runners (two ``--daemon`` processes, or a
+daemon plus a cron-fired ``--once``) from duplicating work:
+
+- a global daemon lock, held for the lifetime of ``run_forever()``;
+- per-task leases, held while a task executes, so a second runner skips
+  tasks another process is already running.
+
+Both are advisory ``fcntl.flock`` locks on files in a lock directory. The
+kernel drops them when the holder exits, so a crashed process never leaves
+a lock behind. Leases additionally record an expiry; a lease whose holder
+is alive but has overrun its expiry (a hung task) is considered stale and
+broken by replacing the lease file. Acquiring and breaking leases happen
+under a short-lived guard lock in the lease directory, so a runner can
+never delete a lease another runner has just taken.
+
+On platforms without ``fcntl`` (Windows) locking is a no-op that always
+succeeds, matching the runner's previous behaviour.
+
+Usage:
+    from runtime.task_lock import FileLock, TaskLeaseManager
+    leases = TaskLeaseManager(Path(".gaia_task_locks"), lease_seconds=3600)
+    if leases.acquire("warden_scan"):
+        try:
+            ...
+        finally:
+            leases.release("warden_scan")
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: advisory locking unavailable
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger("gaia.runtime.task_lock")
+
+#: Lock file in the lease directory serialising lease acquisition and breaking.
+GUARD_FILENAME = ".guard"
+
+
+class FileLock:
+    """Non-blocking exclusive ``flock`` on a file, held until release().
+
+    The file is opened and locked, then checked to still be the file at
+    ``path``. If another process replaced it in between (stale-lease
+    breaking), the lock is on an orphaned inode and acquisition retries.
+
+    Args:
+        path: Lock file; created if missing.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Initialise the lock without acquiring it.
+
+        Args:
+            path: Lock file location.
+        """
+        self.path = Path(path)
+        self._fd: Optional[int] = None
+
+    @property
+    def held(self) -> bool:
+        """True while this object holds the lock."""
+        return self._fd is not None
+
+    def acquire(
+        self, metadata: Optional[Dict[str, object]] = None, blocking: bool = False
+    ) -> bool:
+        """Try to take the lock, by default without blocking.
+
+        Args:
+            metadata: Optional JSON-serialisable holder details written into
+                the lock file once acquired.
+            blocking: Wait for the current holder instead of giving up. Only
+                for locks that are held briefly.
+
+        Returns:
+            True if the lock is now held, False if another process holds it.
+        """
+        if self._fd is not None:
+            return True
+        if fcntl is None:
+            self._fd = -1
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        operation = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        for _ in range(3):
+            fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, operation)
+            except BlockingIOError:
+                os.close(fd)
+                return False
+            try:
+                same_file = os.fstat(fd).st_ino == os.stat(str(self.path)).st_ino
+            except FileNotFoundError:
+                same_file = False
+            if not same_file:
+                os.close(fd)
+                continue
+            if metadata is not None:
+                os.ftruncate(fd, 0)
+                os.write(fd, json.dumps(metadata).encode("utf-8"))
+            self._fd = fd
+            return True
+        return False
+
+    def release(self) -> None:
+        """Release the lock if held. Safe to call more than once."""
+        fd, self._fd = self._fd, None
+        if fd is None or fd < 0:
+            return
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def read_metadata(self) -> Dict[str, object]:
+        """Return the holder details recorded in the lock file, if any."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8") or "{}")
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def __enter__(self) -> "FileLock":
+        if not self.acquire():
+            raise RuntimeError(f"Lock {self.path} is held by another process")
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
+
+
+class TaskLeaseManager:
+    """Per-task leases so only one process runs a given task at a time.
+
+    Args:
+        directory: Lock directory; leases live in ``<directory>/leases``.
+        lease_seconds: How long a lease is honoured before another process
+            may treat it as stale and break it.
+    """
+
+    def __init__(self, directory: Union[str, Path], lease_seconds: float = 3600.0) -> None:
+        """Initialise the manager without touching the filesystem.
+
+        Args:
+            directory: Lock directory.
+            lease_seconds: Default lease duration.
+        """
+        self.directory = Path(directory) / "leases"
+        self.lease_seconds = lease_seconds
+        self._held: Dict[str, FileLock] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, task: str, lease_seconds: Optional[float] = None) -> bool:
+        """Take the lease for ``task`` unless another live holder has it.
+
+        Args:
+            task: Task name.
+            lease_seconds: Override the default lease duration.
+
+        Returns:
+            True if this process now holds the lease.
+        """
+        duration = self.lease_seconds if lease_seconds is None else lease_seconds
+        lock = FileLock(self.directory / f"{task}.lease")
+        metadata = {
+            "task": task,
+            "pid": os.getpid(),
+            "host": socket.gethostname(),
+            "expires_at": time.time() + duration,
+        }
+        guard = FileLock(self.directory / GUARD_FILENAME)
+        with self._lock:
+            if task in self._held:
+                return False
+            guard.acquire(blocking=True)
+            try:
+                acquired = lock.acquire(metadata)
+                if not acquired and self._break_if_stale(lock):
+                    acquired = lock.acquire(metadata)
+            finally:
+                guard.release()
+            if acquired:
+                self._held[task] = lock
+            return acquired
+
+    def release(self, task: str) -> None:
+        """Release the lease for ``task`` if this process holds it.
+
+        Args:
+            task: Task name.
+        """
+        with self._lock:
+            lock = self._held.pop(task, None)
+        if lock is not None:
+            lock.release()
+
+    def holder(self, task: str) -> Dict[str, object]:
+        """Return the recorded holder details for ``task``'s lease."""
+        return FileLock(self.directory / f"{task}.lease").read_metadata()
+
+    @staticmethod
+    def _break_if_stale(lock: FileLock) -> bool:
+        """Replace a lease file whose recorded expiry has passed.
+
+        The current holder keeps its flock on the old inode, but new
+        acquirers lock the fresh file, so the hung holder no longer blocks
+        the task. Must be called with the guard lock held: the expiry is
+        read from the file that is then unlinked, and no other runner can
+        swap in a fresh lease between the two.
+
+        Args:
+            lock: Lease whose acquisition just failed.
+
+        Returns:
+            True if the lease was stale and has been broken.
+        """
+        try:
+            fd = os.open(str(lock.path), os.O_RDONLY)
+        except FileNotFoundError:
+            return True
+        try:
+            if os.fstat(fd).st_ino != os.stat(str(lock.path)).st_ino:
+                return True
+            with os.fdopen(os.dup(fd), "r", encoding="utf-8") as handle:
+                data = json.loads(handle.read() or "{}")
+        except FileNotFoundError:
+            return True
+        except (OSError, ValueError):
+            return False
+        finally:
+            os.close(fd)
+        expires_at = data.get("expires_at") if isinstance(data, dict) else None
+        if not isinstance(expires_at, (int, float)) or expires_at > time.time():
+            return False
+        logger.warning("Breaking stale lease %s (expired %.0fs ago)", lock.path, time.time() - expires_at)
+        try:
+            lock.path.unlink()
+        except FileNotFoundError:
+            pass
+        return True
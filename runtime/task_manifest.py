@@ -0,0 +1,266 @@
+"""Content-hash manifest for incremental file scans (warden_scan).
+
+A scan that inspects every file under a large tree each day mostly re-reads
+files that have not changed. ScanManifest records, for every file, its size,
+mtime and BLAKE2 content hash next to the findings the scanner reported for
+it, and on the next run hands the scanner only the files that changed:
+
+1. The tree is listed with task_walk.walk_files() (one ``stat`` per file).
+2. A file whose size and mtime match the manifest is unchanged; it is not
+   read at all.
+3. Otherwise it is hashed. If the hash still matches (touched, copied back,
+   checked out again) the manifest's stat fields are refreshed and the
+   cached findings reused.
+4. Only files with new content, and files never seen before, are scanned.
+   Their findings replace the cached ones; deleted files drop out. A file
+   that cannot be read or scanned keeps its previous entry, so its last
+   known findings are still reported and it is retried next run.
+
+The manifest also records the scanner's identity (class, version and a
+digest of its rules, see scanner_identity()). When that changes, every
+file is rescanned, because cached findings from other rules would be wrong.
+
+The manifest is a TaskStateStore document, so it is replaced atomically and
+a corrupt file just means one full rescan.
+
+Usage:
+    from runtime.task_manifest import ScanManifest, scanner_identity
+    manifest = ScanManifest(Path(".gaia_warden_manifest.json"))
+    outcome = manifest.update(root, scanner.scan_file, scanner_identity(scanner))
+    outcome["findings"], outcome["rescanned"], outcome["full_rescan"]
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+try:
+    from runtime.task_state import TaskStateStore
+    from runtime.task_walk import DEFAULT_WALK_WORKERS, PruneRules, walk_files
+except ImportError:  # imported as a top-level module with runtime/ on sys.path
+    from task_state import TaskStateStore  # type: ignore[no-redef]
+    from task_walk import DEFAULT_WALK_WORKERS, PruneRules, walk_files  # type: ignore[no-redef]
+
+logger = logging.getLogger("gaia.runtime.task_manifest")
+
+#: Bump when the entry layout changes; part of every scanner identity.
+MANIFEST_FORMAT = 1
+
+#: Bytes read per hashing step.
+HASH_CHUNK_BYTES = 1 << 20
+
+#: Files modified this close to the scan are re-hashed next run, since a
+#: write within the same mtime tick would not change their size or mtime.
+RACY_WINDOW_NS = 2_000_000_000
+
+#: Attributes consulted (in order) for a scanner's version and rule set.
+_VERSION_ATTRS = ("version", "VERSION", "__version__")
+_RULE_ATTRS = ("rules", "RULES", "patterns", "PATTERNS")
+
+ScanFile = Callable[[str], Iterable[Any]]
+
+
+def hash_file(path: Union[str, "os.PathLike[str]"]) -> str:
+    """Return the BLAKE2b hex digest of a file's content.
+
+    Args:
+        path: File to read.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scanner_identity(scanner: Any) -> str:
+    """Digest the parts of a scanner that determine its findings.
+
+    Covers the scanner's class, its version (``version``, ``VERSION`` or
+    ``__version__`` on the instance or its module) and its rule set
+    (``rules`` or ``patterns``), plus MANIFEST_FORMAT.
+
+    Args:
+        scanner: Scanner instance.
+
+    Returns:
+        Hex digest that changes when any of those change.
+    """
+    cls = type(scanner)
+    module = sys.modules.get(cls.__module__)
+    version = next(
+        (
+            getattr(source, attr)
+            for source in (scanner, module)
+            for attr in _VERSION_ATTRS
+            if source is not None and hasattr(source, attr)
+        ),
+        None,
+    )
+    rules = next((getattr(scanner, a) for a in _RULE_ATTRS if hasattr(scanner, a)), None)
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (MANIFEST_FORMAT, f"{cls.__module__}.{cls.__qualname__}", version, rules):
+        digest.update(_stable_repr(part).encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def _stable_repr(value: Any) -> str:
+    """repr() with dict and set items sorted, so equal rule sets hash alike."""
+    if isinstance(value, dict):
+        items = sorted((_stable_repr(k), _stable_repr(v)) for k, v in value.items())
+        return "{" + ", ".join(f"{k}: {v}" for k, v in items) + "}"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(sorted(_stable_repr(v) for v in value)) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_stable_repr(v) for v in value) + "]"
+    pattern = getattr(value, "pattern", None)  # compiled regex: repr may truncate
+    if isinstance(pattern, (str, bytes)):
+        return f"re({pattern!r}, {getattr(value, 'flags', 0)})"
+    return repr(value)
+
+
+def finding_to_dict(finding: Any) -> Dict[str, Any]:
+    """Convert one scanner finding to a JSON-safe dict.
+
+    Dataclasses and plain objects contribute their fields, dicts are
+    copied, anything else is stored as ``{"finding": str(finding)}``.
+    """
+    if dataclasses.is_dataclass(finding) and not isinstance(finding, type):
+        data: Any = dataclasses.asdict(finding)
+    elif isinstance(finding, dict):
+        data = dict(finding)
+    elif hasattr(finding, "__dict__"):
+        data = dict(vars(finding))
+    else:
+        data = {"finding": str(finding)}
+    return json.loads(json.dumps(data, default=str))
+
+
+class ScanManifest:
+    """Per-file size, mtime, hash and findings of the previous scan.
+
+    Args:
+        path: Manifest file (JSON, replaced atomically).
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Initialise the manifest without touching the filesystem.
+
+        Args:
+            path: Manifest file.
+        """
+        self.path = Path(path)
+        self._store = TaskStateStore(self.path)
+
+    def update(
+        self,
+        root: Union[str, "os.PathLike[str]"],
+        scan_file: ScanFile,
+        identity: str,
+        prune: PruneRules = PruneRules(),
+        max_workers: int = DEFAULT_WALK_WORKERS,
+        ignore: Iterable[str] = (),
+    ) -> Dict[str, Any]:
+        """Scan what changed under ``root`` and persist the new manifest.
+
+        Args:
+            root: Tree to scan (the manifest file itself is skipped).
+            scan_file: Called with one file path; returns that file's
+                findings. A call that raises is logged; the file keeps its
+                previous entry (or none, if it is new) and is retried next
+                run.
+            identity: scanner_identity() of the scanner behind scan_file.
+            prune: Subtrees not scanned.
+            max_workers: Top-level subtrees listed concurrently.
+            ignore: ``fnmatch`` patterns on file names that are neither
+                scanned nor recorded, e.g. state files rewritten on every
+                run.
+
+        Returns:
+            ``findings`` (path to list of finding dicts, for files with
+            findings), ``files`` in the tree, ``rescanned``, ``hashed``
+            (files whose stat changed), ``errors``, ``removed`` (files
+            gone since the last run) and ``full_rescan``.
+        """
+        saved = self._store.load()
+        header = saved.get("scanner", {})
+        full_rescan = header.get("identity") != identity
+        previous: Dict[str, Dict[str, Any]] = {} if full_rescan else saved.get("files", {})
+        entries: Dict[str, Dict[str, Any]] = {}
+        seen = set()
+        rescanned = hashed = errors = 0
+        racy_after = time.time_ns() - RACY_WINDOW_NS
+
+        own_file = os.path.abspath(self.path)
+        patterns: Tuple[str, ...] = tuple(ignore)
+        for path, st in walk_files(root, prune=prune, max_workers=max_workers):
+            if os.path.abspath(path) == own_file:
+                continue
+            name = os.path.basename(path)
+            if any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+                continue
+            seen.add(path)
+            entry = previous.get(path)
+            if (
+                entry is not None
+                and entry.get("size") == st.st_size
+                and entry.get("mtime_ns") == st.st_mtime_ns
+            ):
+                entries[path] = entry
+                continue
+            try:
+                content_hash = hash_file(path)
+            except OSError as exc:
+                logger.warning("Could not hash %s: %s", path, exc)
+                errors += 1
+                if entry is not None:
+                    entries[path] = entry
+                continue
+            hashed += 1
+            if entry is not None and entry.get("blake2") == content_hash:
+                findings = entry.get("findings", [])
+            else:
+                try:
+                    findings = [finding_to_dict(f) for f in scan_file(path) or ()]
+                except Exception as exc:  # noqa: BLE001 - one bad file must not stop the scan
+                    logger.warning("Scanner failed on %s: %s", path, exc)
+                    errors += 1
+                    if entry is not None:
+                        entries[path] = entry
+                    continue
+                rescanned += 1
+            entries[path] = {
+                "size": st.st_size,
+                "mtime_ns": None if st.st_mtime_ns >= racy_after else st.st_mtime_ns,
+                "blake2": content_hash,
+                "findings": findings,
+            }
+
+        removed = sum(1 for path in previous if path not in seen)
+        self._store.save({"scanner": {"identity": identity}, "files": entries})
+        return {
+            "findings": {path: e["findings"] for path, e in entries.items() if e["findings"]},
+            "files": len(entries),
+            "rescanned": rescanned,
+            "hashed": hashed,
+            "errors": errors,
+            "removed": removed,
+            "full_rescan": full_rescan,
+        }
+
+
+def count_findings(findings: Dict[str, List[Dict[str, Any]]]) -> int:
+    """Return the total number of findings across files."""
+    return sum(len(items) for items in findings.values())
@@ -0,0 +1,302 @@
+"""Execution metrics for the GAIA task runner.
+
+Keeps per-task rolling windows of wall time, CPU time and peak-RSS delta in
+bounded memory (a fixed-size deque per series), plus lifetime counters, and
+renders them as a JSON-ready snapshot or Prometheus text exposition. The
+queueing delay of each priority lane is tracked the same way, and memoized
+tasks get result-cache hit/miss counters.
+
+Usage:
+    from runtime.task_metrics import TaskMetrics, start_metrics_server
+    metrics = TaskMetrics(window=512)
+    metrics.observe("health_check", "success", wall_seconds=0.8, cpu_seconds=0.1)
+    metrics.snapshot()["health_check"]["wall_seconds"]["p95"]
+    metrics.observe_queue("critical", 0.002)
+    metrics.lane_snapshot()["critical"]["p99"]
+    metrics.observe_cache("health_check", hit=True)
+    metrics.cache_snapshot()["health_check"]["hit_rate"]
+    server = start_metrics_server(metrics, port=9464)  # /metrics and /stats
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional
+
+logger = logging.getLogger("gaia.runtime.task_metrics")
+
+#: Series tracked per task, in snapshot and exposition order.
+SERIES = ("wall_seconds", "cpu_seconds", "rss_delta_kb")
+
+#: Percentiles reported for every series.
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Return the nearest-rank percentile of an ascending list.
+
+    Args:
+        sorted_values: Non-empty list sorted ascending.
+        q: Quantile in [0, 1].
+
+    Returns:
+        The smallest value with at least ``q`` of the samples at or below it.
+    """
+    rank = max(1, math.ceil(q * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class _TaskSeries:
+    """Rolling samples and lifetime counters for one task."""
+
+    def __init__(self, window: int) -> None:
+        self.samples: Dict[str, Deque[float]] = {name: deque(maxlen=window) for name in SERIES}
+        self.runs = 0
+        self.statuses: Dict[str, int] = {}
+        self.wall_total = 0.0
+        self.last_wall: Optional[float] = None
+
+
+class TaskMetrics:
+    """Thread-safe rolling latency/resource histograms per task.
+
+    Args:
+        window: Number of most recent samples kept per task and series.
+            Memory use is O(tasks * window) regardless of daemon uptime.
+    """
+
+    def __init__(self, window: int = 256) -> None:
+        """Initialise an empty metrics registry.
+
+        Args:
+            window: Samples retained per series.
+
+        Raises:
+            ValueError: If window is less than 1.
+        """
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        self._window = window
+        self._series: Dict[str, _TaskSeries] = {}
+        self._queues: Dict[str, Deque[float]] = {}
+        self._cache: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def observe(
+        self,
+        task: str,
+        status: str,
+        wall_seconds: float,
+        cpu_seconds: Optional[float] = None,
+        rss_delta_kb: Optional[float] = None,
+    ) -> None:
+        """Record one execution.
+
+        Args:
+            task: Task name.
+            status: Result status (``"success"``, ``"error"``, ...).
+            wall_seconds: Elapsed wall-clock time.
+            cpu_seconds: CPU time consumed, or None when not measurable.
+            rss_delta_kb: Growth of the process peak RSS, or None when not
+                measurable on this platform or when other tasks ran
+                concurrently.
+        """
+        values = {
+            "wall_seconds": wall_seconds,
+            "cpu_seconds": cpu_seconds,
+            "rss_delta_kb": rss_delta_kb,
+        }
+        with self._lock:
+            series = self._series.get(task)
+            if series is None:
+                series = self._series[task] = _TaskSeries(self._window)
+            series.runs += 1
+            series.statuses[status] = series.statuses.get(status, 0) + 1
+            series.wall_total += wall_seconds
+            series.last_wall = wall_seconds
+            for name, value in values.items():
+                if value is not None:
+                    series.samples[name].append(float(value))
+
+    def observe_queue(self, lane: str, seconds: float) -> None:
+        """Record how long a task waited for a worker in its lane.
+
+        Args:
+            lane: Priority lane name.
+            seconds: Time between becoming ready and starting.
+        """
+        with self._lock:
+            samples = self._queues.get(lane)
+            if samples is None:
+                samples = self._queues[lane] = deque(maxlen=self._window)
+            samples.append(float(seconds))
+
+    def lane_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return queueing-delay summaries per lane.
+
+        Returns:
+            Dict mapping lane name to ``{"count", "p50", "p95", "p99",
+            "max"}`` over the window, in seconds.
+        """
+        with self._lock:
+            return {lane: _summarise(list(samples)) for lane, samples in self._queues.items()}
+
+    def observe_cache(self, task: str, hit: bool) -> None:
+        """Count one result-cache lookup for a memoized task.
+
+        Args:
+            task: Task name.
+            hit: True if the cached result was served instead of running.
+        """
+        with self._lock:
+            counts = self._cache.setdefault(task, {"hits": 0, "misses": 0})
+            counts["hits" if hit else "misses"] += 1
+
+    def cache_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return lifetime result-cache counters per memoized task.
+
+        Returns:
+            Dict mapping task name to ``hits``, ``misses`` and
+            ``hit_rate`` (hits over lookups).
+        """
+        with self._lock:
+            return {
+                task: {**counts, "hit_rate": counts["hits"] / (counts["hits"] + counts["misses"])}
+                for task, counts in self._cache.items()
+            }
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return a JSON-serialisable view of all task metrics.
+
+        Returns:
+            Dict mapping task name to ``runs``, ``statuses``,
+            ``mean_wall_seconds``, ``last_wall_seconds`` and, per series,
+            ``{"count", "p50", "p95", "p99", "max"}`` over the window.
+        """
+        with self._lock:
+            out: Dict[str, Dict[str, Any]] = {}
+            for task, series in self._series.items():
+                entry: Dict[str, Any] = {
+                    "runs": series.runs,
+                    "statuses": dict(series.statuses),
+                    "mean_wall_seconds": series.wall_total / series.runs,
+                    "last_wall_seconds": series.last_wall,
+                }
+                for name in SERIES:
+                    entry[name] = _summarise(list(series.samples[name]))
+                out[task] = entry
+            return out
+
+    def to_prometheus(self) -> str:
+        """Render the snapshot in Prometheus text exposition format.
+
+        Windowed percentiles are exported as summaries, lifetime run counts
+        as counters labelled by status.
+
+        Returns:
+            Exposition text ending in a newline.
+        """
+        snap = self.snapshot()
+        lines = [
+            "# HELP gaia_task_runs_total Task executions by final status.",
+            "# TYPE gaia_task_runs_total counter",
+        ]
+        for task, entry in snap.items():
+            for status, count in entry["statuses"].items():
+                lines.append(
+                    f'gaia_task_runs_total{{task="{_escape(task)}",status="{_escape(status)}"}} {count}'
+                )
+        for name in SERIES:
+            metric = f"gaia_task_{name}"
+            lines.append(f"# HELP {metric} Rolling-window {name.replace('_', ' ')} per run.")
+            lines.append(f"# TYPE {metric} summary")
+            for task, entry in snap.items():
+                summary = entry[name]
+                if not summary["count"]:
+                    continue
+                label = _escape(task)
+                for q in QUANTILES:
+                    key = f"p{round(q * 100)}"
+                    lines.append(f'{metric}{{task="{label}",quantile="{q}"}} {summary[key]}')
+                lines.append(f'{metric}_count{{task="{label}"}} {summary["count"]}')
+        cache = self.cache_snapshot()
+        for kind in ("hits", "misses") if cache else ():
+            lines.append(f"# HELP gaia_task_cache_{kind}_total Memoized result lookups ({kind}).")
+            lines.append(f"# TYPE gaia_task_cache_{kind}_total counter")
+            for task, counts in cache.items():
+                lines.append(f'gaia_task_cache_{kind}_total{{task="{_escape(task)}"}} {counts[kind]}')
+        lanes = self.lane_snapshot()
+        if lanes:
+            lines.append("# HELP gaia_lane_queue_seconds Rolling-window wait for a worker per lane.")
+            lines.append("# TYPE gaia_lane_queue_seconds summary")
+            for lane, summary in lanes.items():
+                label = _escape(lane)
+                for q in QUANTILES:
+                    key = f"p{round(q * 100)}"
+                    lines.append(f'gaia_lane_queue_seconds{{lane="{label}",quantile="{q}"}} {summary[key]}')
+                lines.append(f'gaia_lane_queue_seconds_count{{lane="{label}"}} {summary["count"]}')
+        return "\n".join(lines) + "\n"
+
+
+def _summarise(values: List[float]) -> Dict[str, Any]:
+    """Compute count, percentiles and max for one window of samples."""
+    if not values:
+        return {"count": 0, "p50": None, "p95": None, "p99": None, "max": None}
+    values.sort()
+    summary: Dict[str, Any] = {"count": len(values)}
+    for q in QUANTILES:
+        summary[f"p{round(q * 100)}"] = percentile(values, q)
+    summary["max"] = values[-1]
+    return summary
+
+
+def _escape(label: str) -> str:
+    """Escape a Prometheus label value."""
+    return label.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def start_metrics_server(
+    metrics: TaskMetrics, port: int, host: str = "127.0.0.1"
+) -> ThreadingHTTPServer:
+    """Serve ``/metrics`` (Prometheus text) and ``/stats`` (JSON) in a thread.
+
+    Args:
+        metrics: Registry to expose.
+        port: TCP port to bind; 0 picks a free port.
+        host: Interface to bind. Defaults to loopback only.
+
+    Returns:
+        The running server; call ``shutdown()`` to stop it.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            path = self.path.split("?", 1)[0]
+            if path == "/metrics":
+                body = metrics.to_prometheus().encode("utf-8")
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            elif path == "/stats":
+                body = json.dumps(metrics.snapshot(), indent=2).encode("utf-8")
+                content_type = "application/json"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            logger.debug("metrics %s - %s", self.address_string(), format % args)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    thread = threading.Thread(target=server.serve_forever, name="gaia-metrics", daemon=True)
+    thread.start()
+    logger.info("Serving task metrics on http://%s:%d/metrics", host, server.server_address[1])
+    return server
@@ -0,0 +1,331 @@
+"""Project probes for the GAIA health check.
+
+The health check asks four questions of every project in ``registry.json``:
+does the folder exist, and does it contain ``.git``, ``CLAUDE.md`` and at
+least one ``tests/test_*.py``. probe_project() answers them with a single
+``os.scandir`` of the project root (plus one of ``tests/`` that stops at the
+first matching file) instead of a separate ``stat`` per question and a
+fully materialised glob.
+
+probe_projects() runs the probes concurrently, because registered projects
+often live on slow network mounts. At most ``max_workers`` probes are in
+flight and each gets ``timeout`` seconds. A probe that overruns is reported
+as timed out and its slot handed to the next project; the stuck thread is
+abandoned (threads blocked in a filesystem call cannot be cancelled), so a
+hung mount delays only its own project. Abandoned threads are remembered
+per path: while one is still alive, later calls report that path as hung
+straight away instead of starting another thread, so a mount that stays
+hung across many health checks holds at most one thread.
+
+probe_projects_cached() makes repeated checks incremental: each project's
+fingerprint (mtimes of its root and ``tests/`` folders plus the commit its
+``.git`` HEAD points at) is compared with the one stored alongside its last
+result, and only projects whose fingerprint changed are scanned again.
+Adding or removing ``.git``, ``CLAUDE.md`` or a test file changes a folder
+mtime, so unchanged fingerprints imply unchanged results.
+
+Usage:
+    from runtime.task_probe import probe_project, probe_projects
+    probe_project("/srv/products/atlas")
+    probe_projects({"atlas": "/srv/products/atlas"}, max_workers=8, timeout=10)
+    results, cache, hits = probe_projects_cached(projects, cache)
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Mapping, Optional, Tuple, Union
+
+logger = logging.getLogger("gaia.runtime.task_probe")
+
+#: Default number of projects probed at the same time.
+DEFAULT_PROBE_WORKERS = 8
+
+#: Default per-project probe deadline, in seconds.
+DEFAULT_PROBE_TIMEOUT_SECONDS = 10.0
+
+#: File-name pattern counted by ``has_tests`` (inside ``tests/``).
+TEST_FILE_PATTERN = "test_*.py"
+
+Probe = Callable[[str], Dict[str, Any]]
+
+# Timed-out probe threads that may still be blocked, by project path. A
+# thread removes its own entry when its call finally returns.
+_abandoned: Dict[str, threading.Thread] = {}
+_abandoned_lock = threading.Lock()
+
+
+def probe_project(path: Union[str, "os.PathLike[str]"]) -> Dict[str, Any]:
+    """Report whether a project folder exists and has git, tests and CLAUDE.md.
+
+    Args:
+        path: Project folder.
+
+    Returns:
+        ``exists``, ``has_git``, ``has_tests`` and ``has_claude_md``
+        booleans. A path that exists but is not a listable directory
+        reports ``exists: True`` and False for the rest.
+    """
+    health = {"exists": False, "has_git": False, "has_tests": False, "has_claude_md": False}
+    root = os.fspath(path) or "."
+    try:
+        with os.scandir(root) as it:
+            names = {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        return health
+    except OSError:
+        health["exists"] = os.path.exists(root)
+        return health
+    health["exists"] = True
+    health["has_git"] = ".git" in names
+    health["has_claude_md"] = "CLAUDE.md" in names
+    tests = names.get("tests")
+    if tests is not None and tests.is_dir():
+        health["has_tests"] = _has_test_file(tests.path)
+    return health
+
+
+def _has_test_file(directory: str) -> bool:
+    """Return True as soon as one entry of ``directory`` matches the pattern."""
+    try:
+        with os.scandir(directory) as it:
+            return any(fnmatch.fnmatch(entry.name, TEST_FILE_PATTERN) for entry in it)
+    except OSError:
+        return False
+
+
+def probe_projects(
+    projects: Mapping[str, Union[str, "os.PathLike[str]"]],
+    max_workers: int = DEFAULT_PROBE_WORKERS,
+    timeout: float = DEFAULT_PROBE_TIMEOUT_SECONDS,
+    probe: Probe = probe_project,
+) -> Dict[str, Dict[str, Any]]:
+    """Probe many projects concurrently with a per-project deadline.
+
+    Args:
+        projects: Project key to folder, in report order.
+        max_workers: Probes in flight at once.
+        timeout: Seconds each probe may take once started.
+        probe: Probe function (probe_project by default).
+
+    Returns:
+        Project key to probe result, in the order of ``projects``. Probes
+        that overran, and paths whose previously timed-out probe is still
+        running, get every flag False plus an ``"error"`` message; probes
+        that raised get the flags False plus the exception text.
+
+    Raises:
+        ValueError: If max_workers < 1 or timeout <= 0.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+    if timeout <= 0:
+        raise ValueError(f"timeout must be > 0, got {timeout}")
+    pending: Deque[Tuple[str, str]] = deque(
+        (key, os.fspath(path)) for key, path in projects.items()
+    )
+    running: Dict[str, Tuple[float, str, threading.Thread]] = {}
+    finished: "queue.Queue[Tuple[str, Dict[str, Any]]]" = queue.Queue()
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def run(key: str, path: str) -> None:
+        try:
+            result = probe(path)
+        except Exception as exc:  # noqa: BLE001
+            result = _failed(f"probe failed: {exc}")
+        finally:
+            with _abandoned_lock:
+                if _abandoned.get(path) is threading.current_thread():
+                    del _abandoned[path]
+        finished.put((key, result))
+
+    while pending or running:
+        while pending and len(running) < max_workers:
+            key, path = pending.popleft()
+            with _abandoned_lock:
+                hung = _abandoned.get(path)
+            if hung is not None and hung.is_alive():
+                logger.debug("Health probe of %s skipped: previous probe still running", key)
+                results[key] = _failed("previous probe still running after timing out")
+                continue
+            thread = threading.Thread(
+                target=run, args=(key, path), name=f"gaia-probe-{key}", daemon=True
+            )
+            running[key] = (time.monotonic() + timeout, path, thread)
+            thread.start()
+        if not running:
+            break
+        wait = max(0.0, min(deadline for deadline, _, _ in running.values()) - time.monotonic())
+        try:
+            key, result = finished.get(timeout=wait)
+        except queue.Empty:
+            pass
+        else:
+            if running.pop(key, None) is not None:
+                results[key] = result
+        now = time.monotonic()
+        for key in [k for k, (deadline, _, _) in running.items() if deadline <= now]:
+            _, path, thread = running.pop(key)
+            with _abandoned_lock:
+                if thread.is_alive():
+                    _abandoned[path] = thread
+            logger.warning("Health probe of %s timed out after %.1fs", key, timeout)
+            results[key] = _failed(f"probe timed out after {timeout:g}s")
+    return {key: results[key] for key in projects}
+
+
+def probe_projects_cached(
+    projects: Mapping[str, Union[str, "os.PathLike[str]"]],
+    cache: Mapping[str, Dict[str, Any]],
+    max_workers: int = DEFAULT_PROBE_WORKERS,
+    timeout: float = DEFAULT_PROBE_TIMEOUT_SECONDS,
+    probe: Probe = probe_project,
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]], int]:
+    """Probe only projects whose fingerprint differs from the cached one.
+
+    Fingerprinting runs inside the same bounded, time-limited pool as the
+    probes, so a hung mount is still reported as timed out.
+
+    Args:
+        projects: Project key to folder, in report order.
+        cache: Entries returned by a previous call (``path``,
+            ``fingerprint`` and ``health`` per project key).
+        max_workers: Projects handled at once.
+        timeout: Seconds each project may take.
+        probe: Probe function (probe_project by default).
+
+    Returns:
+        ``(results, cache, hits)``: results as from probe_projects(), the
+        cache entries to persist (projects that timed out or failed are
+        left out so they are retried), and how many results were served
+        from the cache.
+    """
+    previous = {
+        os.fspath(projects[key]): entry
+        for key, entry in cache.items()
+        if key in projects and entry.get("path") == os.fspath(projects[key])
+    }
+
+    def cached_probe(path: str) -> Dict[str, Any]:
+        fingerprint = project_fingerprint(path)
+        entry = previous.get(path)
+        if entry is not None and entry.get("fingerprint") == fingerprint:
+            return {"health": entry["health"], "fingerprint": fingerprint, "cached": True}
+        return {"health": probe(path), "fingerprint": fingerprint, "cached": False}
+
+    outcomes = probe_projects(
+        projects, max_workers=max_workers, timeout=timeout, probe=cached_probe
+    )
+    results: Dict[str, Dict[str, Any]] = {}
+    entries: Dict[str, Dict[str, Any]] = {}
+    hits = 0
+    for key, outcome in outcomes.items():
+        if "health" not in outcome:
+            results[key] = outcome
+            continue
+        results[key] = outcome["health"]
+        hits += outcome["cached"]
+        entries[key] = {
+            "path": os.fspath(projects[key]),
+            "fingerprint": outcome["fingerprint"],
+            "health": outcome["health"],
+        }
+    return results, entries, hits
+
+
+def project_fingerprint(path: Union[str, "os.PathLike[str]"]) -> Dict[str, Any]:
+    """Return the cheap signals that change whenever a probe result can.
+
+    Args:
+        path: Project folder.
+
+    Returns:
+        ``root_mtime_ns`` and ``tests_mtime_ns`` (None when missing) and
+        ``head`` from git_head().
+    """
+    root = os.fspath(path) or "."
+    return {
+        "root_mtime_ns": _mtime_ns(root),
+        "tests_mtime_ns": _mtime_ns(os.path.join(root, "tests")),
+        "head": git_head(root),
+    }
+
+
+def git_head(path: Union[str, "os.PathLike[str]"]) -> Optional[str]:
+    """Resolve what a project's ``.git`` HEAD points at without running git.
+
+    Follows ``gitdir:`` files (worktrees, submodules), loose refs and
+    ``packed-refs``.
+
+    Args:
+        path: Project folder.
+
+    Returns:
+        ``"<ref> <sha>"`` for a branch, the bare sha for a detached HEAD,
+        the ref alone for an unborn branch, or None without a readable
+        ``.git``.
+    """
+    git_dir = os.path.join(os.fspath(path) or ".", ".git")
+    try:
+        if os.path.isfile(git_dir):
+            pointer = _read_text(git_dir)
+            if not pointer.startswith("gitdir:"):
+                return None
+            git_dir = os.path.join(os.path.dirname(git_dir), pointer[len("gitdir:") :].strip())
+        head = _read_text(os.path.join(git_dir, "HEAD"))
+    except OSError:
+        return None
+    if not head.startswith("ref:"):
+        return head or None
+    ref = head[len("ref:") :].strip()
+    search = [git_dir]
+    try:
+        search.append(os.path.join(git_dir, _read_text(os.path.join(git_dir, "commondir"))))
+    except OSError:
+        pass
+    for directory in search:
+        try:
+            return f"{ref} {_read_text(os.path.join(directory, ref))}"
+        except OSError:
+            pass
+    for directory in search:
+        try:
+            with open(os.path.join(directory, "packed-refs"), encoding="utf-8") as fh:
+                for line in fh:
+                    sha, _, name = line.strip().partition(" ")
+                    if name == ref:
+                        return f"{ref} {sha}"
+        except OSError:
+            pass
+    return ref
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    """Return a path's mtime in nanoseconds, or None if it cannot be stat'ed."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_text(path: str) -> str:
+    """Return a small text file's stripped content."""
+    with open(path, encoding="utf-8") as fh:
+        return fh.read().strip()
+
+
+def _failed(message: str) -> Dict[str, Any]:
+    """Result for a project whose probe did not complete."""
+    return {
+        "exists": False,
+        "has_git": False,
+        "has_tests": False,
+        "has_claude_md": False,
+        "error": message,
+    }
@@ -0,0 +1,243 @@
+"""Bytecode cache eviction policy for the GAIA stale_cache_cleanup task.
+
+Three rules decide which ``__pycache__/*.pyc`` files are removed, applied in
+this order:
+
+- ``orphan``: the PEP 3147 name ``name.cpython-311[.opt-N].pyc`` maps back
+  to ``../name.py`` and that source no longer exists. Python never reads
+  such files again.
+- ``stale``: the ``__pycache__`` directory itself has not changed for
+  ``max_age_seconds`` (the task's original 24 h rule).
+- ``budget``: whatever survives the first two rules is trimmed, least
+  recently used first, until the total is within ``max_total_bytes``.
+  "Used" is the later of atime and mtime, so the order stays meaningful on
+  ``noatime``/``relatime`` mounts. Runners that build many interpreter
+  versions accumulate one copy per version, and this rule bounds them.
+
+Every run produces the same report whether or not anything is deleted, so
+a dry run shows exactly what a real run would reclaim and why.
+
+Usage:
+    from runtime.task_pycache import BytecodePolicy, evict_bytecode, scan_bytecode
+    files = scan_bytecode(["src/pkg/__pycache__"])
+    report = evict_bytecode(files, BytecodePolicy(max_total_bytes=256 << 20), dry_run=True)
+    report["bytes_reclaimed"], report["by_reason"]["orphan"]
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("gaia.runtime.task_pycache")
+
+#: Eviction reasons, in the order the rules are applied.
+EVICTION_REASONS = ("orphan", "stale", "budget")
+
+#: Individual evictions listed in a report (the totals are always exact).
+MAX_REPORTED_EVICTIONS = 50
+
+#: ``<module>.<cache tag>[.opt-<level>].pyc`` as written by importlib.
+_PYC_NAME = re.compile(r"^(?P<module>.+?)\.(?P<tag>[A-Za-z]+-?\d+)(?:\.opt-\w+)?\.pyc$")
+
+
+@dataclass(frozen=True)
+class BytecodePolicy:
+    """Which cached bytecode files stale_cache_cleanup removes.
+
+    Attributes:
+        max_age_seconds: Remove every ``.pyc`` in a ``__pycache__`` folder
+            unchanged for this long, or None to keep them.
+        remove_orphans: Remove ``.pyc`` files whose source is gone.
+        max_total_bytes: Trim the remaining files, least recently used
+            first, to this total size, or None for no budget.
+    """
+
+    max_age_seconds: Optional[float] = 86400.0
+    remove_orphans: bool = True
+    max_total_bytes: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        """Validate the limits.
+
+        Raises:
+            ValueError: If max_age_seconds is not positive or
+                max_total_bytes is negative.
+        """
+        if self.max_age_seconds is not None and self.max_age_seconds <= 0:
+            raise ValueError(f"max_age_seconds must be > 0, got {self.max_age_seconds}")
+        if self.max_total_bytes is not None and self.max_total_bytes < 0:
+            raise ValueError(f"max_total_bytes must be >= 0, got {self.max_total_bytes}")
+
+
+@dataclass(frozen=True)
+class CachedBytecode:
+    """One ``.pyc`` file found in a ``__pycache__`` folder.
+
+    Attributes:
+        path: The ``.pyc`` file.
+        source: The ``.py`` it was compiled from, or None when the name
+            is not in PEP 3147 form.
+        size: Size in bytes.
+        last_used: Later of the file's atime and mtime (epoch seconds).
+        cache_dir_mtime: mtime of the containing ``__pycache__`` folder.
+        orphan: True if ``source`` does not exist.
+    """
+
+    path: str
+    source: Optional[str]
+    size: int
+    last_used: float
+    cache_dir_mtime: float
+    orphan: bool
+
+
+def source_name(pyc_name: str) -> Optional[str]:
+    """Map a PEP 3147 bytecode file name to its source file name.
+
+    Args:
+        pyc_name: E.g. ``"util.cpython-311.opt-1.pyc"``.
+
+    Returns:
+        E.g. ``"util.py"``, or None if the name has no interpreter tag.
+    """
+    match = _PYC_NAME.match(pyc_name)
+    return f"{match.group('module')}.py" if match else None
+
+
+def scan_bytecode(cache_dirs: Iterable[str]) -> List[CachedBytecode]:
+    """List the ``.pyc`` files in ``__pycache__`` folders.
+
+    Each folder and its parent are listed once; sources are looked up in
+    the parent's listing rather than stat'ed one by one. Folders that
+    vanish or cannot be read are skipped.
+
+    Args:
+        cache_dirs: ``__pycache__`` directory paths.
+
+    Returns:
+        One entry per ``.pyc`` file.
+    """
+    files: List[CachedBytecode] = []
+    for cache_dir in cache_dirs:
+        parent = os.path.dirname(os.path.abspath(cache_dir))
+        try:
+            dir_mtime = os.stat(cache_dir).st_mtime
+            with os.scandir(cache_dir) as it:
+                entries = [e for e in it if e.name.endswith(".pyc") and e.is_file()]
+            with os.scandir(parent) as it:
+                siblings = {e.name for e in it}
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            source = source_name(entry.name)
+            files.append(
+                CachedBytecode(
+                    path=entry.path,
+                    source=os.path.join(parent, source) if source else None,
+                    size=st.st_size,
+                    last_used=max(st.st_atime, st.st_mtime),
+                    cache_dir_mtime=dir_mtime,
+                    orphan=source is not None and source not in siblings,
+                )
+            )
+    return files
+
+
+def plan_eviction(
+    files: Iterable[CachedBytecode],
+    policy: BytecodePolicy,
+    now: Optional[float] = None,
+) -> List[Tuple[CachedBytecode, str]]:
+    """Decide which files to remove and why.
+
+    Args:
+        files: Candidates from scan_bytecode().
+        policy: Rules to apply.
+        now: Current epoch time (defaults to ``time.time()``).
+
+    Returns:
+        ``(file, reason)`` pairs, reasons from EVICTION_REASONS; budget
+        evictions come last, least recently used first.
+    """
+    now = time.time() if now is None else now
+    cutoff = None if policy.max_age_seconds is None else now - policy.max_age_seconds
+    plan: List[Tuple[CachedBytecode, str]] = []
+    kept: List[CachedBytecode] = []
+    for pyc in files:
+        if policy.remove_orphans and pyc.orphan:
+            plan.append((pyc, "orphan"))
+        elif cutoff is not None and pyc.cache_dir_mtime < cutoff:
+            plan.append((pyc, "stale"))
+        else:
+            kept.append(pyc)
+    if policy.max_total_bytes is not None:
+        excess = sum(pyc.size for pyc in kept) - policy.max_total_bytes
+        for pyc in sorted(kept, key=lambda p: (p.last_used, p.path)):
+            if excess <= 0:
+                break
+            plan.append((pyc, "budget"))
+            excess -= pyc.size
+    return plan
+
+
+def evict_bytecode(
+    files: List[CachedBytecode],
+    policy: BytecodePolicy,
+    dry_run: bool = False,
+    now: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Apply ``policy`` to ``files`` and report what was (or would be) removed.
+
+    Args:
+        files: Candidates from scan_bytecode().
+        policy: Rules to apply.
+        dry_run: Report the plan without deleting anything.
+        now: Current epoch time (defaults to ``time.time()``).
+
+    Returns:
+        Report with ``dry_run``, ``files`` and ``total_bytes`` scanned,
+        ``removed`` and ``bytes_reclaimed``, ``remaining_bytes``,
+        ``budget_bytes``, ``by_reason`` (files and bytes per reason),
+        ``errors`` (deletions that failed) and up to
+        MAX_REPORTED_EVICTIONS ``evictions`` (path, reason, size).
+    """
+    by_reason = {reason: {"files": 0, "bytes": 0} for reason in EVICTION_REASONS}
+    evictions: List[Dict[str, Any]] = []
+    errors = 0
+    for pyc, reason in plan_eviction(files, policy, now):
+        if not dry_run:
+            try:
+                os.unlink(pyc.path)
+            except FileNotFoundError:
+                continue
+            except OSError as exc:
+                logger.warning("Could not remove %s: %s", pyc.path, exc)
+                errors += 1
+                continue
+        by_reason[reason]["files"] += 1
+        by_reason[reason]["bytes"] += pyc.size
+        if len(evictions) < MAX_REPORTED_EVICTIONS:
+            evictions.append({"path": pyc.path, "reason": reason, "size": pyc.size})
+    total = sum(pyc.size for pyc in files)
+    reclaimed = sum(counts["bytes"] for counts in by_reason.values())
+    return {
+        "dry_run": dry_run,
+        "files": len(files),
+        "total_bytes": total,
+        "removed": sum(counts["files"] for counts in by_reason.values()),
+        "bytes_reclaimed": reclaimed,
+        "remaining_bytes": total - reclaimed,
+        "budget_bytes": policy.max_total_bytes,
+        "by_reason": by_reason,
+        "errors": errors,
+        "evictions": evictions,
+    }
@@ -2,40 +2,346 @@
 
 Lightweight scheduler with task registry. No external deps.
 Supports: run_once (execute all due tasks), run_all (force all), list tasks.
+Due tasks run serially by default; pass ``max_workers > 1`` to run them
+concurrently on a bounded thread pool. CPU-bound tasks registered with
+``executor="process"`` are dispatched to a process pool instead, so they
+do not contend for the GIL.
 
 Usage (class-based):
     from runtime.task_runner import TaskRunner
     runner = TaskRunner()
     runner.register("my_task", my_fn, interval_seconds=3600)
+    runner.register("nightly", scan_fn, schedule="0 3 * * *")  # cron, local time
+    runner.register("poll", poll_fn, interval_seconds=60, misfire="skip", grace_seconds=30)
+
+    # Back off from 15 min towards 4 h while registry.json is unchanged
+    watch = AdaptiveInterval(watch=("registry.json",), max_interval_seconds=4 * 3600)
+    runner.register("sync", sync_fn, interval_seconds=900, adaptive=watch)
+
+    # Re-serve the last result (cached: True) while the input tree is unchanged
+    runner.register("index", index_fn, interval_seconds=600, inputs=["docs/"])
+    runner.get_cache_stats()["index"]["hit_rate"]
+
+    # React to edits instead of re-walking: fn(changed_paths) runs ~2 s after
+    # the last matching change (inotify on Linux, polling elsewhere)
+    runner.register("lint", lint_fn, interval_seconds=86400,
+                    events=EventTrigger(["runtime/**/*.py"], debounce_seconds=2))
+
+    # Defer "bulk" tasks after a cycle that overran its wall-time budget
+    runner = TaskRunner(cycle_budget_seconds=300)
+    runner.register("reindex", reindex_fn, interval_seconds=900, priority="bulk")
     runner.run_once()   # execute tasks whose interval has elapsed
     runner.run_all()    # force-execute every task
     runner.list_tasks() # returns list[ScheduledTask]
     runner.get_results() # returns last execution results
+    runner.run_forever() # sleep until the next task is due; stop() to exit
+
+    # Persist last_run / enabled / last result across restarts
+    runner = TaskRunner(state_path=".gaia_task_state.json")
+    runner.get_stats()   # rolling p50/p95/p99 wall, CPU and RSS per task
+
+    # Append every result to a retention-bounded SQLite history
+    runner = TaskRunner(history_path=".gaia_task_history.db")
+    runner.history.summary("health_check", since_seconds=7 * 86400)
+
+    # Coordinate with other runner processes through fcntl locks
+    runner = TaskRunner(lock_dir=".gaia_task_locks")
+    runner.run_forever()  # raises RunnerLockedError if another daemon runs
+
+    # Queue an out-of-schedule run, or hold the scheduler (e.g. from ctl)
+    runner.trigger("health_check")
+    runner.pause(); runner.resume()
+
+    # Concurrent mode: up to 4 tasks at once, "slow" never overlaps others
+    runner = TaskRunner(max_workers=4)
+    runner.register("slow", slow_fn, interval_seconds=60, exclusive=True)
+
+    # Priority lanes: critical probes never queue behind bulk scans
+    runner = TaskRunner(lanes={"critical": 2, "normal": 2, "bulk": 1})
+    runner.register("probe", probe_fn, interval_seconds=60, priority="critical")
+    runner.get_lane_stats()["critical"]["p99"]  # queueing delay, seconds
+
+    # Stop a runaway task at 512 MiB / 10 CPU-minutes (child process + rlimits)
+    runner.register("report", module_level_report_fn, interval_seconds=3600,
+                    max_rss_mb=512, max_cpu_seconds=600, max_open_files=256)
+
+    # CPU-bound task in a worker process (fn must be picklable)
+    runner.register("scan", module_level_fn, interval_seconds=3600, executor="process")
+    runner.close()      # shut down the process pool when finished
+
+Usage (asyncio):
+    from runtime.task_runner import AsyncTaskRunner
+    runner = AsyncTaskRunner(max_concurrency=200)
+    runner.register("ping", async_probe, interval_seconds=60)  # async def
+    await runner.run_once()  # coroutine tasks gathered, sync ones in threads
 
 Usage (CLI):
     python -m runtime.task_runner --once    # run due tasks and exit
     python -m runtime.task_runner --all     # force all tasks and exit
     python -m runtime.task_runner --list    # list tasks
     python -m runtime.task_runner --daemon  # loop forever (Ctrl-C to stop)
+    python -m runtime.task_runner --once --stats            # + latency stats
+    python -m runtime.task_runner --daemon --metrics-port 9464  # /metrics
+    python -m runtime.task_runner --history health_check --since 7d
+    python -m runtime.task_runner --cache-report  # bytecode cleanup dry run
+    python -m runtime.task_runner --once --format ndjson --fields=-output.components
+    python -m runtime.task_runner ctl run health_check  # talk to --daemon
+    python -m runtime.task_runner ctl pause|resume|stats|results
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import collections
+import contextlib
+import faulthandler
+import functools
+import heapq
+import inspect
+import itertools
+import json
 import logging
+import os
+import pickle
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Container,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+try:
+    from runtime.task_budget import (
+        BUDGETS_AVAILABLE,
+        BudgetExceededError,
+        ResourceBudget,
+        run_with_budget,
+    )
+    from runtime.task_control import (
+        CONTROL_AVAILABLE,
+        ControlError,
+        send_command,
+        start_control_server,
+    )
+    from runtime.task_cron import CronSchedule, parse_schedule
+    from runtime.task_history import TaskHistoryStore, parse_duration
+    from runtime.task_inputs import DEFAULT_PRUNE, InputSet, fingerprint_paths
+    from runtime.task_lock import FileLock, TaskLeaseManager
+    from runtime.task_manifest import ScanManifest, count_findings, scanner_identity
+    from runtime.task_metrics import TaskMetrics, start_metrics_server
+    from runtime.task_probe import probe_projects, probe_projects_cached
+    from runtime.task_pycache import BytecodePolicy, evict_bytecode, scan_bytecode
+    from runtime.task_state import TaskStateStore
+    from runtime.task_walk import PruneRules, find_dirs
+    from runtime.task_watch import EventTrigger, FileWatcher
+except ImportError:  # imported as a top-level module with runtime/ on sys.path
+    from task_budget import (  # type: ignore[no-redef]
+        BUDGETS_AVAILABLE,
+        BudgetExceededError,
+        ResourceBudget,
+        run_with_budget,
+    )
+    from task_control import (  # type: ignore[no-redef]
+        CONTROL_AVAILABLE,
+        ControlError,
+        send_command,
+        start_control_server,
+    )
+    from task_cron import CronSchedule, parse_schedule  # type: ignore[no-redef]
+    from task_history import TaskHistoryStore, parse_duration  # type: ignore[no-redef]
+    from task_inputs import DEFAULT_PRUNE, InputSet, fingerprint_paths  # type: ignore[no-redef]
+    from task_lock import FileLock, TaskLeaseManager  # type: ignore[no-redef]
+    from task_manifest import (  # type: ignore[no-redef]
+        ScanManifest,
+        count_findings,
+        scanner_identity,
+    )
+    from task_metrics import TaskMetrics, start_metrics_server  # type: ignore[no-redef]
+    from task_probe import probe_projects, probe_projects_cached  # type: ignore[no-redef]
+    from task_pycache import (  # type: ignore[no-redef]
+        BytecodePolicy,
+        evict_bytecode,
+        scan_bytecode,
+    )
+    from task_state import TaskStateStore  # type: ignore[no-redef]
+    from task_walk import PruneRules, find_dirs  # type: ignore[no-redef]
+    from task_watch import EventTrigger, FileWatcher  # type: ignore[no-redef]
+
+try:
+    import resource
+except ImportError:  # Windows: peak-RSS deltas are reported as None
+    resource = None  # type: ignore[assignment]
 
 logger = logging.getLogger("gaia.runtime.task_runner")
 
+#: Valid values for ScheduledTask.executor.
+EXECUTORS = ("thread", "process")
+
+#: Valid values for ScheduledTask.misfire.
+MISFIRE_POLICIES = ("coalesce", "skip", "run_all_missed")
+
+#: Valid values for ScheduledTask.priority, most urgent first.
+PRIORITIES = ("critical", "normal", "bulk")
+
+#: How late a run may start and still count as on time, by default.
+DEFAULT_GRACE_SECONDS = 60.0
+
+#: Upper bound on catch-up runs queued by the ``run_all_missed`` policy.
+MAX_MISSED_RUNS = 100
+
+#: How often a cycle running with lanes checks for newly due tasks.
+LANE_ADMISSION_POLL_SECONDS = 1.0
+
+#: File inside lock_dir held by the running daemon.
+DAEMON_LOCK_FILENAME = "daemon.lock"
+
+#: Floor on daemon sleeps so interval-0 tasks cannot spin the loop.
+DAEMON_MIN_SLEEP_SECONDS = 1.0
+
+#: First wait before retrying a task whose lease another process holds;
+#: doubles with each consecutive miss.
+LEASE_RETRY_SECONDS = 5.0
+
+#: Longest wait between lease retries for cron and interval-0 tasks; other
+#: tasks wait at most one interval.
+LEASE_RETRY_MAX_SECONDS = 300.0
+
+#: Ceiling on a single idle wait, so signals are still serviced promptly on
+#: platforms where an untimed Condition.wait() is not interruptible.
+DAEMON_MAX_SLEEP_SECONDS = 3600.0
+
 
 # ---------------------------------------------------------------------------
 # ScheduledTask dataclass
 # ---------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with jitter for failing tasks.
+
+    After the n-th consecutive failure the task is retried after
+    ``min(max_delay_seconds, base_delay_seconds * 2 ** (n - 1))`` seconds,
+    scaled down by a random factor in ``[1 - jitter, 1]`` so that many
+    failing tasks do not retry in lockstep. Once ``max_attempts`` runs have
+    failed in a row the task falls back to its normal interval.
+
+    Attributes:
+        max_attempts: Total attempts per failure streak, including the
+            first run. 1 disables retries.
+        base_delay_seconds: Delay before the first retry.
+        max_delay_seconds: Cap on any single delay.
+        jitter: Fraction of the delay that may be randomly removed (0-1).
+    """
+
+    max_attempts: int = 3
+    base_delay_seconds: float = 30.0
+    max_delay_seconds: float = 3600.0
+    jitter: float = 0.2
+
+    def __post_init__(self) -> None:
+        """Validate the policy parameters.
+
+        Raises:
+            ValueError: If any parameter is out of range.
+        """
+        if self.max_attempts < 1:
+            raise ValueError(f"max_attempts must be >= 1, got {self.max_attempts}")
+        if self.base_delay_seconds < 0 or self.max_delay_seconds < 0:
+            raise ValueError("retry delays must be >= 0")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError(f"jitter must be within [0, 1], got {self.jitter}")
+
+    def delay_for(self, failures: int) -> float:
+        """Return the backoff before the next attempt.
+
+        Args:
+            failures: Consecutive failures so far (>= 1).
+
+        Returns:
+            Delay in seconds.
+        """
+        delay = min(self.max_delay_seconds, self.base_delay_seconds * 2 ** (failures - 1))
+        return delay * (1 - self.jitter * random.random())
+
+
+@dataclass(frozen=True)
+class AdaptiveInterval:
+    """Stretch a task's interval while the inputs it watches are unchanged.
+
+    Before each run the watched paths are fingerprinted (see
+    ``runtime.task_inputs.fingerprint_paths``) and compared with the
+    fingerprint taken after the previous run, so the task's own writes do
+    not count. If nothing changed, the interval is multiplied by ``factor``
+    up to ``max_interval_seconds``; on any change it snaps back to the
+    task's registered interval.
+
+    Attributes:
+        watch: Files or directories the task reads.
+        max_interval_seconds: Upper bound on the stretched interval.
+        factor: Growth per unchanged run (> 1).
+    """
+
+    watch: Tuple[str, ...]
+    max_interval_seconds: float
+    factor: float = 2.0
+
+    def __post_init__(self) -> None:
+        """Normalise watch paths and validate the parameters.
+
+        Raises:
+            ValueError: If any parameter is out of range.
+        """
+        object.__setattr__(self, "watch", tuple(str(p) for p in self.watch))
+        if not self.watch:
+            raise ValueError("watch must name at least one path")
+        if self.max_interval_seconds <= 0:
+            raise ValueError(f"max_interval_seconds must be > 0, got {self.max_interval_seconds}")
+        if self.factor <= 1:
+            raise ValueError(f"factor must be > 1, got {self.factor}")
+
+    def next_interval(self, current: float, minimum: float, changed: bool) -> float:
+        """Return the interval to use after a run.
+
+        Args:
+            current: Interval in effect for the run that just finished.
+            minimum: The task's registered interval.
+            changed: Whether the watched inputs changed since the last run.
+
+        Returns:
+            Interval in seconds, within ``[minimum, max_interval_seconds]``.
+        """
+        if changed:
+            return minimum
+        return max(minimum, min(self.max_interval_seconds, current * self.factor))
+
+
 @dataclass
 class ScheduledTask:
     """A single registered background task.
@@ -43,9 +349,56 @@ class ScheduledTask:
     Attributes:
         name: Unique task identifier.
         interval_seconds: How often the task should run. 0 means every call.
+            Ignored when ``cron`` is set.
         fn: Callable invoked when the task executes.
         last_run: Unix timestamp of the most recent execution, or None.
         enabled: When False the task is skipped by run_once/run_all.
+        exclusive: When True the task never runs alongside other tasks in
+            concurrent mode; it executes alone after the shared batch.
+        executor: ``"thread"`` runs fn in the runner's process; ``"process"``
+            dispatches it to the runner's process pool.
+        timeout_seconds: Deadline for a single execution, or None for no
+            limit. Overrunning tasks are abandoned and recorded as
+            ``status: "timeout"``.
+        depends_on: Names of tasks that must finish first when they run in
+            the same cycle. If a prerequisite's latest result is not a
+            success, or its output reports an error status or missing
+            components, this task is recorded as ``status: "skipped"``.
+        retry: Backoff policy applied after failures, or None to wait a full
+            interval as before.
+        failures: Consecutive failed runs in the current streak.
+        retry_at: Unix timestamp of the pending retry, or None.
+        cron: Cron schedule, or None for a fixed interval. A cron task is
+            due at its first fire time after last_run or, if it has never
+            run, after it was first registered. With a state file that
+            first registration is persisted, so a fresh process (e.g.
+            ``--once``) still runs fires it has missed.
+        misfire: What to do when a run starts more than grace_seconds after
+            it was scheduled (daemon suspended, long overrun): one of
+            ``MISFIRE_POLICIES``. ``"coalesce"`` runs once, ``"skip"``
+            records the run as skipped and waits for the next fire, and
+            ``"run_all_missed"`` runs once per missed fire.
+        grace_seconds: Lateness tolerated before the misfire policy applies.
+        priority: One of ``PRIORITIES``. ``"bulk"`` tasks are deferred when
+            the runner is over its cycle budget.
+        pending_runs: Catch-up runs still owed under ``run_all_missed``.
+        adaptive: Change-driven interval stretching, or None.
+        current_interval: Interval currently in effect for an adaptive
+            task, or None to use interval_seconds.
+        input_fingerprint: Fingerprint of the adaptive task's watched
+            inputs taken after its last run.
+        inputs: Filesystem inputs the task's result is a pure function of,
+            or None. When their fingerprint matches the one the last
+            successful result was computed from, that result is re-served
+            with ``cached: True`` instead of running the task.
+        memo_fingerprint: Input fingerprint of the last successful run.
+        events: Filesystem globs whose changes queue a run, or None. Such a
+            task's fn takes one argument, the sorted list of changed paths;
+            an empty list (scheduled, forced or triggered runs, or lost
+            events) means "assume everything changed".
+        changed_paths: Debounced changes waiting for the next event run.
+        budget: Memory, CPU and open-file limits enforced in a child
+            interpreter, or None to run in the runner's process.
     """
 
     name: str
@@ -53,6 +406,184 @@ class ScheduledTask:
     fn: Callable[[], Any]
     last_run: Optional[float] = field(default=None)
     enabled: bool = field(default=True)
+    exclusive: bool = field(default=False)
+    executor: str = field(default="thread")
+    timeout_seconds: Optional[float] = field(default=None)
+    depends_on: Tuple[str, ...] = field(default=())
+    retry: Optional[RetryPolicy] = field(default=None)
+    failures: int = field(default=0)
+    retry_at: Optional[float] = field(default=None)
+    cron: Optional[CronSchedule] = field(default=None)
+    misfire: str = field(default="coalesce")
+    grace_seconds: float = field(default=DEFAULT_GRACE_SECONDS)
+    priority: str = field(default="normal")
+    pending_runs: int = field(default=0)
+    adaptive: Optional[AdaptiveInterval] = field(default=None)
+    current_interval: Optional[float] = field(default=None)
+    input_fingerprint: Optional[str] = field(default=None)
+    inputs: Optional[InputSet] = field(default=None)
+    memo_fingerprint: Optional[str] = field(default=None)
+    events: Optional[EventTrigger] = field(default=None)
+    budget: Optional[ResourceBudget] = field(default=None)
+    changed_paths: List[str] = field(default_factory=list)
+    # (wall, time.monotonic()) pairs captured together. Only trusted while
+    # the wall field still equals the stamp they were taken with.
+    _run_anchor: Optional[Tuple[float, float]] = field(default=None, repr=False, compare=False)
+    _retry_anchor: Optional[Tuple[float, float]] = field(default=None, repr=False, compare=False)
+    # Reference time for a cron task that has never run; restored from the
+    # state file so every process measures from the first registration.
+    _cron_base: float = field(default_factory=time.time, repr=False, compare=False)
+    # (reference wall time, next fire wall time); recomputed only when the
+    # reference (last_run) changes, not on every scheduler tick.
+    _fire_cache: Optional[Tuple[float, float]] = field(default=None, repr=False, compare=False)
+    # Monotonic time before which a load-deferred task is not due again.
+    _defer_until: Optional[float] = field(default=None, repr=False, compare=False)
+    # Consecutive runs skipped because another process held the lease, and
+    # the monotonic time before which the lease is not tried again.
+    _lease_misses: int = field(default=0, repr=False, compare=False)
+    _lease_wait_until: Optional[float] = field(default=None, repr=False, compare=False)
+
+    def mark_run(self) -> None:
+        """Stamp last_run with the current wall and monotonic clocks."""
+        self.last_run = time.time()
+        self._run_anchor = (self.last_run, time.monotonic())
+        self._defer_until = None
+        self._lease_misses = 0
+        self._lease_wait_until = None
+
+    def defer(self, seconds: float) -> None:
+        """Postpone a due task by ``seconds`` without recording a run.
+
+        Args:
+            seconds: Delay before the task is due again.
+        """
+        self._defer_until = time.monotonic() + seconds
+
+    def wait_for_lease(self, seconds: float) -> None:
+        """Hold the task back after finding its lease taken by another process.
+
+        Args:
+            seconds: Delay before the lease is tried again.
+        """
+        self._lease_misses += 1
+        self._lease_wait_until = time.monotonic() + seconds
+
+    def lease_acquired(self) -> None:
+        """Clear the lease backoff once this process holds the lease."""
+        self._lease_misses = 0
+        self._lease_wait_until = None
+
+    def effective_interval(self) -> float:
+        """Return the interval in effect, including adaptive stretching."""
+        return self.interval_seconds if self.current_interval is None else self.current_interval
+
+    @property
+    def deferred(self) -> bool:
+        """True if the task was deferred and has not run since."""
+        return self._defer_until is not None
+
+    def scheduled_time(self) -> Optional[float]:
+        """Return the wall-clock time the current run was scheduled for.
+
+        Returns:
+            Unix timestamp, or None when the task has no fixed slot (never
+            run, or interval 0), so it can never be late.
+        """
+        fire = self.next_fire_time()
+        if fire is not None:
+            return fire
+        if self.interval_seconds == 0 or self.last_run is None:
+            return None
+        return self.last_run + self.effective_interval()
+
+    def missed_fires(self, now: float) -> int:
+        """Count scheduled slots between scheduled_time() and ``now``.
+
+        Args:
+            now: Current Unix time.
+
+        Returns:
+            Number of slots that have come round, at least 1 when due and
+            capped at ``MAX_MISSED_RUNS``.
+        """
+        scheduled = self.scheduled_time()
+        if scheduled is None or scheduled > now:
+            return 1
+        if self.cron is None:
+            return min(MAX_MISSED_RUNS, 1 + int((now - scheduled) // self.effective_interval()))
+        count = 1
+        while count < MAX_MISSED_RUNS:
+            scheduled = self.cron.next_fire(scheduled)
+            if scheduled > now:
+                break
+            count += 1
+        return count
+
+    def schedule_retry(self, delay: float) -> None:
+        """Make the task due again after ``delay`` seconds.
+
+        Args:
+            delay: Backoff in seconds.
+        """
+        self.retry_at = time.time() + delay
+        self._retry_anchor = (self.retry_at, time.monotonic() + delay)
+
+    def clear_retry(self) -> None:
+        """Drop any pending retry and reset the failure streak."""
+        self.failures = 0
+        self.retry_at = None
+        self._retry_anchor = None
+
+    @staticmethod
+    def _to_monotonic(wall: float, anchor: Optional[Tuple[float, float]]) -> float:
+        """Map a wall-clock stamp onto the monotonic clock."""
+        if anchor is not None and anchor[0] == wall:
+            return anchor[1]
+        return time.monotonic() - (time.time() - wall)
+
+    def next_fire_time(self) -> Optional[float]:
+        """Return the wall-clock time of the task's next cron fire.
+
+        Returns:
+            Unix timestamp, or None for interval tasks.
+        """
+        if self.cron is None:
+            return None
+        reference = self._cron_base if self.last_run is None else self.last_run
+        cached = self._fire_cache
+        if cached is None or cached[0] != reference:
+            cached = self._fire_cache = (reference, self.cron.next_fire(reference))
+        return cached[1]
+
+    def next_due(self) -> float:
+        """Return the monotonic time at which the task next becomes due.
+
+        The monotonic anchor from mark_run() is preferred so wall-clock jumps
+        neither delay nor burst tasks; a last_run set by other means (e.g.
+        restored from disk) is converted from wall-clock time. Cron fire
+        times are wall-clock by nature and are converted directly. A
+        pending retry brings the deadline forward.
+
+        Returns:
+            A ``time.monotonic()`` value; anything <= now means due.
+        """
+        now = time.monotonic()
+        if self.pending_runs > 0 or self.changed_paths:
+            return now if self._lease_wait_until is None else max(now, self._lease_wait_until)
+        fire = self.next_fire_time()
+        if fire is not None:
+            due = self._to_monotonic(fire, None)
+        elif self.interval_seconds == 0 or self.last_run is None:
+            due = now
+        else:
+            due = self._to_monotonic(self.last_run, self._run_anchor) + self.effective_interval()
+        if self.retry_at is not None:
+            due = min(due, self._to_monotonic(self.retry_at, self._retry_anchor))
+        if self._defer_until is not None:
+            due = max(due, self._defer_until)
+        if self._lease_wait_until is not None:
+            due = max(due, self._lease_wait_until)
+        return due
 
     def is_due(self) -> bool:
         """Return True when the task should execute now.
@@ -60,12 +591,193 @@ class ScheduledTask:
         Returns:
             True if interval_seconds == 0, if the task has never run, or if
             at least interval_seconds seconds have elapsed since last_run.
+            Cron tasks are due once their next fire time has passed.
         """
-        if self.interval_seconds == 0:
-            return True
-        if self.last_run is None:
-            return True
-        return (time.time() - self.last_run) >= self.interval_seconds
+        return self.next_due() <= time.monotonic()
+
+
+# ---------------------------------------------------------------------------
+# Process executor support
+# ---------------------------------------------------------------------------
+
+
+class TaskWorkerError(RuntimeError):
+    """Raised when a task dispatched to a worker process fails or crashes."""
+
+
+class TaskTimeoutError(RuntimeError):
+    """Raised when a task exceeds its timeout_seconds deadline."""
+
+
+class RunnerLockedError(RuntimeError):
+    """Raised when another process already holds the daemon lock."""
+
+
+def _pickle_safe(value: Any) -> Any:
+    """Return value unchanged if picklable, else a JSON-safe equivalent.
+
+    Args:
+        value: Task output produced inside a worker process.
+
+    Returns:
+        A value that can be sent back to the parent process.
+    """
+    try:
+        pickle.dumps(value)
+        return value
+    except Exception:  # noqa: BLE001
+        return json.loads(json.dumps(value, default=str))
+
+
+def _log_thread_stacks(task_name: str) -> None:
+    """Dump every thread's stack via faulthandler into the task log.
+
+    faulthandler writes to a real file descriptor, so the dump goes through
+    a temporary file and is then re-emitted on the module logger.
+
+    Args:
+        task_name: Name of the task that timed out, for the log header.
+    """
+    with tempfile.TemporaryFile(mode="w+") as fh:
+        faulthandler.dump_traceback(file=fh, all_threads=True)
+        fh.seek(0)
+        stacks = fh.read()
+    logger.error("Task %s timed out; thread stacks:\n%s", task_name, stacks)
+
+
+def _run_in_worker(fn: Callable[[], Any]) -> tuple:
+    """Process-pool entry point: run fn and marshal the outcome.
+
+    Exceptions are flattened to strings here because arbitrary exception
+    objects are not guaranteed to survive pickling back to the parent.
+
+    Args:
+        fn: The task callable.
+
+    Returns:
+        ``("success", output, cpu_seconds)`` or
+        ``("error", message, cpu_seconds)``.
+    """
+    cpu_start = time.process_time()
+    try:
+        output = _pickle_safe(fn())
+    except Exception as exc:  # noqa: BLE001
+        return ("error", str(exc), time.process_time() - cpu_start)
+    return ("success", output, time.process_time() - cpu_start)
+
+
+#: Changed paths listed in an event task's result (the count is always exact).
+MAX_REPORTED_CHANGED_PATHS = 50
+
+#: Task output statuses that block dependents although the call returned.
+OUTPUT_FAILURE_STATUSES = ("error", "failed", "failure")
+
+#: Result keys describing one execution, dropped when a result is re-served.
+_PER_RUN_RESULT_KEYS = frozenset(
+    {
+        "duration_seconds",
+        "cpu_seconds",
+        "queue_seconds",
+        "retry",
+        "adaptive",
+        "cached",
+        "cached_from",
+        "events",
+        "resources",
+    }
+)
+
+
+def _output_problem(output: Any) -> Optional[str]:
+    """Return the problem a successful task reported in its output, if any.
+
+    The built-in tasks return normally and describe failures in their
+    result dict: ``status`` ``"error"``/``"failed"``, or health
+    ``components`` that are missing or could not be probed.
+
+    Args:
+        output: The task callable's return value.
+
+    Returns:
+        A short description, or None when the output reports no problem.
+    """
+    if not isinstance(output, dict):
+        return None
+    status = output.get("status")
+    if status in OUTPUT_FAILURE_STATUSES:
+        message = output.get("message")
+        return f"reported {status}: {message}" if message else f"reported {status}"
+    components = output.get("components")
+    if isinstance(components, dict):
+        missing = sorted(
+            key
+            for key, health in components.items()
+            if isinstance(health, dict) and (not health.get("exists", True) or "error" in health)
+        )
+        if missing:
+            shown = ", ".join(missing[:5]) + (", ..." if len(missing) > 5 else "")
+            return f"reported {len(missing)} missing components ({shown})"
+    return None
+
+
+def _task_callable(task: ScheduledTask, usage: Dict[str, Any]) -> Callable[[], Any]:
+    """Return the zero-argument callable for one execution of ``task``.
+
+    Event-triggered tasks are bound to the changed paths taken for this
+    run (``usage["changed_paths"]``); other tasks use fn unchanged.
+    """
+    if task.events is None:
+        return task.fn
+    return functools.partial(task.fn, usage.get("changed_paths") or [])
+
+
+def _inputs_fingerprint(task: ScheduledTask) -> Optional[str]:
+    """Fingerprint a memoized task's declared inputs.
+
+    Returns:
+        The fingerprint, or None if the task declares no inputs or they
+        could not be resolved (the task then simply runs).
+    """
+    if task.inputs is None:
+        return None
+    try:
+        return task.inputs.fingerprint()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Task %s: could not fingerprint inputs: %s", task.name, exc)
+        return None
+
+
+def _watched_fingerprint(task: ScheduledTask) -> Optional[str]:
+    """Fingerprint an adaptive task's watched inputs (None otherwise)."""
+    if task.adaptive is None:
+        return None
+    return fingerprint_paths(task.adaptive.watch)
+
+
+def _timed_call(fn: Callable[[], Any], usage: Dict[str, Any]) -> Any:
+    """Call fn, storing the calling thread's CPU time in usage.
+
+    Args:
+        fn: Zero-argument callable.
+        usage: Dict receiving ``cpu_seconds``.
+
+    Returns:
+        Whatever fn returned.
+    """
+    cpu_start = time.thread_time()
+    try:
+        return fn()
+    finally:
+        usage["cpu_seconds"] = time.thread_time() - cpu_start
+
+
+def _peak_rss_kb() -> Optional[float]:
+    """Return this process's peak resident set size in KiB, if available."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and KiB elsewhere.
+    return peak / 1024 if sys.platform == "darwin" else float(peak)
 
 
 # ---------------------------------------------------------------------------
@@ -81,139 +793,1787 @@ class TaskRunner:
     Args:
         register_defaults: When True (default) the 5 built-in GAIA
             maintenance tasks are pre-registered on construction.
+        max_workers: Maximum number of tasks executed at the same time.
+            The default of 1 keeps the original serial behaviour; larger
+            values opt in to a bounded thread pool per cycle.
+        max_processes: Size of the process pool used by tasks registered
+            with ``executor="process"``. None lets the pool pick the CPU
+            count. The pool is created lazily on first use.
+        state_path: Optional JSON file used to persist ``last_run``,
+            ``enabled`` and the last result of each task. State is applied
+            to tasks as they are registered and flushed after every
+            execution. None (default) keeps state in memory only.
+        metrics_window: Number of recent runs per task kept for the
+            rolling percentile histograms returned by get_stats().
+        history_path: Optional SQLite file receiving every result via
+            ``runtime.task_history.TaskHistoryStore`` (default retention:
+            30 days, 1000 runs per task). None disables history.
+        lock_dir: Optional directory for cross-process coordination. When
+            set, run_forever() holds a global daemon lock and every task
+            execution holds a per-task lease; tasks leased by another
+            process are skipped for the cycle. None disables locking.
+        lease_seconds: Default lease duration before another process may
+            break it as stale. A task's lease is always at least its
+            timeout_seconds plus a minute.
+        lanes: Optional concurrency limit per priority lane, e.g.
+            ``{"critical": 2, "normal": 2, "bulk": 1}`` (missing lanes get
+            1). Each lane then runs independently of ``max_workers``, so
+            bulk work cannot occupy the workers critical tasks need.
+            None shares ``max_workers`` between all priorities.
+        cycle_budget_seconds: Wall-time budget for one run_once() cycle.
+            When the previous cycle exceeded it, due ``"bulk"`` tasks are
+            deferred by that cycle's duration (at most once in a row) so
+            maintenance does not pile onto an already loaded system. None
+            disables the guard.
+        watch_backend: Filesystem-event backend for tasks registered with
+            ``events``: ``"inotify"``, ``"poll"`` or ``"auto"``. See
+            ``runtime.task_watch``.
     """
 
-    def __init__(self, register_defaults: bool = True) -> None:
+    def __init__(
+        self,
+        register_defaults: bool = True,
+        max_workers: int = 1,
+        max_processes: Optional[int] = None,
+        state_path: Optional[Union[str, Path]] = None,
+        metrics_window: int = 256,
+        history_path: Optional[Union[str, Path]] = None,
+        lock_dir: Optional[Union[str, Path]] = None,
+        lease_seconds: float = 3600.0,
+        lanes: Optional[Dict[str, int]] = None,
+        cycle_budget_seconds: Optional[float] = None,
+        watch_backend: str = "auto",
+    ) -> None:
         """Initialise the runner, optionally loading default tasks.
 
         Args:
             register_defaults: Pre-register the 5 built-in tasks when True.
+            max_workers: Upper bound on concurrently executing tasks.
+            max_processes: Worker count for the process executor.
+            state_path: JSON state file to restore from and flush to.
+            metrics_window: Samples per task kept for latency percentiles.
+            history_path: SQLite history database, or None.
+            lock_dir: Directory holding the daemon lock and task leases.
+            lease_seconds: Default per-task lease duration.
+            lanes: Per-priority concurrency limits, or None.
+            cycle_budget_seconds: Per-cycle wall-time budget, or None.
+            watch_backend: Backend for filesystem-event triggers.
+
+        Raises:
+            ValueError: If max_workers is less than 1, or lanes names an
+                unknown priority or a limit below 1.
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        if lanes is not None:
+            unknown = set(lanes) - set(PRIORITIES)
+            if unknown:
+                raise ValueError(f"lanes must be keyed by {PRIORITIES}, got {sorted(unknown)}")
+            if any(limit < 1 for limit in lanes.values()):
+                raise ValueError(f"lane limits must be >= 1, got {lanes}")
+            lanes = {priority: lanes.get(priority, 1) for priority in PRIORITIES}
+        self._lanes = lanes
         self._tasks: Dict[str, ScheduledTask] = {}
         self._results: Dict[str, Dict[str, Any]] = {}
+        self._max_workers = max_workers
+        # Guards _results and task bookkeeping when tasks run in the pool.
+        self._lock = threading.Lock()
+        self._max_processes = max_processes
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_lock = threading.Lock()
+        # Min-heap of (next_due_monotonic, seq, name, version). Entries whose
+        # version is behind _heap_versions[name] are stale and dropped lazily.
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._heap_versions: Dict[str, int] = {}
+        self._heap_seq = itertools.count()
+        self._wakeup = threading.Condition()
+        self._wakeup_pending = False
+        self._stopping = False
+        self._paused = False
+        # Threads of timed-out tasks that are still running in the background,
+        # by task name. A thread removes its own entry when its call returns.
+        self._hung_threads: Dict[str, threading.Thread] = {}
+        self._hung_lock = threading.Lock()
+        # Executions in flight and started so far; ru_maxrss is process-wide,
+        # so an RSS delta is only attributed to a run that overlapped no other.
+        self._executions_running = 0
+        self._executions_started = 0
+        self._executions_lock = threading.Lock()
+        self._metrics = TaskMetrics(window=metrics_window)
+        self._history = TaskHistoryStore(history_path) if history_path is not None else None
+        self._leases = (
+            TaskLeaseManager(lock_dir, lease_seconds=lease_seconds) if lock_dir is not None else None
+        )
+        self._daemon_lock = (
+            FileLock(Path(lock_dir) / DAEMON_LOCK_FILENAME) if lock_dir is not None else None
+        )
+        self._cycle_budget = cycle_budget_seconds
+        self._watch_backend = watch_backend
+        # Created on the first register(events=...); started by run_forever().
+        self._watcher: Optional[FileWatcher] = None
+        self._result_listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._last_cycle_seconds = 0.0
+        self._state_store = TaskStateStore(state_path) if state_path is not None else None
+        self._state_flush_lock = threading.Lock()
+        self._saved_state: Dict[str, Dict[str, Any]] = (
+            self._state_store.load() if self._state_store is not None else {}
+        )
+
+        if register_defaults:
+            self._register_default_tasks()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def register(
+        self,
+        name: str,
+        fn: Callable[[], Any],
+        interval_seconds: Optional[float] = None,
+        exclusive: bool = False,
+        executor: str = "thread",
+        timeout_seconds: Optional[float] = None,
+        depends_on: Sequence[str] = (),
+        retry: Optional[RetryPolicy] = None,
+        schedule: Optional[str] = None,
+        misfire: str = "coalesce",
+        grace_seconds: float = DEFAULT_GRACE_SECONDS,
+        priority: str = "normal",
+        adaptive: Optional[AdaptiveInterval] = None,
+        inputs: Union[InputSet, Sequence[Union[str, Path]], None] = None,
+        events: Optional[EventTrigger] = None,
+        max_rss_mb: Optional[float] = None,
+        max_cpu_seconds: Optional[float] = None,
+        max_open_files: Optional[int] = None,
+    ) -> None:
+        """Add or replace a task in the registry.
+
+        Args:
+            name: Unique task identifier. Re-registering an existing name
+                replaces the previous entry.
+            fn: Zero-argument callable executed when the task is due.
+            interval_seconds: Minimum seconds between executions.
+                Pass 0 to execute on every run_once call. Exactly one of
+                interval_seconds and schedule must be given.
+            exclusive: Run this task on its own rather than alongside
+                other tasks when the runner is in concurrent mode.
+            executor: ``"thread"`` (default) or ``"process"``. Process tasks
+                must be picklable module-level callables returning
+                picklable data; unpicklable output is converted to JSON-safe
+                values before it crosses the process boundary.
+            timeout_seconds: Abandon an execution after this many seconds
+                and record ``status: "timeout"``. Thread tasks keep running
+                in the background (Python threads cannot be killed) and are
+                not restarted until they finish; process tasks have their
+                worker terminated.
+            depends_on: Prerequisite task names. Within a cycle this task
+                starts as soon as all of them have finished, and is skipped
+                if any of them did not succeed. Prerequisites need not be
+                registered yet.
+            retry: Backoff policy for failed or timed-out runs. Retries
+                bring the next-due time forward; the daemon wakes for them
+                like any other deadline.
+            schedule: Cron expression evaluated in local time (e.g.
+                ``"0 3 * * *"``), an alias such as ``"@daily"``, or a legacy
+                word such as ``"hourly"``. Parsed once at registration.
+            misfire: Policy for runs starting more than grace_seconds
+                late; one of ``MISFIRE_POLICIES``.
+            grace_seconds: Tolerated lateness before misfire applies.
+            priority: One of ``PRIORITIES``; ``"bulk"`` tasks yield to
+                the cycle-budget guard.
+            adaptive: Stretch interval_seconds (the minimum) while the
+                watched inputs stay unchanged. Requires a positive
+                interval_seconds.
+            inputs: Paths (walked recursively, pruning ``.git`` and the
+                like) or an InputSet the task's result depends on. The task
+                is skipped and its last successful result re-served, marked
+                ``cached: True``, while their fingerprint is unchanged.
+            events: Queue a run shortly after files matching these globs
+                change. fn is then called with the sorted list of changed
+                paths (empty for runs not caused by events, meaning "assume
+                everything changed"). The interval or schedule still applies
+                as a backstop; the watcher runs while run_forever() does.
+            max_rss_mb: Memory in MiB the task may allocate on top of its
+                child interpreter's footprint (``RLIMIT_AS``).
+            max_cpu_seconds: CPU seconds the task may use (``RLIMIT_CPU``).
+            max_open_files: Descriptor limit for the task
+                (``RLIMIT_NOFILE``).
+                Setting any of the three runs each execution in a spawned
+                child interpreter under those limits, so fn must be a
+                picklable module-level callable. A task stopped by a limit is
+                recorded as ``status: "budget_exceeded"``, and every run
+                records the child's peak usage under ``"resources"``. See
+                ``runtime.task_budget``.
+
+        Raises:
+            ValueError: If executor is not one of ``EXECUTORS``, a
+                coroutine function is paired with the process executor,
+                timeout_seconds is not positive, depends_on would create
+                a dependency cycle, schedule is invalid, not exactly one
+                of interval_seconds and schedule is given, or misfire,
+                grace_seconds or priority is invalid, adaptive is
+                combined with a cron schedule or a zero interval, or a
+                resource budget is invalid, combined with the process
+                executor or a coroutine function, or set on an unpicklable
+                fn.
+        """
+        if (interval_seconds is None) == (schedule is None):
+            raise ValueError(f"Task {name!r}: pass exactly one of interval_seconds or schedule")
+        cron = parse_schedule(schedule) if schedule is not None else None
+        if executor not in EXECUTORS:
+            raise ValueError(f"executor must be one of {EXECUTORS}, got {executor!r}")
+        if executor == "process" and inspect.iscoroutinefunction(fn):
+            raise ValueError(f"Task {name!r}: coroutine functions cannot use the process executor")
+        if timeout_seconds is not None and timeout_seconds <= 0:
+            raise ValueError(f"timeout_seconds must be > 0, got {timeout_seconds}")
+        if misfire not in MISFIRE_POLICIES:
+            raise ValueError(f"misfire must be one of {MISFIRE_POLICIES}, got {misfire!r}")
+        if grace_seconds < 0:
+            raise ValueError(f"grace_seconds must be >= 0, got {grace_seconds}")
+        if priority not in PRIORITIES:
+            raise ValueError(f"priority must be one of {PRIORITIES}, got {priority!r}")
+        if adaptive is not None and not interval_seconds:
+            raise ValueError(f"Task {name!r}: adaptive scheduling needs interval_seconds > 0")
+        budget = None
+        if (max_rss_mb, max_cpu_seconds, max_open_files) != (None, None, None):
+            budget = ResourceBudget(max_rss_mb, max_cpu_seconds, max_open_files)
+            if executor == "process" or inspect.iscoroutinefunction(fn):
+                raise ValueError(
+                    f"Task {name!r}: resource budgets need a synchronous thread-executor task"
+                )
+            try:
+                pickle.dumps(fn)
+            except Exception as exc:  # noqa: BLE001 - lambdas, closures, bound locals
+                raise ValueError(
+                    f"Task {name!r}: resource budgets need a picklable module-level fn: {exc}"
+                ) from exc
+            if not BUDGETS_AVAILABLE:
+                logger.warning("Task %s: resource budgets are not enforced on this platform", name)
+        depends_on = tuple(dict.fromkeys(depends_on))
+        self._check_acyclic(name, depends_on)
+        task = ScheduledTask(
+            name=name,
+            interval_seconds=interval_seconds or 0.0,
+            fn=fn,
+            exclusive=exclusive,
+            executor=executor,
+            timeout_seconds=timeout_seconds,
+            depends_on=depends_on,
+            retry=retry,
+            cron=cron,
+            misfire=misfire,
+            grace_seconds=grace_seconds,
+            priority=priority,
+            adaptive=adaptive,
+            inputs=inputs if inputs is None or isinstance(inputs, InputSet) else InputSet(inputs),
+            events=events,
+            budget=budget,
+        )
+        if events is not None:
+            if self._watcher is None:
+                self._watcher = FileWatcher(self._on_files_changed, backend=self._watch_backend)
+            self._watcher.subscribe(name, events)
+        elif self._watcher is not None:
+            self._watcher.unsubscribe(name)
+        anchored = self._restore_state(task)
+        self._tasks[name] = task
+        if task.cron is not None and not anchored and self._state_store is not None:
+            # Persist the anchor now: a process that exits before the first
+            # fire must not leave the next one measuring from scratch.
+            self._flush_state()
+        self._schedule(task)
+
+    def run_once(self) -> int:
+        """Execute all enabled tasks that are currently due.
+
+        Exceptions raised by individual tasks are caught, logged, and stored
+        in results; they do not propagate to the caller.
+
+        Late runs are subject to each task's misfire policy, and ``"bulk"``
+        tasks may be deferred when the previous cycle overran
+        cycle_budget_seconds.
+
+        Returns:
+            Number of tasks that were executed (attempted, whether or not
+            they succeeded).
+        """
+        started = time.monotonic()
+        try:
+            return self._run_tasks(self._select_due())
+        finally:
+            self._last_cycle_seconds = time.monotonic() - started
+
+    def run_all(self) -> int:
+        """Force-execute every enabled task regardless of interval.
+
+        Ignores last_run — useful for ad-hoc maintenance runs.
+
+        Returns:
+            Number of tasks executed.
+        """
+        return self._run_tasks([t for t in self._tasks.values() if t.enabled])
+
+    def enable(self, name: str) -> None:
+        """Re-enable a task and wake the daemon if it is now due earlier.
+
+        Args:
+            name: Registered task name.
+
+        Raises:
+            KeyError: If no task with that name is registered.
+        """
+        task = self._tasks[name]
+        task.enabled = True
+        self._flush_state()
+        self._schedule(task)
+
+    def disable(self, name: str) -> None:
+        """Disable a task so run_once/run_all skip it.
+
+        Args:
+            name: Registered task name.
+
+        Raises:
+            KeyError: If no task with that name is registered.
+        """
+        self._tasks[name].enabled = False
+        self._flush_state()
+
+    def trigger(self, name: str) -> None:
+        """Queue one extra run of a task for the next cycle.
+
+        The run goes through the normal dispatcher (lanes, leases,
+        dependencies) rather than executing on the caller's thread, and the
+        daemon is woken so it starts promptly.
+
+        Args:
+            name: Registered task name.
+
+        Raises:
+            KeyError: If no task with that name is registered.
+            ValueError: If the task is disabled.
+        """
+        task = self._tasks[name]
+        if not task.enabled:
+            raise ValueError(f"Task {name!r} is disabled; enable it before triggering")
+        with self._lock:
+            task.pending_runs += 1
+        self._schedule(task)
+
+    def pause(self) -> None:
+        """Stop starting new tasks until resume(); running tasks finish."""
+        with self._wakeup:
+            self._paused = True
+
+    def resume(self) -> None:
+        """Undo pause() and wake the daemon so overdue tasks run now."""
+        with self._wakeup:
+            self._paused = False
+            self._wakeup_pending = True
+            self._wakeup.notify_all()
+
+    @property
+    def paused(self) -> bool:
+        """True between pause() and resume()."""
+        return self._paused
+
+    def seconds_until_next_due(self) -> Optional[float]:
+        """Return seconds until the earliest enabled task is due.
+
+        Returns:
+            0.0 when something is already due, None when no enabled task is
+            registered.
+        """
+        with self._wakeup:
+            deadline = self._peek_next_due()
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+
+    def run_forever(self, min_sleep: float = DAEMON_MIN_SLEEP_SECONDS) -> None:
+        """Run due tasks until stop() is called, sleeping between cycles.
+
+        Instead of polling on a fixed period, the loop sleeps exactly until
+        the earliest next-due time on the heap (but at least min_sleep) and
+        is woken early by register(), enable(), or stop().
+
+        Args:
+            min_sleep: Lower bound on each sleep, in seconds.
+
+        Raises:
+            RunnerLockedError: If lock_dir is set and another process is
+                already running as the daemon.
+        """
+        self._acquire_daemon_lock()
+        try:
+            with self._wakeup:
+                self._stopping = False
+            self.start_watching()
+            while True:
+                count = self.run_once()
+                if count:
+                    logger.info("Daemon cycle: executed %d due tasks.", count)
+                if not self._wait_until_due(min_sleep):
+                    return
+        finally:
+            self.stop_watching()
+            self._release_daemon_lock()
+
+    def start_watching(self) -> None:
+        """Start the filesystem watcher for tasks registered with ``events``.
+
+        run_forever() calls this itself; call it directly to drive event
+        tasks from your own run_once() loop. No-op without event tasks.
+        """
+        if self._watcher is not None:
+            self._watcher.start()
+
+    def stop_watching(self) -> None:
+        """Stop the filesystem watcher, if running."""
+        if self._watcher is not None:
+            self._watcher.stop()
+
+    def stop(self) -> None:
+        """Ask run_forever() to return after the current cycle."""
+        with self._wakeup:
+            self._stopping = True
+            self._wakeup.notify_all()
+
+    def list_tasks(self) -> List[ScheduledTask]:
+        """Return all registered tasks.
+
+        Returns:
+            List of ScheduledTask instances in registration order.
+        """
+        return list(self._tasks.values())
+
+    def add_result_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Call ``listener(result)`` as soon as each task's result is recorded.
+
+        Listeners run on whichever thread finished the task (a pool worker
+        in concurrent mode), so they must be thread-safe and quick.
+        Exceptions they raise are logged and ignored.
+
+        Args:
+            listener: Callable receiving the result dict (see get_results).
+        """
+        self._result_listeners.append(listener)
+
+    def get_results(self) -> Dict[str, Dict[str, Any]]:
+        """Return the results from the most recent execution of each task.
+
+        Returns:
+            Dict mapping task name to a result dict containing at minimum
+            ``status`` (``"success"`` | ``"error"`` | ``"timeout"``) and
+            ``timestamp`` (ISO 8601 string), plus ``duration_seconds`` and
+            ``cpu_seconds`` (None when not measurable). Error and timeout
+            results also include an ``"error"`` key with the exception
+            message. Tasks skipped because a prerequisite failed have
+            ``status: "skipped"`` and a ``"reason"`` key. Tasks with a
+            RetryPolicy carry a ``"retry"`` dict with ``attempt``,
+            ``max_attempts`` and either ``next_retry_at`` (ISO 8601) and
+            ``backoff_seconds`` or ``exhausted: True``. Successful results may include an
+            ``"output"`` key with whatever the task callable returned.
+            Budgeted tasks stopped by a limit have ``status:
+            "budget_exceeded"`` and a ``"budget"`` dict (``resource``,
+            ``limit``); all their runs carry a ``"resources"`` dict with the
+            child's ``peak_rss_mb`` and ``cpu_seconds``.
+        """
+        with self._lock:
+            return dict(self._results)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return rolling execution metrics for every task that has run.
+
+        Returns:
+            Dict mapping task name to run counts by status, mean and last
+            wall time, and p50/p95/p99/max summaries of ``wall_seconds``,
+            ``cpu_seconds`` and ``rss_delta_kb`` over the recent window.
+            ``rss_delta_kb`` only counts runs that overlapped no other task.
+            See ``runtime.task_metrics.TaskMetrics.snapshot``.
+        """
+        return self._metrics.snapshot()
+
+    def get_lane_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return rolling queueing-delay summaries per priority lane.
+
+        Returns:
+            Dict mapping lane name to p50/p95/p99/max seconds that tasks
+            spent ready but waiting for a worker. See
+            ``runtime.task_metrics.TaskMetrics.lane_snapshot``.
+        """
+        return self._metrics.lane_snapshot()
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return result-cache hit/miss counters for memoized tasks.
+
+        Returns:
+            Dict mapping task name to ``hits``, ``misses`` and
+            ``hit_rate``.
+        """
+        return self._metrics.cache_snapshot()
+
+    @property
+    def metrics(self) -> TaskMetrics:
+        """The runner's TaskMetrics registry (for exporters)."""
+        return self._metrics
+
+    @property
+    def history(self) -> Optional[TaskHistoryStore]:
+        """The runner's execution history store, if one was configured."""
+        return self._history
+
+    def close(self) -> None:
+        """Shut down the process pool, watcher and history database.
+
+        Safe to call more than once; the pool is recreated on demand if
+        process tasks run again afterwards.
+        """
+        self.stop_watching()
+        with self._process_pool_lock:
+            pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+        history, self._history = self._history, None
+        if history is not None:
+            history.close()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _on_files_changed(self, name: str, paths: List[str]) -> None:
+        """Queue an event task after a debounced batch of changes.
+
+        Called from the watcher thread. Batches arriving before the task
+        runs are merged, so a burst of edits still yields one run.
+
+        Args:
+            name: Task subscribed to the changed globs.
+            paths: Changed paths, or empty when events were lost (the task
+                then gets a full run).
+        """
+        task = self._tasks.get(name)
+        if task is None or task.events is None or not task.enabled:
+            return
+        with self._lock:
+            if paths:
+                task.changed_paths = list(dict.fromkeys([*task.changed_paths, *paths]))
+            elif task.pending_runs == 0:
+                task.pending_runs = 1
+        logger.debug("Task %s queued by %d changed path(s)", name, len(paths))
+        self._schedule(task)
+
+    def _take_changed_paths(self, task: ScheduledTask) -> Optional[List[str]]:
+        """Claim the changed paths queued for an event task's run.
+
+        Returns:
+            The paths (possibly empty), or None if the task has no events.
+        """
+        if task.events is None:
+            return None
+        with self._lock:
+            paths, task.changed_paths = task.changed_paths, []
+        return paths
+
+    def _select_due(self, exclude: Container[str] = ()) -> List[ScheduledTask]:
+        """Return the due tasks to run this cycle.
+
+        Applies misfire policies to late tasks and the cycle-budget guard
+        to ``"bulk"`` tasks. Skipped and deferred tasks are left out.
+
+        Args:
+            exclude: Names already handled in the current cycle.
+
+        Returns:
+            Tasks to hand to the dispatcher; none while paused.
+        """
+        if self._paused:
+            return []
+        now = time.time()
+        overrun = self._cycle_budget is not None and self._last_cycle_seconds > self._cycle_budget
+        selected = []
+        for task in list(self._tasks.values()):
+            if task.name in exclude or not task.enabled or not task.is_due():
+                continue
+            if overrun and task.priority == "bulk" and not task.deferred:
+                logger.info(
+                    "Deferring %s: previous cycle took %.1fs (budget %.1fs)",
+                    task.name,
+                    self._last_cycle_seconds,
+                    self._cycle_budget,
+                )
+                task.defer(self._last_cycle_seconds)
+                self._schedule(task)
+                continue
+            if self._apply_misfire(task, now):
+                selected.append(task)
+        return selected
+
+    def _apply_misfire(self, task: ScheduledTask, now: float) -> bool:
+        """Apply the task's misfire policy if its run is late.
+
+        Args:
+            task: A due task.
+            now: Current Unix time.
+
+        Returns:
+            True if the task should run this cycle.
+        """
+        with self._lock:
+            if task.pending_runs > 0:
+                task.pending_runs -= 1
+                return True
+            if task.changed_paths:
+                return True
+        scheduled = task.scheduled_time()
+        if task.retry_at is not None or scheduled is None or now - scheduled <= task.grace_seconds:
+            return True
+        missed = task.missed_fires(now)
+        if task.misfire == "skip":
+            self._record_skipped(
+                task, f"misfire: {missed} run(s) missed, {now - scheduled:.0f}s late"
+            )
+            return False
+        if task.misfire == "run_all_missed" and missed > 1:
+            logger.info("Task %s missed %d runs; catching up", task.name, missed)
+            task.pending_runs = missed - 1
+        return True
+
+    def _acquire_daemon_lock(self) -> None:
+        """Take the global daemon lock, if locking is configured.
+
+        Raises:
+            RunnerLockedError: If another process holds it.
+        """
+        if self._daemon_lock is None:
+            return
+        if not self._daemon_lock.acquire({"pid": os.getpid(), "started_at": time.time()}):
+            holder = self._daemon_lock.read_metadata()
+            raise RunnerLockedError(
+                f"Another task runner daemon (pid {holder.get('pid', '?')}) holds "
+                f"{self._daemon_lock.path}"
+            )
+
+    def _release_daemon_lock(self) -> None:
+        """Release the global daemon lock, if held."""
+        if self._daemon_lock is not None:
+            self._daemon_lock.release()
+
+    def _acquire_lease(self, task: ScheduledTask) -> bool:
+        """Take the task's cross-process lease.
+
+        When another process holds it the task is postponed, not retried on
+        every tick: the wait starts at LEASE_RETRY_SECONDS and doubles per
+        consecutive miss, capped at the task's interval (or
+        LEASE_RETRY_MAX_SECONDS) and at the lease's expiry. The first miss
+        is logged at INFO, repeats at DEBUG.
+
+        Args:
+            task: Task about to start.
+
+        Returns:
+            True if the task may run; False if another process holds it.
+        """
+        if self._leases is None:
+            return True
+        duration = self._leases.lease_seconds
+        if task.timeout_seconds is not None:
+            duration = max(duration, task.timeout_seconds + 60)
+        if self._leases.acquire(task.name, lease_seconds=duration):
+            task.lease_acquired()
+            return True
+        holder = self._leases.holder(task.name)
+        cap = LEASE_RETRY_MAX_SECONDS
+        if task.cron is None and task.interval_seconds > 0:
+            cap = task.effective_interval()
+        expires_at = holder.get("expires_at")
+        if isinstance(expires_at, (int, float)):
+            cap = min(cap, expires_at - time.time())
+        backoff = LEASE_RETRY_SECONDS * 2 ** min(task._lease_misses, 16)
+        delay = max(LEASE_RETRY_SECONDS, min(backoff, cap))
+        logger.log(
+            logging.INFO if task._lease_misses == 0 else logging.DEBUG,
+            "Task %s skipped: lease held by pid %s on %s; retrying in %.0fs",
+            task.name,
+            holder.get("pid", "?"),
+            holder.get("host", "?"),
+            delay,
+        )
+        task.wait_for_lease(delay)
+        self._schedule(task)
+        return False
+
+    def _release_lease(self, task: ScheduledTask) -> None:
+        """Release the task's cross-process lease, if held."""
+        if self._leases is not None:
+            self._leases.release(task.name)
+
+    def _execute_leased(self, task: ScheduledTask, queued_seconds: Optional[float] = None) -> None:
+        """Execute a task whose lease is held, releasing it afterwards.
+
+        Args:
+            task: Task for which _acquire_lease() returned True.
+            queued_seconds: Time the task waited for a worker.
+        """
+        try:
+            self._execute(task, queued_seconds)
+        finally:
+            self._release_lease(task)
+
+    def _check_acyclic(self, name: str, depends_on: Tuple[str, ...]) -> None:
+        """Reject a registration whose dependencies would form a cycle.
+
+        Args:
+            name: Task being registered.
+            depends_on: Its prerequisite names.
+
+        Raises:
+            ValueError: If ``name`` is reachable from its own prerequisites.
+        """
+        graph = {n: t.depends_on for n, t in self._tasks.items()}
+        graph[name] = depends_on
+        path: List[str] = [name]
+        visited = set()
+
+        def visit(node: str) -> bool:
+            for dep in graph.get(node, ()):
+                path.append(dep)
+                if dep == name:
+                    return True
+                if dep not in visited:
+                    visited.add(dep)
+                    if visit(dep):
+                        return True
+                path.pop()
+            return False
+
+        if visit(name):
+            raise ValueError(f"Dependency cycle: {' -> '.join(path)}")
+
+    def _dependency_failure(self, task: ScheduledTask) -> Optional[str]:
+        """Return why a task must be skipped for a failed prerequisite.
+
+        Args:
+            task: Task about to start.
+
+        Returns:
+            A reason string if any prerequisite's latest result is not a
+            success, or its output reports a problem (see
+            _output_problem()), else None. Prerequisites that never ran do
+            not block.
+        """
+        with self._lock:
+            for dep in task.depends_on:
+                result = self._results.get(dep)
+                if result is None:
+                    continue
+                if result.get("status") != "success":
+                    return f"dependency {dep} {result.get('status')}"
+                problem = _output_problem(result.get("output"))
+                if problem is not None:
+                    return f"dependency {dep} {problem}"
+        return None
+
+    def _run_tasks(self, tasks: List[ScheduledTask]) -> int:
+        """Execute a batch of tasks as a dependency DAG.
+
+        A task becomes ready once every prerequisite selected in the same
+        batch has finished. Tasks whose cross-process lease is held
+        elsewhere are left alone for this cycle. In serial mode ready tasks
+        run one at a time in registration order; in concurrent mode they
+        are submitted to a pool as soon as they become ready, bounded by
+        ``max_workers`` or, when lanes are configured, by the limit of the
+        task's priority lane. Exclusive tasks start only when nothing else
+        is in flight and block other submissions until they finish.
+
+        With lanes, tasks that become due while others are still in
+        flight are admitted into the running cycle (each task at most once
+        per cycle), so a long bulk task never holds back the next critical
+        probe. The time each task spends ready but waiting for a worker is
+        recorded as its lane's queueing delay.
+
+        Args:
+            tasks: Tasks selected for this cycle.
+
+        Returns:
+            Number of tasks executed (skipped tasks are not counted).
+        """
+        selected: Dict[str, ScheduledTask] = {}
+        blockers: Dict[str, set] = {}
+        dependents: Dict[str, List[str]] = collections.defaultdict(list)
+        finished: set = set()
+        ready: Deque[ScheduledTask] = collections.deque()
+        ready_at: Dict[str, float] = {}
+        executed = 0
+
+        def add(batch: List[ScheduledTask]) -> None:
+            for task in batch:
+                selected[task.name] = task
+            now = time.monotonic()
+            for task in batch:
+                deps = {d for d in task.depends_on if d in selected and d not in finished}
+                blockers[task.name] = deps
+                for dep in deps:
+                    dependents[dep].append(task.name)
+                if not deps:
+                    ready.append(task)
+                    ready_at[task.name] = now
+
+        def finish(name: str) -> None:
+            finished.add(name)
+            for child in dependents[name]:
+                blockers[child].discard(name)
+                if not blockers[child]:
+                    ready.append(selected[child])
+                    ready_at[child] = time.monotonic()
+
+        def start(task: ScheduledTask) -> bool:
+            reason = self._dependency_failure(task)
+            if reason is not None:
+                self._record_skipped(task, reason)
+            elif self._acquire_lease(task):
+                return True
+            finish(task.name)
+            return False
+
+        add(tasks)
+        if self._lanes is None and (self._max_workers == 1 or len(tasks) <= 1):
+            while ready:
+                task = ready.popleft()
+                if start(task):
+                    self._execute_leased(task, time.monotonic() - ready_at[task.name])
+                    executed += 1
+                    finish(task.name)
+            return executed
+
+        limits: Dict[str, int] = self._lanes or {}
+        workers = sum(limits.values()) if limits else min(self._max_workers, len(tasks))
+        busy: Dict[str, int] = collections.Counter()
+        in_flight: Dict[Future, ScheduledTask] = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gaia-task") as pool:
+            while ready or in_flight:
+                exclusive_running = any(t.exclusive for t in in_flight.values())
+                waiting: List[ScheduledTask] = []
+                while ready and not exclusive_running and len(in_flight) < workers:
+                    task = ready.popleft()
+                    lane_full = limits and busy[task.priority] >= limits[task.priority]
+                    if lane_full or (task.exclusive and in_flight):
+                        waiting.append(task)
+                        continue
+                    if not start(task):
+                        continue
+                    queued = time.monotonic() - ready_at[task.name]
+                    in_flight[pool.submit(self._execute_leased, task, queued)] = task
+                    busy[task.priority] += 1
+                    executed += 1
+                    exclusive_running = task.exclusive
+                ready.extendleft(reversed(waiting))
+                if not in_flight:
+                    continue
+                done, _ = wait(
+                    in_flight,
+                    timeout=LANE_ADMISSION_POLL_SECONDS if limits else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    task = in_flight.pop(future)
+                    busy[task.priority] -= 1
+                    finish(task.name)
+                if limits and not self._stopping:
+                    add(self._select_due(exclude=selected))
+        return executed
+
+    def _execute(self, task: ScheduledTask, queued_seconds: Optional[float] = None) -> None:
+        """Run a single task, capture its result, and update last_run.
+
+        Args:
+            task: The ScheduledTask to execute.
+            queued_seconds: Time the task waited for a worker, if measured.
+        """
+        changed_paths = self._take_changed_paths(task)
+        fingerprint = _inputs_fingerprint(task)
+        if self._serve_cached(task, fingerprint):
+            return
+        timestamp = datetime.now(timezone.utc).isoformat()
+        usage: Dict[str, Any] = {
+            "queue_seconds": queued_seconds,
+            "inputs_before": _watched_fingerprint(task),
+            "inputs_fingerprint": fingerprint,
+            "changed_paths": changed_paths,
+        }
+        started = time.perf_counter()
+        rss_baseline = self._begin_execution()
+        output: Any = None
+        error: Optional[BaseException] = None
+        try:
+            output = self._call(task, usage)
+        except Exception as exc:  # noqa: BLE001
+            error = exc
+        usage["wall_seconds"] = time.perf_counter() - started
+        usage["rss_delta_kb"] = self._end_execution(rss_baseline)
+        self._record(task, timestamp, output=output, error=error, usage=usage)
+
+    def _begin_execution(self) -> Optional[Tuple[int, float]]:
+        """Count an execution as started and take its RSS baseline.
+
+        Returns:
+            ``(start sequence, peak RSS in KiB)`` if no other task is running
+            in this process, including abandoned hung threads; otherwise None.
+        """
+        with self._hung_lock:
+            hung = any(thread.is_alive() for thread in self._hung_threads.values())
+        with self._executions_lock:
+            self._executions_started += 1
+            alone = self._executions_running == 0 and not hung
+            self._executions_running += 1
+            peak = _peak_rss_kb() if alone else None
+            return None if peak is None else (self._executions_started, peak)
+
+    def _end_execution(self, baseline: Optional[Tuple[int, float]]) -> Optional[float]:
+        """Count an execution as finished and return its peak RSS growth.
+
+        Args:
+            baseline: What _begin_execution() returned for this execution.
+
+        Returns:
+            Growth of the process peak RSS in KiB, or None if the execution
+            overlapped another (the growth could be that task's) or RSS is
+            not measurable on this platform.
+        """
+        with self._executions_lock:
+            self._executions_running -= 1
+            if baseline is None or baseline[0] != self._executions_started:
+                return None
+            after = _peak_rss_kb()
+        return None if after is None else after - baseline[1]
+
+    def _record(
+        self,
+        task: ScheduledTask,
+        timestamp: str,
+        output: Any = None,
+        error: Optional[BaseException] = None,
+        usage: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Store the outcome of one execution and stamp last_run.
+
+        Args:
+            task: The task that just ran.
+            timestamp: ISO 8601 start time of the execution.
+            output: Return value of the task on success.
+            error: Exception raised by the task, or None on success.
+            usage: Measured ``wall_seconds``, ``cpu_seconds``,
+                ``rss_delta_kb`` and ``queue_seconds`` for this execution,
+                plus ``inputs_before`` for adaptive tasks,
+                ``inputs_fingerprint`` for memoized ones and
+                ``changed_paths`` for event-triggered ones.
+        """
+        usage = usage or {}
+        if isinstance(error, TaskTimeoutError):
+            result = {
+                "task": task.name,
+                "status": "timeout",
+                "timestamp": timestamp,
+                "error": str(error),
+            }
+            logger.error("Task %s timed out: %s", task.name, error)
+        elif isinstance(error, BudgetExceededError):
+            result = {
+                "task": task.name,
+                "status": "budget_exceeded",
+                "timestamp": timestamp,
+                "error": str(error),
+                "budget": {"resource": error.resource, "limit": error.limit},
+            }
+            logger.error("Task %s stopped: %s", task.name, error)
+        elif error is not None:
+            result = {
+                "task": task.name,
+                "status": "error",
+                "timestamp": timestamp,
+                "error": str(error),
+            }
+            logger.error("Task %s raised an exception: %s", task.name, error)
+        else:
+            result = {
+                "task": task.name,
+                "status": "success",
+                "timestamp": timestamp,
+                "output": output,
+            }
+            logger.debug("Task %s completed successfully.", task.name)
+        result["duration_seconds"] = usage.get("wall_seconds")
+        result["cpu_seconds"] = usage.get("cpu_seconds")
+        if usage.get("resources") is not None:
+            result["resources"] = usage["resources"]
+        if usage.get("wall_seconds") is not None:
+            self._metrics.observe(
+                task.name,
+                result["status"],
+                wall_seconds=usage["wall_seconds"],
+                cpu_seconds=usage.get("cpu_seconds"),
+                rss_delta_kb=usage.get("rss_delta_kb"),
+            )
+        if usage.get("changed_paths") is not None:
+            changed = usage["changed_paths"]
+            result["events"] = {
+                "changed": len(changed),
+                "paths": changed[:MAX_REPORTED_CHANGED_PATHS],
+            }
+        if usage.get("queue_seconds") is not None:
+            result["queue_seconds"] = usage["queue_seconds"]
+            self._metrics.observe_queue(task.priority, usage["queue_seconds"])
+        if task.retry is not None:
+            result["retry"] = self._update_retry(task, failed=error is not None)
+        if task.adaptive is not None:
+            result["adaptive"] = self._update_adaptive(task, usage.get("inputs_before"))
+        if task.inputs is not None:
+            self._metrics.observe_cache(task.name, hit=False)
+            with self._lock:
+                succeeded = result["status"] == "success"
+                task.memo_fingerprint = usage.get("inputs_fingerprint") if succeeded else None
+        self._store_result(task, result)
+
+    def _serve_cached(self, task: ScheduledTask, fingerprint: Optional[str]) -> bool:
+        """Re-publish a memoized task's last result if its inputs are unchanged.
+
+        Args:
+            task: Task about to run.
+            fingerprint: Current fingerprint of its declared inputs, or None.
+
+        Returns:
+            True if the cached result was recorded and the task must not run.
+        """
+        if fingerprint is None:
+            return False
+        with self._lock:
+            previous = self._results.get(task.name)
+            if (
+                fingerprint != task.memo_fingerprint
+                or previous is None
+                or previous.get("status") != "success"
+            ):
+                return False
+            result = {k: v for k, v in previous.items() if k not in _PER_RUN_RESULT_KEYS}
+        result["timestamp"] = datetime.now(timezone.utc).isoformat()
+        result["cached"] = True
+        result["cached_from"] = previous.get("cached_from", previous.get("timestamp"))
+        self._metrics.observe_cache(task.name, hit=True)
+        if task.adaptive is not None:
+            result["adaptive"] = self._update_adaptive(task, _watched_fingerprint(task))
+        logger.debug("Task %s inputs unchanged; serving cached result.", task.name)
+        self._store_result(task, result)
+        return True
+
+    def _update_adaptive(self, task: ScheduledTask, before: Optional[str]) -> Dict[str, Any]:
+        """Stretch or reset an adaptive task's interval after a run.
+
+        Args:
+            task: Task with an AdaptiveInterval.
+            before: Fingerprint of its inputs taken just before the run.
+
+        Returns:
+            The ``"adaptive"`` entry for the task's result.
+        """
+        policy = task.adaptive
+        assert policy is not None
+        after = _watched_fingerprint(task)
+        with self._lock:
+            changed = task.input_fingerprint is None or before != task.input_fingerprint
+            task.current_interval = policy.next_interval(
+                task.effective_interval(), task.interval_seconds, changed
+            )
+            task.input_fingerprint = after
+            return {"inputs_changed": changed, "interval_seconds": task.current_interval}
+
+    def _update_retry(self, task: ScheduledTask, failed: bool) -> Dict[str, Any]:
+        """Advance a task's backoff state after a run.
+
+        Args:
+            task: Task with a RetryPolicy.
+            failed: Whether the run errored or timed out.
+
+        Returns:
+            The ``"retry"`` entry for the task's result.
+        """
+        policy = task.retry
+        assert policy is not None
+        with self._lock:
+            if not failed:
+                attempt = task.failures + 1
+                task.clear_retry()
+                return {"attempt": attempt, "max_attempts": policy.max_attempts}
+
+            task.failures += 1
+            attempt = task.failures
+            if attempt >= policy.max_attempts:
+                task.clear_retry()
+                logger.warning(
+                    "Task %s failed %d times; retries exhausted until next interval.",
+                    task.name,
+                    attempt,
+                )
+                return {"attempt": attempt, "max_attempts": policy.max_attempts, "exhausted": True}
+
+            delay = policy.delay_for(attempt)
+            task.schedule_retry(delay)
+            logger.info("Task %s will retry in %.1fs (attempt %d).", task.name, delay, attempt + 1)
+            return {
+                "attempt": attempt,
+                "max_attempts": policy.max_attempts,
+                "backoff_seconds": delay,
+                "next_retry_at": datetime.fromtimestamp(task.retry_at, timezone.utc).isoformat(),
+            }
+
+    def _record_skipped(self, task: ScheduledTask, reason: str) -> None:
+        """Record that a task was not run.
+
+        Used when a prerequisite failed and when the ``skip`` misfire policy
+        drops a late run. last_run is still stamped so the task waits a full
+        interval (or its next fire) instead of being re-evaluated on every
+        daemon wake-up.
+
+        Args:
+            task: The skipped task.
+            reason: Human-readable cause, stored under ``"reason"``.
+        """
+        logger.info("Task %s skipped: %s", task.name, reason)
+        with self._lock:
+            # A stale retry deadline would keep the task due forever.
+            task.clear_retry()
+        self._store_result(
+            task,
+            {
+                "task": task.name,
+                "status": "skipped",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "reason": reason,
+            },
+        )
+
+    def _store_result(self, task: ScheduledTask, result: Dict[str, Any]) -> None:
+        """Publish a result, stamp last_run, persist, and reschedule.
+
+        Args:
+            task: Task the result belongs to.
+            result: Result dict for get_results().
+        """
+        with self._lock:
+            task.mark_run()
+            self._results[task.name] = result
+        self._flush_state()
+        if self._history is not None:
+            try:
+                self._history.append(result)
+            except sqlite3.Error as exc:
+                logger.warning("Could not append %s to task history: %s", task.name, exc)
+        for listener in self._result_listeners:
+            try:
+                listener(result)
+            except Exception:  # noqa: BLE001
+                logger.exception("Result listener failed for %s", task.name)
+        self._schedule(task)
+
+    def _restore_state(self, task: ScheduledTask) -> bool:
+        """Apply persisted last_run, enabled, retry and last result to a task.
+
+        Args:
+            task: Freshly constructed task about to enter the registry.
+
+        Returns:
+            True if a cron anchor was restored for the task.
+        """
+        saved = self._saved_state.get(task.name)
+        if not saved:
+            return False
+        last_run = saved.get("last_run")
+        if isinstance(last_run, (int, float)):
+            task.last_run = float(last_run)
+        cron_base = saved.get("cron_base")
+        anchored = task.cron is not None and isinstance(cron_base, (int, float))
+        if anchored:
+            task._cron_base = float(cron_base)
+        if isinstance(saved.get("enabled"), bool):
+            task.enabled = saved["enabled"]
+        if task.adaptive is not None and isinstance(saved.get("input_fingerprint"), str):
+            task.input_fingerprint = saved["input_fingerprint"]
+            interval = saved.get("current_interval")
+            if isinstance(interval, (int, float)):
+                task.current_interval = min(
+                    max(float(interval), task.interval_seconds), task.adaptive.max_interval_seconds
+                )
+        last_result = saved.get("last_result")
+        if (
+            task.inputs is not None
+            and isinstance(saved.get("memo_fingerprint"), str)
+            and isinstance(last_result, dict)
+            and last_result.get("status") == "success"
+        ):
+            task.memo_fingerprint = saved["memo_fingerprint"]
+        if task.misfire == "run_all_missed" and isinstance(saved.get("pending_runs"), int):
+            task.pending_runs = saved["pending_runs"]
+        if task.retry is not None and isinstance(saved.get("failures"), int):
+            task.failures = saved["failures"]
+            if isinstance(saved.get("retry_at"), (int, float)):
+                task.retry_at = float(saved["retry_at"])
+        if isinstance(saved.get("last_result"), dict):
+            with self._lock:
+                self._results[task.name] = saved["last_result"]
+        return anchored
+
+    def _flush_state(self) -> None:
+        """Write the current state of every task to the state store.
+
+        Tasks present in the file but not registered in this process are
+        carried over untouched, so a runner with a partial registry does
+        not erase other tasks' history.
+        """
+        if self._state_store is None:
+            return
+        # Snapshot and write under one lock so concurrent flushes cannot
+        # land on disk out of order.
+        with self._state_flush_lock:
+            with self._lock:
+                snapshot = dict(self._saved_state)
+                for name, task in self._tasks.items():
+                    snapshot[name] = {
+                        "last_run": task.last_run,
+                        "cron_base": task._cron_base if task.cron is not None else None,
+                        "enabled": task.enabled,
+                        "failures": task.failures,
+                        "retry_at": task.retry_at,
+                        "pending_runs": task.pending_runs,
+                        "current_interval": task.current_interval,
+                        "input_fingerprint": task.input_fingerprint,
+                        "memo_fingerprint": task.memo_fingerprint,
+                        "last_result": self._results.get(name),
+                    }
+                self._saved_state = snapshot
+            self._state_store.save(snapshot)
+
+    def _schedule(self, task: ScheduledTask) -> None:
+        """Push the task's next-due time onto the heap and wake the daemon.
+
+        Args:
+            task: Task whose schedule changed (registered, enabled, or run).
+        """
+        with self._wakeup:
+            version = self._heap_versions.get(task.name, 0) + 1
+            self._heap_versions[task.name] = version
+            heapq.heappush(
+                self._heap, (task.next_due(), next(self._heap_seq), task.name, version)
+            )
+            self._wakeup_pending = True
+            self._wakeup.notify_all()
+
+    def _peek_next_due(self) -> Optional[float]:
+        """Return the earliest valid deadline on the heap, pruning stale ones.
+
+        Must be called with ``self._wakeup`` held. Entries for removed,
+        disabled, or superseded tasks are discarded; an entry whose task was
+        rescheduled behind the heap's back (e.g. last_run edited directly)
+        is re-pushed with its current deadline.
+
+        Returns:
+            Monotonic deadline of the next due task, or None.
+        """
+        while self._heap:
+            deadline, _, name, version = self._heap[0]
+            task = self._tasks.get(name)
+            if task is None or not task.enabled or version != self._heap_versions.get(name):
+                heapq.heappop(self._heap)
+                continue
+            actual = task.next_due()
+            if actual > deadline and actual > time.monotonic():
+                heapq.heapreplace(self._heap, (actual, next(self._heap_seq), name, version))
+                continue
+            return min(deadline, actual)
+        return None
+
+    def _wait_until_due(self, min_sleep: float) -> bool:
+        """Block until the next task is due, a wake-up arrives, or stop().
+
+        Args:
+            min_sleep: Lower bound on the sleep, in seconds.
+
+        Returns:
+            False if stop() was requested, True otherwise.
+        """
+        with self._wakeup:
+            self._wakeup_pending = False
+            deadline = None if self._paused else self._peek_next_due()
+            if deadline is None:
+                timeout = DAEMON_MAX_SLEEP_SECONDS
+            else:
+                timeout = max(min_sleep, deadline - time.monotonic())
+                timeout = min(timeout, DAEMON_MAX_SLEEP_SECONDS)
+            if not self._stopping:
+                self._wakeup.wait_for(lambda: self._stopping or self._wakeup_pending, timeout)
+            return not self._stopping
+
+    def _call(self, task: ScheduledTask, usage: Optional[Dict[str, Any]] = None) -> Any:
+        """Invoke a task's callable on the executor it was registered with.
+
+        Args:
+            task: The ScheduledTask to invoke.
+            usage: Optional dict that receives the task's ``cpu_seconds``,
+                measured in whichever thread or process actually ran it.
+
+        Returns:
+            Whatever the task callable returned.
+
+        Raises:
+            Exception: Anything raised by the task, TaskWorkerError when a
+                process task fails or its worker dies, or TaskTimeoutError
+                when the task overruns timeout_seconds.
+        """
+        usage = {} if usage is None else usage
+        if task.budget is not None and BUDGETS_AVAILABLE:
+            return self._call_budgeted(task, usage)
+        if task.executor == "process":
+            return self._call_in_process(task, usage)
+        if task.timeout_seconds is None:
+            return _timed_call(_task_callable(task, usage), usage)
+        return self._call_with_deadline(task, usage)
+
+    def _call_budgeted(self, task: ScheduledTask, usage: Dict[str, Any]) -> Any:
+        """Run a task in a child interpreter under its resource budget.
+
+        Args:
+            task: A task with a budget.
+            usage: Dict receiving the child's ``cpu_seconds`` and a
+                ``resources`` summary of its peak usage.
+
+        Returns:
+            Whatever the task callable returned.
+
+        Raises:
+            BudgetExceededError: If the child hit a limit.
+            TaskTimeoutError: If the task overran timeout_seconds; the
+                child is killed.
+            Exception: BudgetedTaskError if the task failed in the child.
+        """
+        try:
+            return run_with_budget(
+                _task_callable(task, usage), task.budget, task.timeout_seconds, usage
+            )
+        except TimeoutError as exc:
+            raise TaskTimeoutError(
+                f"{task.name} exceeded timeout of {task.timeout_seconds}s; child killed"
+            ) from exc
+
+    def _call_with_deadline(self, task: ScheduledTask, usage: Dict[str, Any]) -> Any:
+        """Run a thread task in a watchdog-joined worker thread.
+
+        On expiry the worker is abandoned (it is a daemon thread, so it will
+        not block interpreter exit), all thread stacks are dumped to the task
+        log, and later executions are refused until the hung run finishes.
+
+        Args:
+            task: A thread task with timeout_seconds set.
+            usage: Dict receiving ``cpu_seconds`` of the worker thread.
+
+        Returns:
+            Whatever the task callable returned.
+
+        Raises:
+            TaskTimeoutError: If the deadline expires or a previous run of
+                the task is still hung.
+        """
+        with self._hung_lock:
+            hung = self._hung_threads.get(task.name)
+            if hung is not None and hung.is_alive():
+                raise TaskTimeoutError(f"previous run of {task.name} is still running")
+            self._hung_threads.pop(task.name, None)
+
+        outcome: Dict[str, Any] = {}
+        fn = _task_callable(task, usage)
+
+        def target() -> None:
+            try:
+                outcome["output"] = _timed_call(fn, usage)
+            except Exception as exc:  # noqa: BLE001
+                outcome["error"] = exc
+            finally:
+                with self._hung_lock:
+                    if self._hung_threads.get(task.name) is threading.current_thread():
+                        del self._hung_threads[task.name]
+
+        worker = threading.Thread(target=target, name=f"gaia-task-{task.name}", daemon=True)
+        worker.start()
+        worker.join(task.timeout_seconds)
+        with self._hung_lock:
+            timed_out = worker.is_alive()
+            if timed_out:
+                self._hung_threads[task.name] = worker
+        if timed_out:
+            _log_thread_stacks(task.name)
+            raise TaskTimeoutError(
+                f"{task.name} exceeded timeout of {task.timeout_seconds}s"
+            )
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome.get("output")
+
+    def _call_in_process(self, task: ScheduledTask, usage: Dict[str, Any]) -> Any:
+        """Run a task in the process pool and unmarshal its outcome.
+
+        A worker that dies mid-task (segfault, ``os._exit``, OOM kill) breaks
+        the whole pool; the broken pool is discarded so the next process task
+        starts a fresh one, and the crash surfaces as a task error.
+
+        Args:
+            task: A task registered with ``executor="process"``.
+            usage: Dict receiving the worker's ``cpu_seconds``.
+
+        Returns:
+            The (pickle-safe) value returned by the task.
+
+        Raises:
+            TaskWorkerError: If the task raised in the worker or the worker
+                process crashed.
+            TaskTimeoutError: If the task overran timeout_seconds; the pool's
+                workers are terminated and the pool replaced.
+        """
+        pool = self._get_process_pool()
+        try:
+            status, payload, usage["cpu_seconds"] = pool.submit(
+                _run_in_worker, _task_callable(task, usage)
+            ).result(
+                timeout=task.timeout_seconds
+            )
+        except BrokenProcessPool as exc:
+            self._discard_process_pool(pool)
+            raise TaskWorkerError(f"worker process crashed: {exc}") from exc
+        except FuturesTimeoutError as exc:
+            self._discard_process_pool(pool, terminate=True)
+            raise TaskTimeoutError(
+                f"{task.name} exceeded timeout of {task.timeout_seconds}s; worker terminated"
+            ) from exc
+        if status == "error":
+            raise TaskWorkerError(payload)
+        return payload
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Return the shared process pool, creating it on first use."""
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(max_workers=self._max_processes)
+            return self._process_pool
+
+    def _discard_process_pool(self, pool: ProcessPoolExecutor, terminate: bool = False) -> None:
+        """Drop a process pool so the next submit creates a new one.
+
+        Args:
+            pool: The pool to discard.
+            terminate: Kill its worker processes first. Used for hung
+                workers, which ``shutdown()`` alone would leave running; any
+                other task in flight on the same pool is reported as crashed.
+        """
+        with self._process_pool_lock:
+            if self._process_pool is pool:
+                self._process_pool = None
+        if terminate:
+            # ProcessPoolExecutor has no public way to kill a running worker.
+            for process in list((getattr(pool, "_processes", None) or {}).values()):
+                process.terminate()
+        pool.shutdown(wait=False)
+
+    def _register_default_tasks(self) -> None:
+        """Register the 5 built-in GAIA maintenance tasks."""
+        # Heavy daily work runs off-peak at 03:00 local time.
+        self.register(
+            "warden_scan",
+            _task_warden_scan,
+            schedule="0 3 * * *",
+            executor="process",
+            priority="bulk",
+        )
+        # Probes back off while the registry and change log stay quiet.
+        watched = (Path(_GAIA_ROOT) / "registry.json", Path(_GAIA_ROOT) / ".gaia_changes")
+        self.register(
+            "health_check",
+            _task_health_check,
+            interval_seconds=3600,
+            priority="critical",
+            adaptive=AdaptiveInterval(watch=watched, max_interval_seconds=4 * 3600),
+        )
+        # Fixed interval: staleness and the byte budget move with source edits,
+        # builds and time, none of which the registry or change log reflect.
+        self.register(
+            "stale_cache_cleanup",
+            _task_stale_cache_cleanup,
+            interval_seconds=900,
+            priority="bulk",
+        )
+        self.register(
+            "guardrail_check",
+            _task_guardrail_check,
+            interval_seconds=21600,
+            executor="process",
+            depends_on=["health_check"],
+        )
+        self.register(
+            "baseline_update",
+            _task_baseline_update,
+            schedule="0 3 * * *",
+            depends_on=["warden_scan", "guardrail_check"],
+        )
+
+
+# ---------------------------------------------------------------------------
+# AsyncTaskRunner
+# ---------------------------------------------------------------------------
+
+
+class _AsyncExclusiveGate:
+    """Reader/writer gate: shared tasks overlap, exclusive tasks run alone."""
+
+    def __init__(self) -> None:
+        self._cond = asyncio.Condition()
+        self._shared = 0
+        self._exclusive = False
+
+    @contextlib.asynccontextmanager
+    async def hold(self, exclusive: bool) -> AsyncIterator[None]:
+        """Hold the gate in shared or exclusive mode for the block."""
+        async with self._cond:
+            if exclusive:
+                await self._cond.wait_for(lambda: not self._exclusive and self._shared == 0)
+                self._exclusive = True
+            else:
+                await self._cond.wait_for(lambda: not self._exclusive)
+                self._shared += 1
+        try:
+            yield
+        finally:
+            async with self._cond:
+                if exclusive:
+                    self._exclusive = False
+                else:
+                    self._shared -= 1
+                self._cond.notify_all()
+
+
+class AsyncTaskRunner(TaskRunner):
+    """asyncio sibling of TaskRunner for I/O-bound probes.
 
-        if register_defaults:
-            self._register_default_tasks()
+    Shares the registry, results, and process pool of TaskRunner, but
+    ``run_once``/``run_all`` are coroutines. ``async def`` tasks are awaited
+    directly and due tasks run concurrently via ``asyncio.gather`` under a
+    semaphore; synchronous tasks are wrapped with ``asyncio.to_thread`` and
+    process tasks are awaited from a thread the same way.
 
-    # ------------------------------------------------------------------
-    # Public API
-    # ------------------------------------------------------------------
+    Args:
+        register_defaults: When True (default) the 5 built-in GAIA
+            maintenance tasks are pre-registered on construction.
+        max_concurrency: Maximum number of tasks in flight at once.
+        max_processes: Worker count for the process executor.
+        lock_dir: Directory for the daemon lock and task leases, or None.
+        lanes: Per-priority concurrency limits within max_concurrency, or
+            None.
+
+    The remaining keyword arguments (state_path, metrics_window,
+    history_path, lease_seconds, cycle_budget_seconds, watch_backend) mean
+    the same as for TaskRunner.
+    """
 
-    def register(
+    def __init__(
         self,
-        name: str,
-        fn: Callable[[], Any],
-        interval_seconds: float,
+        register_defaults: bool = True,
+        max_concurrency: int = 100,
+        max_processes: Optional[int] = None,
+        lock_dir: Optional[Union[str, Path]] = None,
+        lanes: Optional[Dict[str, int]] = None,
+        state_path: Optional[Union[str, Path]] = None,
+        metrics_window: int = 256,
+        history_path: Optional[Union[str, Path]] = None,
+        lease_seconds: float = 3600.0,
+        cycle_budget_seconds: Optional[float] = None,
+        watch_backend: str = "auto",
     ) -> None:
-        """Add or replace a task in the registry.
+        """Initialise the runner, optionally loading default tasks.
 
         Args:
-            name: Unique task identifier. Re-registering an existing name
-                replaces the previous entry.
-            fn: Zero-argument callable executed when the task is due.
-            interval_seconds: Minimum seconds between executions.
-                Pass 0 to execute on every run_once call.
+            register_defaults: Pre-register the 5 built-in tasks when True.
+            max_concurrency: Semaphore size bounding in-flight tasks.
+            max_processes: Worker count for the process executor.
+            lock_dir: Directory for the daemon lock and task leases.
+            lanes: Per-priority concurrency limits.
+            state_path: JSON state file to restore from and flush to.
+            metrics_window: Samples per task kept for latency percentiles.
+            history_path: SQLite history database, or None.
+            lease_seconds: Default per-task lease duration.
+            cycle_budget_seconds: Per-cycle wall-time budget, or None.
+            watch_backend: Backend for filesystem-event triggers.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
-        self._tasks[name] = ScheduledTask(
-            name=name,
-            interval_seconds=interval_seconds,
-            fn=fn,
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        super().__init__(
+            register_defaults=register_defaults,
+            max_workers=max_concurrency,
+            max_processes=max_processes,
+            state_path=state_path,
+            metrics_window=metrics_window,
+            history_path=history_path,
+            lock_dir=lock_dir,
+            lease_seconds=lease_seconds,
+            lanes=lanes,
+            cycle_budget_seconds=cycle_budget_seconds,
+            watch_backend=watch_backend,
         )
 
-    def run_once(self) -> int:
+    async def run_once(self) -> int:  # type: ignore[override]
         """Execute all enabled tasks that are currently due.
 
-        Exceptions raised by individual tasks are caught, logged, and stored
-        in results; they do not propagate to the caller.
-
         Returns:
-            Number of tasks that were executed (attempted, whether or not
-            they succeeded).
+            Number of tasks executed.
         """
-        executed = 0
-        for task in self._tasks.values():
-            if not task.enabled:
-                continue
-            if not task.is_due():
-                continue
-            self._execute(task)
-            executed += 1
-        return executed
+        started = time.monotonic()
+        try:
+            return await self._run_tasks_async(self._select_due())
+        finally:
+            self._last_cycle_seconds = time.monotonic() - started
 
-    def run_all(self) -> int:
+    async def run_all(self) -> int:  # type: ignore[override]
         """Force-execute every enabled task regardless of interval.
 
-        Ignores last_run — useful for ad-hoc maintenance runs.
-
         Returns:
             Number of tasks executed.
         """
-        executed = 0
-        for task in self._tasks.values():
-            if not task.enabled:
-                continue
-            self._execute(task)
-            executed += 1
-        return executed
+        return await self._run_tasks_async([t for t in self._tasks.values() if t.enabled])
 
-    def list_tasks(self) -> List[ScheduledTask]:
-        """Return all registered tasks.
+    async def run_forever(self, min_sleep: float = DAEMON_MIN_SLEEP_SECONDS) -> None:  # type: ignore[override]
+        """Async counterpart of TaskRunner.run_forever().
 
-        Returns:
-            List of ScheduledTask instances in registration order.
+        The heap wait blocks on a condition variable, so it is awaited from
+        a worker thread to keep the event loop free.
+
+        Args:
+            min_sleep: Lower bound on each sleep, in seconds.
         """
-        return list(self._tasks.values())
+        self._acquire_daemon_lock()
+        try:
+            with self._wakeup:
+                self._stopping = False
+            self.start_watching()
+            while True:
+                count = await self.run_once()
+                if count:
+                    logger.info("Daemon cycle: executed %d due tasks.", count)
+                if not await asyncio.to_thread(self._wait_until_due, min_sleep):
+                    return
+        finally:
+            self.stop_watching()
+            self._release_daemon_lock()
 
-    def get_results(self) -> Dict[str, Dict[str, Any]]:
-        """Return the results from the most recent execution of each task.
+    async def _run_tasks_async(self, tasks: List[ScheduledTask]) -> int:
+        """Gather all tasks, each waiting on its in-batch prerequisites.
+
+        Every task first awaits the completion events of prerequisites in
+        the same batch, then the shared/exclusive gate, then the semaphore
+        and its priority lane's semaphore, so a waiting dependent never
+        holds a concurrency slot.
+
+        Args:
+            tasks: Tasks selected for this cycle.
 
         Returns:
-            Dict mapping task name to a result dict containing at minimum
-            ``status`` (``"success"`` | ``"error"``) and ``timestamp`` (ISO
-            8601 string). Error results also include an ``"error"`` key with
-            the exception message. Successful results may include an
-            ``"output"`` key with whatever the task callable returned.
+            Number of tasks executed (skipped tasks are not counted).
         """
-        return dict(self._results)
+        semaphore = asyncio.Semaphore(self._max_workers)
+        lanes = self._lanes or dict.fromkeys(PRIORITIES, self._max_workers)
+        lane_semaphores = {priority: asyncio.Semaphore(limit) for priority, limit in lanes.items()}
+        gate = _AsyncExclusiveGate()
+        done = {t.name: asyncio.Event() for t in tasks}
+
+        async def run(task: ScheduledTask) -> bool:
+            try:
+                for dep in task.depends_on:
+                    if dep in done:
+                        await done[dep].wait()
+                reason = self._dependency_failure(task)
+                if reason is not None:
+                    self._record_skipped(task, reason)
+                    return False
+                if not self._acquire_lease(task):
+                    return False
+                ready_at = time.monotonic()
+                try:
+                    async with gate.hold(task.exclusive), semaphore, lane_semaphores[task.priority]:
+                        await self._execute_async(task, time.monotonic() - ready_at)
+                finally:
+                    self._release_lease(task)
+                return True
+            finally:
+                done[task.name].set()
+
+        outcomes = await asyncio.gather(*(run(t) for t in tasks))
+        return sum(outcomes)
+
+    async def _await_with_deadline(self, task: ScheduledTask, usage: Dict[str, Any]) -> Any:
+        """Await a coroutine task, cancelling it if it overruns its timeout.
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
+        Args:
+            task: A task whose fn is a coroutine function.
+            usage: Execution details (``changed_paths`` for event tasks).
 
-    def _execute(self, task: ScheduledTask) -> None:
-        """Run a single task, capture its result, and update last_run.
+        Returns:
+            Whatever the coroutine returned.
+
+        Raises:
+            TaskTimeoutError: If timeout_seconds elapses first.
+        """
+        fn = _task_callable(task, usage)
+        if task.timeout_seconds is None:
+            return await fn()
+        try:
+            return await asyncio.wait_for(fn(), task.timeout_seconds)
+        except asyncio.TimeoutError as exc:
+            _log_thread_stacks(task.name)
+            raise TaskTimeoutError(
+                f"{task.name} exceeded timeout of {task.timeout_seconds}s; cancelled"
+            ) from exc
+
+    async def _execute_async(self, task: ScheduledTask, queued_seconds: Optional[float] = None) -> None:
+        """Await a single task and record its result.
 
         Args:
             task: The ScheduledTask to execute.
+            queued_seconds: Time the task waited for a concurrency slot.
         """
+        changed_paths = self._take_changed_paths(task)
+        fingerprint = await asyncio.to_thread(_inputs_fingerprint, task) if task.inputs else None
+        if self._serve_cached(task, fingerprint):
+            return
         timestamp = datetime.now(timezone.utc).isoformat()
+        # CPU time is not attributable to one coroutine on a shared loop,
+        # so only sync tasks (measured in their thread) report it.
+        usage: Dict[str, Any] = {
+            "queue_seconds": queued_seconds,
+            "inputs_before": _watched_fingerprint(task),
+            "inputs_fingerprint": fingerprint,
+            "changed_paths": changed_paths,
+        }
+        started = time.perf_counter()
+        rss_baseline = self._begin_execution()
+        output: Any = None
+        error: Optional[BaseException] = None
         try:
-            output = task.fn()
-            task.last_run = time.time()
-            self._results[task.name] = {
-                "task": task.name,
-                "status": "success",
-                "timestamp": timestamp,
-                "output": output,
-            }
-            logger.debug("Task %s completed successfully.", task.name)
+            if inspect.iscoroutinefunction(task.fn):
+                output = await self._await_with_deadline(task, usage)
+            else:
+                output = await asyncio.to_thread(self._call, task, usage)
         except Exception as exc:  # noqa: BLE001
-            task.last_run = time.time()
-            self._results[task.name] = {
-                "task": task.name,
-                "status": "error",
-                "timestamp": timestamp,
-                "error": str(exc),
-            }
-            logger.error("Task %s raised an exception: %s", task.name, exc)
-
-    def _register_default_tasks(self) -> None:
-        """Register the 5 built-in GAIA maintenance tasks."""
-        self.register("warden_scan", _task_warden_scan, interval_seconds=86400)
-        self.register("health_check", _task_health_check, interval_seconds=3600)
-        self.register("stale_cache_cleanup", _task_stale_cache_cleanup, interval_seconds=900)
-        self.register("guardrail_check", _task_guardrail_check, interval_seconds=21600)
-        self.register("baseline_update", _task_baseline_update, interval_seconds=86400)
+            error = exc
+        usage["wall_seconds"] = time.perf_counter() - started
+        usage["rss_delta_kb"] = self._end_execution(rss_baseline)
+        self._record(task, timestamp, output=output, error=error, usage=usage)
 
 
 # ---------------------------------------------------------------------------
@@ -222,16 +2582,79 @@ class TaskRunner:
 
 _GAIA_ROOT = "X:/Projects/_GAIA"
 
+#: Default scheduler state file name, stored under the GAIA root.
+STATE_FILENAME = ".gaia_task_state.json"
+
+#: Default execution history database name, stored under the GAIA root.
+HISTORY_FILENAME = ".gaia_task_history.db"
+
+#: Default lock directory name (daemon lock + task leases) under the GAIA root.
+LOCK_DIRNAME = ".gaia_task_locks"
+
+#: Default control socket of a ``--daemon`` runner, relative to _GAIA_ROOT.
+CONTROL_SOCKET_FILENAME = ".gaia_task_runner.sock"
+
+#: Registry projects probed concurrently by the health check.
+HEALTH_PROBE_WORKERS = 8
+
+#: Seconds one project probe may take before it is reported as timed out.
+HEALTH_PROBE_TIMEOUT_SECONDS = 10.0
+
+#: Per-project health fingerprints and results, stored under the GAIA root.
+HEALTH_CACHE_FILENAME = ".gaia_health_cache.json"
+
+#: Subtrees stale_cache_cleanup never searches for __pycache__ directories.
+CACHE_CLEANUP_PRUNE = PruneRules()
+
+#: Top-level GAIA subtrees searched concurrently by stale_cache_cleanup.
+CACHE_CLEANUP_WORKERS = 4
+
+#: What stale_cache_cleanup removes: orphaned bytecode, __pycache__ folders
+#: untouched for 24 h, and least recently used files beyond 512 MiB in total.
+CACHE_CLEANUP_POLICY = BytecodePolicy(
+    max_age_seconds=86400.0, remove_orphans=True, max_total_bytes=512 * 1024 * 1024
+)
+
+#: warden_scan's per-file size/mtime/BLAKE2 manifest, stored under the GAIA root.
+WARDEN_MANIFEST_FILENAME = ".gaia_warden_manifest.json"
+
+#: Subtrees warden_scan does not scan: VCS internals, dependencies, caches,
+#: virtualenvs and the runner's lock directory. Unlike the cache cleanup,
+#: ``archive`` is still scanned.
+WARDEN_SCAN_PRUNE = PruneRules(names=DEFAULT_PRUNE | {LOCK_DIRNAME})
+
+#: Files warden_scan skips: the runner's own state, history, caches and loop
+#: log, which change on every run (the patterns also cover atomic-write
+#: temporaries and SQLite journals).
+WARDEN_SCAN_IGNORE = tuple(
+    f"*{name}*"
+    for name in (
+        STATE_FILENAME,
+        HISTORY_FILENAME,
+        HEALTH_CACHE_FILENAME,
+        WARDEN_MANIFEST_FILENAME,
+        ".gaia_loop_log",
+    )
+)
+
 
 def _task_warden_scan() -> Dict[str, Any]:
     """Run WARDEN SecretScanner on the GAIA root directory.
 
     Attempts to import ``warden.scanner.SecretScanner``; falls back to a
-    warning result when WARDEN is not installed.
+    warning result when WARDEN is not installed. Scanners with a
+    ``scan_file`` method are run incrementally: only files whose content
+    changed since the previous run (per WARDEN_MANIFEST_FILENAME, see
+    task_manifest) are handed to it and cached findings are merged back; a
+    new scanner version or rule set forces a full rescan. Scanners that
+    only offer ``scan(root)`` walk the whole tree every run, without a
+    manifest.
 
     Returns:
-        Result dict with keys ``task``, ``status``, ``message``, and
-        ``timestamp``.
+        Result dict with keys ``task``, ``status``, ``message``,
+        ``timestamp``, ``issues``, ``mode`` (``"incremental"`` or
+        ``"full"``) and, for incremental scans, ``manifest`` (files,
+        rescanned, hashed, removed, errors, full_rescan).
     """
     from pathlib import Path
 
@@ -253,13 +2676,47 @@ def _task_warden_scan() -> Dict[str, Any]:
         from warden.scanner import SecretScanner  # type: ignore[import]
 
         scanner = SecretScanner()
-        issues = scanner.scan(Path(_GAIA_ROOT))
+        scan_file = getattr(scanner, "scan_file", None)
+        if not callable(scan_file):
+            # scan() walks a directory; per-file results from it cannot be
+            # trusted, so scanners without scan_file get the full scan.
+            logger.info("warden_scan: scanner has no scan_file; running a full scan")
+            issues = len(scanner.scan(Path(_GAIA_ROOT)))
+            return {
+                "task": "warden_scan",
+                "status": "success",
+                "message": f"{issues} issues found (full scan, no manifest)",
+                "timestamp": timestamp,
+                "issues": issues,
+                "mode": "full",
+            }
+        manifest = ScanManifest(Path(_GAIA_ROOT) / WARDEN_MANIFEST_FILENAME)
+        outcome = manifest.update(
+            _GAIA_ROOT,
+            lambda path: scan_file(Path(path)),
+            scanner_identity(scanner),
+            prune=WARDEN_SCAN_PRUNE,
+            ignore=WARDEN_SCAN_IGNORE,
+        )
+        issues = count_findings(outcome.pop("findings"))
+        mode = "full rescan" if outcome["full_rescan"] else "incremental"
+        logger.info(
+            "warden_scan: %s scan, %d of %d files scanned",
+            mode,
+            outcome["rescanned"],
+            outcome["files"],
+        )
         return {
             "task": "warden_scan",
             "status": "success",
-            "message": f"{len(issues)} issues found",
+            "message": (
+                f"{issues} issues found ({mode}: "
+                f"{outcome['rescanned']} of {outcome['files']} files scanned)"
+            ),
             "timestamp": timestamp,
-            "issues": len(issues),
+            "issues": issues,
+            "mode": "incremental",
+            "manifest": outcome,
         }
     except ImportError:
         return {
@@ -273,9 +2730,16 @@ def _task_warden_scan() -> Dict[str, Any]:
 def _task_health_check() -> Dict[str, Any]:
     """Check git status of all submodule paths listed in registry.json.
 
+    Projects are probed concurrently (see task_probe); a project on an
+    unresponsive mount is reported with an ``"error"`` after
+    HEALTH_PROBE_TIMEOUT_SECONDS instead of stalling the whole check.
+    Results are cached in HEALTH_CACHE_FILENAME per project fingerprint,
+    so only projects that changed since the previous run are re-probed.
+
     Returns:
         Result dict with per-component health booleans plus top-level
-        ``task``, ``status``, ``message``, and ``timestamp`` keys.
+        ``task``, ``status``, ``message``, ``timestamp`` and ``from_cache``
+        (components served from the fingerprint cache) keys.
     """
     import json
     from pathlib import Path
@@ -292,60 +2756,96 @@ def _task_health_check() -> Dict[str, Any]:
         }
 
     registry = json.loads(registry_path.read_text(encoding="utf-8"))
-    components: Dict[str, Any] = {}
-
-    for key, project in registry.get("projects", {}).items():
-        path = Path(project.get("path", ""))
-        components[key] = {
-            "exists": path.exists(),
-            "has_git": (path / ".git").exists() if path.exists() else False,
-            "has_tests": bool(list(path.glob("tests/test_*.py"))) if path.exists() else False,
-            "has_claude_md": (path / "CLAUDE.md").exists() if path.exists() else False,
-        }
+    cache_store = TaskStateStore(Path(_GAIA_ROOT) / HEALTH_CACHE_FILENAME)
+    components, cache, from_cache = probe_projects_cached(
+        _registry_project_paths(registry),
+        cache_store.load(),
+        max_workers=HEALTH_PROBE_WORKERS,
+        timeout=HEALTH_PROBE_TIMEOUT_SECONDS,
+    )
+    cache_store.save(cache)
+    message = f"{len(components)} components checked ({from_cache} from cache)"
+    timed_out = sum(1 for health in components.values() if "error" in health)
+    if timed_out:
+        message += f", {timed_out} probes failed or timed out"
 
     return {
         "task": "health_check",
         "status": "success",
-        "message": f"{len(components)} components checked",
+        "message": message,
         "timestamp": timestamp,
         "components": components,
+        "from_cache": from_cache,
     }
 
 
-def _task_stale_cache_cleanup() -> Dict[str, Any]:
-    """Remove __pycache__ directories older than 24 hours across GAIA root.
+def _registry_project_paths(registry: Dict[str, Any]) -> Dict[str, str]:
+    """Return project key to folder, in registry order."""
+    return {key: project.get("path", "") for key, project in registry.get("projects", {}).items()}
+
+
+def _probe_registry(registry: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Probe every registry project concurrently, with a per-project deadline.
+
+    Args:
+        registry: Parsed registry.json.
 
     Returns:
-        Result dict with ``removed`` count plus ``task``, ``status``,
-        ``message``, and ``timestamp`` keys.
+        Project key to health booleans, in registry order. Projects whose
+        probe timed out or failed also carry an ``"error"`` message.
     """
-    from pathlib import Path
+    return probe_projects(
+        _registry_project_paths(registry),
+        max_workers=HEALTH_PROBE_WORKERS,
+        timeout=HEALTH_PROBE_TIMEOUT_SECONDS,
+    )
 
-    timestamp = datetime.now(timezone.utc).isoformat()
-    gaia_root = Path(_GAIA_ROOT)
-    cutoff = time.time() - 86400  # 24 hours
-    removed = 0
-    scanned = 0
 
-    for cache_dir in gaia_root.rglob("__pycache__"):
-        scanned += 1
-        try:
-            stat = cache_dir.stat()
-            if stat.st_mtime < cutoff:
-                # Remove .pyc files inside; leave directory skeleton
-                for pyc in cache_dir.glob("*.pyc"):
-                    pyc.unlink(missing_ok=True)
-                    removed += 1
-        except OSError:
-            pass
+def _task_stale_cache_cleanup(dry_run: bool = False) -> Dict[str, Any]:
+    """Evict stale, orphaned and over-budget bytecode across GAIA root.
+
+    The search skips CACHE_CLEANUP_PRUNE subtrees (``.git``, virtualenvs,
+    ``node_modules``, ``archive``...) and walks top-level subtrees in
+    parallel (see task_walk). What is removed is decided by
+    CACHE_CLEANUP_POLICY (see task_pycache); ``__pycache__`` folders
+    themselves are left in place.
+
+    Args:
+        dry_run: Report what would be removed without deleting anything
+            (``--cache-report`` on the CLI).
+
+    Returns:
+        Result dict with ``scanned`` folders, ``removed`` count,
+        ``bytes_reclaimed`` and the policy ``report`` plus ``task``,
+        ``status``, ``message``, and ``timestamp`` keys.
+    """
+    timestamp = datetime.now(timezone.utc).isoformat()
+    cache_dirs = find_dirs(
+        _GAIA_ROOT,
+        {"__pycache__"},
+        prune=CACHE_CLEANUP_PRUNE,
+        max_workers=CACHE_CLEANUP_WORKERS,
+    )
+    report = evict_bytecode(scan_bytecode(cache_dirs), CACHE_CLEANUP_POLICY, dry_run=dry_run)
 
+    scanned = len(cache_dirs)
+    removed = report["removed"]
+    reasons = ", ".join(
+        f"{counts['files']} {reason}" for reason, counts in report["by_reason"].items()
+    )
+    verb = "would remove" if dry_run else "removed"
     return {
         "task": "stale_cache_cleanup",
         "status": "success",
-        "message": f"Scanned {scanned} __pycache__ dirs, removed {removed} stale .pyc files",
+        "message": (
+            f"Scanned {scanned} __pycache__ dirs, {verb} {removed} .pyc files "
+            f"({reasons}; {report['bytes_reclaimed'] / (1024 * 1024):.1f} MiB)"
+        ),
         "timestamp": timestamp,
         "scanned": scanned,
         "removed": removed,
+        "bytes_reclaimed": report["bytes_reclaimed"],
+        "report": report,
     }
 
 
@@ -423,29 +2923,74 @@ def register_task(
 ) -> None:
     """Register a background task in the module-level registry (legacy API).
 
+    The schedule is parsed with ``runtime.task_cron.parse_schedule`` so
+    run_due_once() can honour it. Strings it does not understand are kept
+    for display only, and such tasks count as always due.
+
     Args:
         name: Unique task identifier.
         func: Callable to execute.
-        schedule: Human-readable schedule string (e.g. ``"hourly"``, ``"daily"``).
+        schedule: Schedule string: a legacy word (``"hourly"``,
+            ``"daily"``), an ``@alias`` or a five-field cron expression.
         description: Human-readable description.
     """
+    try:
+        cron: Optional[CronSchedule] = parse_schedule(schedule)
+    except ValueError as exc:
+        logger.warning("Task %s: schedule not interpreted (%s)", name, exc)
+        cron = None
     REGISTERED_TASKS[name] = {
         "func": func,
         "schedule": schedule,
         "description": description,
         "last_run": None,
         "last_status": None,
+        "cron": cron,
+        "next_run": cron.next_fire(time.time()) if cron else None,
     }
 
 
 def run_all_once() -> Dict[str, Any]:
     """Execute every task in the module-level registry exactly once.
 
+    Returns:
+        Dict mapping task name to its return value (or error dict).
+    """
+    return _run_legacy_tasks(list(REGISTERED_TASKS))
+
+
+def run_due_once() -> Dict[str, Any]:
+    """Execute module-level tasks whose schedule has come round.
+
+    A task is due once its ``next_run`` (the first fire time after
+    registration or after its previous run) has passed. Tasks with an
+    uninterpreted schedule are always due.
+
+    Returns:
+        Dict mapping each executed task name to its return value (or
+        error dict).
+    """
+    now = time.time()
+    due = [
+        name
+        for name, task in REGISTERED_TASKS.items()
+        if task.get("next_run") is None or task["next_run"] <= now
+    ]
+    return _run_legacy_tasks(due)
+
+
+def _run_legacy_tasks(names: List[str]) -> Dict[str, Any]:
+    """Run the named module-level tasks serially, updating their records.
+
+    Args:
+        names: Keys of REGISTERED_TASKS to execute, in order.
+
     Returns:
         Dict mapping task name to its return value (or error dict).
     """
     results: Dict[str, Any] = {}
-    for name, task in REGISTERED_TASKS.items():
+    for name in names:
+        task = REGISTERED_TASKS[name]
         logger.info("Running task: %s", name)
         try:
             result = task["func"]()
@@ -456,6 +3001,8 @@ def run_all_once() -> Dict[str, Any]:
             task["last_status"] = f"error: {exc}"
             logger.error("Task %s failed: %s", name, exc)
             results[name] = {"error": str(exc)}
+        if task.get("cron") is not None:
+            task["next_run"] = task["cron"].next_fire(time.time())
     return results
 
 
@@ -493,18 +3040,7 @@ def task_health_check() -> Any:
         return {"error": "Registry not found"}
 
     registry = json.loads(registry_path.read_text(encoding="utf-8"))
-    health: Dict[str, Any] = {}
-
-    for key, project in registry.get("projects", {}).items():
-        path = Path(project.get("path", ""))
-        health[key] = {
-            "exists": path.exists(),
-            "has_git": (path / ".git").exists() if path.exists() else False,
-            "has_tests": bool(list(path.glob("tests/test_*.py"))) if path.exists() else False,
-            "has_claude_md": (path / "CLAUDE.md").exists() if path.exists() else False,
-        }
-
-    return health
+    return _probe_registry(registry)
 
 
 def task_stale_cache_cleanup() -> Any:
@@ -551,56 +3087,477 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         "--all", dest="run_all", action="store_true", help="Force all tasks and exit"
     )
     group.add_argument("--list", action="store_true", help="List registered tasks")
+    group.add_argument(
+        "--history",
+        nargs="?",
+        const="",
+        metavar="TASK",
+        help="Show stored runs and aggregates for TASK (or all tasks) and exit",
+    )
+    group.add_argument(
+        "--cache-report",
+        action="store_true",
+        help="Show what stale_cache_cleanup would remove (dry run) and exit",
+    )
     group.add_argument(
         "--daemon",
         action="store_true",
-        help="Loop forever, running due tasks every minute (Ctrl-C to stop)",
+        help="Loop forever, sleeping until the next task is due (Ctrl-C to stop)",
+    )
+    parser.add_argument(
+        "--state-dir",
+        default=None,
+        metavar="DIR",
+        help=(
+            "Directory for the state file, history database, locks and control socket "
+            "(default: the GAIA root if it exists; otherwise none of them are kept)"
+        ),
+    )
+    parser.add_argument(
+        "--state",
+        default=None,
+        help="Scheduler state file (default: <state dir>/.gaia_task_state.json)",
+    )
+    parser.add_argument(
+        "--no-state",
+        action="store_true",
+        help="Do not load or persist scheduler state",
+    )
+    parser.add_argument(
+        "--since",
+        default="7d",
+        help="With --history: only runs newer than this (e.g. 12h, 7d; default 7d)",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="With --history: maximum number of individual runs to show",
+    )
+    parser.add_argument(
+        "--history-db",
+        default=None,
+        help="Execution history database (default: <state dir>/.gaia_task_history.db)",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record execution history",
+    )
+    parser.add_argument(
+        "--cycle-budget",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Defer bulk tasks after a cycle that took longer than this",
+    )
+    parser.add_argument(
+        "--lock-dir",
+        default=None,
+        help="Directory for the daemon lock and task leases (default: <state dir>/.gaia_task_locks)",
+    )
+    parser.add_argument(
+        "--no-lock",
+        action="store_true",
+        help="Do not coordinate with other runner processes",
+    )
+    parser.add_argument(
+        "--control-socket",
+        default=None,
+        help=(
+            "In daemon mode, accept 'ctl' commands on this Unix socket "
+            "(default: <state dir>/.gaia_task_runner.sock)"
+        ),
+    )
+    parser.add_argument(
+        "--no-control",
+        action="store_true",
+        help="In daemon mode, do not open the control socket",
+    )
+    parser.add_argument(
+        "--format",
+        dest="output_format",
+        choices=("json", "ndjson"),
+        default="json",
+        help=(
+            "Result output: one indented JSON document after all tasks finish (default), "
+            "or one compact line per task as it completes"
+        ),
+    )
+    parser.add_argument(
+        "--fields",
+        type=_parse_fields,
+        default=None,
+        metavar="LIST",
+        help=(
+            "Comma-separated result keys to keep (dotted for nested, e.g. "
+            "task,status,output.status), or to drop when prefixed with '-' "
+            "(e.g. --fields=-output.components)"
+        ),
+    )
+    parser.add_argument(
+        "--stats",
+        nargs="?",
+        const="json",
+        choices=("json", "prometheus"),
+        help="After running, print per-task latency/CPU/RSS stats (default format: json)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="In daemon mode, serve /metrics (Prometheus) and /stats (JSON) on this port",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Run up to N due tasks concurrently (default: 1, serial)",
+    )
+    parser.add_argument(
+        "--lanes",
+        type=_parse_lanes,
+        default=None,
+        metavar="SPEC",
+        help=(
+            "Per-priority worker limits instead of --workers, e.g. "
+            "critical=2,normal=1,bulk=1 (default: off)"
+        ),
     )
     return parser
 
 
+def _state_dir(explicit: Optional[str]) -> Optional[Path]:
+    """Return the directory the CLI keeps state, history and locks in.
+
+    Args:
+        explicit: ``--state-dir`` value, or None.
+
+    Returns:
+        The explicit directory (created if missing), else the GAIA root
+        when it exists, else None: a runner started outside a GAIA
+        install must not create files under a relative ``_GAIA_ROOT``.
+    """
+    if explicit:
+        path = Path(explicit)
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+    root = Path(_GAIA_ROOT)
+    if root.is_dir():
+        return root
+    logger.info(
+        "GAIA root %s not found; not keeping state, history or locks (see --state-dir)", root
+    )
+    return None
+
+
+def _parse_lanes(text: str) -> Optional[Dict[str, int]]:
+    """Parse a ``--lanes`` value such as ``"critical=2,bulk=1"``.
+
+    Args:
+        text: Comma-separated ``lane=limit`` pairs, or ``"off"``.
+
+    Returns:
+        Lane limits, or None when lanes are turned off.
+
+    Raises:
+        argparse.ArgumentTypeError: If the spec is malformed.
+    """
+    if text.strip().lower() == "off":
+        return None
+    lanes: Dict[str, int] = {}
+    for item in text.split(","):
+        lane, _, limit = item.partition("=")
+        lane = lane.strip()
+        if lane not in PRIORITIES or not limit.strip().isdigit() or int(limit) < 1:
+            raise argparse.ArgumentTypeError(
+                f"invalid lane {item!r}; expected <lane>=<limit> with lane in {PRIORITIES}"
+            )
+        lanes[lane] = int(limit)
+    return lanes
+
+
+def _run_ctl(argv: List[str]) -> None:
+    """Send one ``ctl`` command to a running daemon and print the reply.
+
+    Args:
+        argv: Arguments after ``ctl``, e.g. ``["run", "health_check"]``.
+
+    Raises:
+        SystemExit: With status 1 if the daemon is unreachable or rejects
+            the command.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m runtime.task_runner ctl",
+        description="Control a running task runner daemon",
+        epilog=(
+            "pause without a task lasts until resume or a daemon restart. "
+            "pause <task> disables the task in the state file, so it stays disabled "
+            "across restarts until resume <task>."
+        ),
+    )
+    parser.add_argument(
+        "--control-socket",
+        default=None,
+        help="Daemon control socket (default: <GAIA root>/.gaia_task_runner.sock)",
+    )
+    parser.add_argument(
+        "command",
+        nargs="+",
+        help=(
+            "run <task> | pause [<task>] | resume [<task>] | stats | results [<task>] "
+            "| tasks | ping"
+        ),
+    )
+    args = parser.parse_args(argv)
+    path = args.control_socket or Path(_GAIA_ROOT) / CONTROL_SOCKET_FILENAME
+    try:
+        response = send_command(path, " ".join(args.command))
+    except ControlError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        raise SystemExit(1) from exc
+    except OSError as exc:
+        print(f"error: no task runner daemon on {path} ({exc})", file=sys.stderr)
+        raise SystemExit(1) from exc
+    response.pop("ok", None)
+    print(json.dumps(response, indent=2, default=str))
+
+
+def _parse_fields(text: str) -> Tuple[str, ...]:
+    """Parse a ``--fields`` value such as ``"task,status,output.status"``.
+
+    Args:
+        text: Comma-separated dotted keys, all plain (keep) or all
+            prefixed with ``-`` (drop).
+
+    Returns:
+        The field specs, in order.
+
+    Raises:
+        argparse.ArgumentTypeError: If the list is empty or mixes kept and
+            dropped fields.
+    """
+    fields = tuple(f.strip() for f in text.split(",") if f.strip())
+    if not fields:
+        raise argparse.ArgumentTypeError("--fields needs at least one key")
+    if len({f.startswith("-") for f in fields}) > 1:
+        raise argparse.ArgumentTypeError("--fields cannot mix kept and '-'dropped keys")
+    return fields
+
+
+def project_fields(result: Dict[str, Any], fields: Optional[Sequence[str]]) -> Dict[str, Any]:
+    """Return the parts of a result selected by ``--fields``.
+
+    Args:
+        result: A result dict from get_results().
+        fields: Dotted keys to keep, or ``-``-prefixed dotted keys to drop.
+            None returns the result unchanged.
+
+    Returns:
+        A new dict; missing keys are ignored and the input is not modified.
+    """
+    if not fields:
+        return result
+    if fields[0].startswith("-"):
+        projected = json.loads(json.dumps(result, default=str))
+        for spec in fields:
+            *parents, leaf = spec[1:].split(".")
+            node = projected
+            for key in parents:
+                node = node.get(key) if isinstance(node, dict) else None
+            if isinstance(node, dict):
+                node.pop(leaf, None)
+        return projected
+    projected: Dict[str, Any] = {}
+    for spec in fields:
+        *parents, leaf = spec.split(".")
+        source: Any = result
+        for key in parents:
+            source = source.get(key) if isinstance(source, dict) else None
+        if not isinstance(source, dict) or leaf not in source:
+            continue
+        target = projected
+        for key in parents:
+            target = target.setdefault(key, {})
+        target[leaf] = source[leaf]
+    return projected
+
+
+class _NdjsonWriter:
+    """Thread-safe result listener printing one compact JSON line per result.
+
+    Args:
+        stream: Text stream to write to (flushed after every line).
+        fields: ``--fields`` projection, or None.
+    """
+
+    def __init__(self, stream: Any, fields: Optional[Sequence[str]] = None) -> None:
+        self._stream = stream
+        self._fields = fields
+        self._lock = threading.Lock()
+
+    def __call__(self, result: Dict[str, Any]) -> None:
+        line = json.dumps(project_fields(result, self._fields), separators=(",", ":"), default=str)
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+
+def _print_results(runner: TaskRunner, args: argparse.Namespace) -> None:
+    """Print all results as one JSON document, unless they were streamed.
+
+    Args:
+        runner: Runner whose results to print.
+        args: Parsed CLI arguments (``output_format`` and ``fields``).
+    """
+    if args.output_format == "ndjson":
+        return
+    results = {name: project_fields(r, args.fields) for name, r in runner.get_results().items()}
+    print(json.dumps(results, indent=2, default=str))
+
+
+def _print_stats(runner: TaskRunner, fmt: Optional[str], compact: bool = False) -> None:
+    """Print the runner's execution stats when ``--stats`` was requested.
+
+    Args:
+        runner: Runner whose metrics to print.
+        fmt: ``"json"``, ``"prometheus"``, or None to print nothing.
+        compact: Print JSON stats as a single ``{"stats": ...}`` line, so
+            they do not break an NDJSON stream.
+    """
+    if fmt == "prometheus":
+        print(runner.metrics.to_prometheus(), end="")
+    elif fmt == "json" and compact:
+        print(json.dumps({"stats": runner.get_stats()}, separators=(",", ":")))
+    elif fmt == "json":
+        print(json.dumps(runner.get_stats(), indent=2))
+
+
+def _print_history(
+    history_path: Union[str, Path], task: Optional[str], since_seconds: float, limit: int
+) -> None:
+    """Print aggregates and recent runs from the history database.
+
+    Args:
+        history_path: SQLite history file.
+        task: Task name, or None for all tasks.
+        since_seconds: Only runs newer than this many seconds.
+        limit: Maximum number of individual runs listed.
+    """
+    history = TaskHistoryStore(history_path)
+    try:
+        report = {
+            "since_seconds": since_seconds,
+            "summary": history.summary(task, since_seconds=since_seconds),
+            "runs": history.query(task, since_seconds=since_seconds, limit=limit),
+        }
+    finally:
+        history.close()
+    print(json.dumps(report, indent=2, default=str))
+
+
 def main() -> None:
     """CLI entry point for the task runner."""
-    import json
-
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
     )
 
-    args = _build_arg_parser().parse_args()
-    runner = TaskRunner(register_defaults=True)
+    if sys.argv[1:2] == ["ctl"]:
+        _run_ctl(sys.argv[2:])
+        return
+
+    parser = _build_arg_parser()
+    args = parser.parse_args()
+    if args.lanes is not None and args.workers is not None:
+        parser.error("--workers and --lanes are mutually exclusive; lane limits set the workers")
+    state_dir = _state_dir(args.state_dir)
+
+    def in_state_dir(explicit: Optional[str], filename: str) -> Optional[Path]:
+        if explicit:
+            return Path(explicit)
+        return None if state_dir is None else state_dir / filename
+
+    history_path = in_state_dir(args.history_db, HISTORY_FILENAME)
+    if args.history is not None:
+        try:
+            since_seconds = parse_duration(args.since)
+        except ValueError as exc:
+            parser.error(str(exc))
+        if history_path is None:
+            parser.error("no history database: pass --history-db or --state-dir")
+        _print_history(history_path, args.history or None, since_seconds, args.limit)
+        return
+    if args.cache_report:
+        print(json.dumps(_task_stale_cache_cleanup(dry_run=True), indent=2))
+        return
+
+    runner = TaskRunner(
+        register_defaults=True,
+        max_workers=args.workers or 1,
+        state_path=None if args.no_state else in_state_dir(args.state, STATE_FILENAME),
+        history_path=None if args.no_history else history_path,
+        lock_dir=None if args.no_lock else in_state_dir(args.lock_dir, LOCK_DIRNAME),
+        lanes=args.lanes,
+        cycle_budget_seconds=args.cycle_budget,
+    )
+    streaming = args.output_format == "ndjson"
+    if streaming:
+        runner.add_result_listener(_NdjsonWriter(sys.stdout, args.fields))
 
     if args.list:
-        print(f"{'Name':<25} {'Interval(s)':<14} {'Last Run':<30} {'Enabled'}")
+        print(f"{'Name':<25} {'Schedule':<14} {'Last Run':<30} {'Enabled'}")
         print("-" * 80)
         for task in runner.list_tasks():
             last = str(task.last_run) if task.last_run else "never"
-            print(f"{task.name:<25} {task.interval_seconds:<14} {last:<30} {task.enabled}")
-        return
-
-    if args.run_all:
-        count = runner.run_all()
-        print(json.dumps(runner.get_results(), indent=2, default=str))
-        logger.info("Ran %d tasks (forced).", count)
-        return
-
-    if args.daemon:
-        logger.info("GAIA Task Runner started (daemon mode). Press Ctrl-C to stop.")
-        try:
-            while True:
-                count = runner.run_once()
-                if count:
-                    logger.info("Daemon cycle: executed %d due tasks.", count)
-                time.sleep(60)
-        except KeyboardInterrupt:
-            logger.info("Daemon stopped.")
+            schedule = task.cron.expression if task.cron else f"{task.interval_seconds:g}s"
+            print(f"{task.name:<25} {schedule:<14} {last:<30} {task.enabled}")
         return
 
-    # Default: --once
-    count = runner.run_once()
-    print(json.dumps(runner.get_results(), indent=2, default=str))
-    logger.info("Ran %d due tasks.", count)
+    try:
+        if args.run_all:
+            count = runner.run_all()
+            _print_results(runner, args)
+            _print_stats(runner, args.stats, compact=streaming)
+            logger.info("Ran %d tasks (forced).", count)
+            return
+
+        if args.daemon:
+            logger.info("GAIA Task Runner started (daemon mode). Press Ctrl-C to stop.")
+            server = None
+            control = None
+            if args.metrics_port is not None:
+                server = start_metrics_server(runner.metrics, args.metrics_port)
+            try:
+                socket_path = in_state_dir(args.control_socket, CONTROL_SOCKET_FILENAME)
+                if not args.no_control and not CONTROL_AVAILABLE:
+                    logger.warning("Unix sockets unavailable; 'ctl' commands are disabled.")
+                elif not args.no_control and socket_path is None:
+                    logger.warning("No state directory; 'ctl' commands are disabled.")
+                elif not args.no_control:
+                    control = start_control_server(runner, socket_path)
+                runner.run_forever()
+            except KeyboardInterrupt:
+                logger.info("Daemon stopped.")
+            except RuntimeError as exc:  # RunnerLockedError, or a live control socket
+                logger.error("%s", exc)
+                raise SystemExit(1) from exc
+            finally:
+                if control is not None:
+                    control.shutdown()
+                    control.server_close()
+                if server is not None:
+                    server.shutdown()
+                _print_stats(runner, args.stats, compact=streaming)
+            return
+
+        # Default: --once
+        count = runner.run_once()
+        _print_results(runner, args)
+        _print_stats(runner, args.stats, compact=streaming)
+        logger.info("Ran %d due tasks.", count)
+    finally:
+        runner.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,131 @@
+"""Durable scheduler state for the GAIA task runner.
+
+Persists per-task ``last_run``, ``enabled`` and the last result so daemon
+restarts do not immediately re-run daily tasks. The store is a single JSON
+document replaced atomically (write temp file, fsync, ``os.replace``), so a
+crash mid-write leaves either the old or the new state on disk, never a
+torn file.
+
+Usage:
+    from runtime.task_state import TaskStateStore
+    store = TaskStateStore(Path(".gaia_task_state.json"))
+    state = store.load()          # {} when the file is missing or corrupt
+    store.save({"health_check": {"last_run": 1700000000.0, "enabled": True}})
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Union
+
+logger = logging.getLogger("gaia.runtime.task_state")
+
+STATE_FORMAT_VERSION = 1
+
+
+class TaskStateStore:
+    """Atomic-rename JSON journal of per-task scheduler state.
+
+    Args:
+        path: Location of the state file. Parent directories are created
+            on first save.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Initialise the store without touching the filesystem.
+
+        Args:
+            path: Location of the state file.
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the persisted state.
+
+        A missing file yields an empty mapping. An unreadable or corrupt
+        file is logged and also yields an empty mapping, so a damaged
+        journal never prevents the runner from starting.
+
+        Returns:
+            Dict mapping task name to its saved state dict.
+        """
+        try:
+            raw = self.path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return {}
+        except OSError as exc:
+            logger.warning("Could not read task state %s: %s", self.path, exc)
+            return {}
+
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            logger.warning("Ignoring corrupt task state %s: %s", self.path, exc)
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != STATE_FORMAT_VERSION:
+            logger.warning("Ignoring task state %s with unknown format", self.path)
+            return {}
+        tasks = data.get("tasks", {})
+        return tasks if isinstance(tasks, dict) else {}
+
+    def save(self, tasks: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically replace the state file with ``tasks``.
+
+        Values that are not JSON-serialisable are stored via ``str()``.
+        Write failures are logged rather than raised so a read-only or
+        full disk cannot take down the daemon.
+
+        Args:
+            tasks: Dict mapping task name to its state dict.
+        """
+        payload = json.dumps(
+            {"version": STATE_FORMAT_VERSION, "tasks": tasks},
+            indent=2,
+            default=str,
+        )
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(
+                    prefix=f".{self.path.name}.", suffix=".tmp", dir=str(self.path.parent)
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                        fh.write(payload)
+                        fh.flush()
+                        os.fsync(fh.fileno())
+                    os.replace(tmp_name, self.path)
+                except BaseException:
+                    Path(tmp_name).unlink(missing_ok=True)
+                    raise
+                _fsync_dir(self.path.parent)
+            except OSError as exc:
+                logger.warning("Could not write task state %s: %s", self.path, exc)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """fsync a directory so a completed rename survives power loss.
+
+    Not supported on Windows, where opening a directory fails; the rename
+    itself is still atomic there.
+
+    Args:
+        directory: Directory containing the replaced file.
+    """
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,231 @@
+"""Pruned, parallel directory walking for GAIA maintenance tasks.
+
+``Path.rglob`` visits every directory under its root, including ``.git``
+object stores, virtualenvs, ``node_modules`` and ``archive`` snapshots that
+maintenance tasks never act on. find_dirs() and walk_files() walk with
+``os.scandir`` instead, using the file types scandir already returned rather
+than a ``stat`` per directory entry, and skip whole subtrees according to
+PruneRules:
+
+- ``names``: directory names never entered (``.git``, ``node_modules``...);
+- ``globs``: ``fnmatch`` patterns on directory names (``*.egg-info``);
+- ``markers``: file names that mark a directory as not worth walking
+  wherever it lives, e.g. ``pyvenv.cfg`` for virtualenvs with arbitrary
+  names. A marked directory is listed once (to see the marker) but none of
+  its subdirectories are entered or reported.
+
+The top-level subtrees of the root are walked concurrently on a thread
+pool. ``os.scandir`` releases the GIL while the kernel (or a network file
+system) answers, so wide trees on slow storage finish in roughly the time
+of their largest subtree. Results are returned in a deterministic order.
+
+Symlinks are never followed, so callers that delete what they find cannot
+be led outside the tree.
+
+Usage:
+    from runtime.task_walk import PruneRules, find_dirs
+    find_dirs("X:/Projects/_GAIA", {"__pycache__"})
+    find_dirs(root, {"dist"}, prune=PruneRules(names=frozenset({".git"})), max_workers=8)
+    for path, st in walk_files(root): ...
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import AbstractSet, FrozenSet, List, Optional, Tuple, Union
+
+try:
+    from runtime.task_inputs import DEFAULT_PRUNE
+except ImportError:  # imported as a top-level module with runtime/ on sys.path
+    from task_inputs import DEFAULT_PRUNE  # type: ignore[no-redef]
+
+#: Top-level subtrees walked at the same time, by default.
+DEFAULT_WALK_WORKERS = 4
+
+PathLike = Union[str, "os.PathLike[str]"]
+FileStat = Tuple[str, os.stat_result]
+
+
+@dataclass(frozen=True)
+class PruneRules:
+    """Which directories a walk does not descend into.
+
+    Attributes:
+        names: Exact directory names to skip.
+        globs: ``fnmatch`` patterns matched against directory names.
+        markers: File names whose presence marks a directory's
+            subdirectories as not worth walking.
+    """
+
+    names: FrozenSet[str] = field(default=DEFAULT_PRUNE | {"archive"})
+    globs: Tuple[str, ...] = ("*.egg-info",)
+    markers: FrozenSet[str] = frozenset({"pyvenv.cfg"})
+
+    def __post_init__(self) -> None:
+        """Accept any iterable of names, globs and markers.
+
+        Raises:
+            TypeError: If a field is given as a bare string.
+        """
+        for name in ("names", "globs", "markers"):
+            if isinstance(getattr(self, name), str):
+                raise TypeError(f"{name} must be a collection of strings, not a string")
+        object.__setattr__(self, "names", frozenset(self.names))
+        object.__setattr__(self, "globs", tuple(self.globs))
+        object.__setattr__(self, "markers", frozenset(self.markers))
+
+    def prunes(self, name: str) -> bool:
+        """Return True if a directory called ``name`` is skipped."""
+        return name in self.names or any(fnmatch.fnmatch(name, glob) for glob in self.globs)
+
+
+def find_dirs(
+    root: PathLike,
+    names: AbstractSet[str],
+    prune: PruneRules = PruneRules(),
+    max_workers: int = DEFAULT_WALK_WORKERS,
+) -> List[str]:
+    """Find directories called one of ``names`` below ``root``.
+
+    A matching directory is reported and not descended into, and a match
+    wins over the prune rules (so ``__pycache__`` can be searched for even
+    though walks do not normally enter it). Unreadable directories are
+    skipped silently, as ``rglob`` does.
+
+    Args:
+        root: Directory to search; it is never reported itself.
+        names: Directory names to report.
+        prune: Subtrees to skip.
+        max_workers: Top-level subtrees walked concurrently; 1 walks
+            serially on the calling thread.
+
+    Returns:
+        Matching directory paths (joined onto ``root``): matches directly
+        under root first, then each top-level subtree's matches in name
+        order.
+
+    Raises:
+        ValueError: If max_workers < 1.
+    """
+    return _walk_tree(root, names, prune, max_workers, files=None)[0]
+
+
+def walk_files(
+    root: PathLike,
+    prune: PruneRules = PruneRules(),
+    max_workers: int = DEFAULT_WALK_WORKERS,
+) -> List[FileStat]:
+    """List the regular files below ``root``, outside pruned subtrees.
+
+    Symlinks and unreadable entries are skipped.
+
+    Args:
+        root: Directory to walk.
+        prune: Subtrees to skip.
+        max_workers: Top-level subtrees walked concurrently.
+
+    Returns:
+        ``(path, stat)`` pairs: files directly under root first, then each
+        top-level subtree's files, directories in name order.
+
+    Raises:
+        ValueError: If max_workers < 1.
+    """
+    return _walk_tree(root, frozenset(), prune, max_workers, files=[])[1]
+
+
+def _walk_tree(
+    root: PathLike,
+    names: AbstractSet[str],
+    prune: PruneRules,
+    max_workers: int,
+    files: Optional[List[FileStat]],
+) -> Tuple[List[str], List[FileStat]]:
+    """Walk root's top-level subtrees, concurrently when there are several.
+
+    Returns:
+        ``(matching directories, files)``; files are only collected when
+        ``files`` is a list.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+    found, subtrees = _scan(os.fspath(root), names, prune, files)
+    want_files = files is not None
+
+    def walk(path: str) -> Tuple[List[str], List[FileStat]]:
+        subtree_files: Optional[List[FileStat]] = [] if want_files else None
+        return _walk(path, names, prune, subtree_files), subtree_files or []
+
+    if max_workers == 1 or len(subtrees) < 2:
+        results = [walk(path) for path in subtrees]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(subtrees)), thread_name_prefix="gaia-walk"
+        ) as pool:
+            results = list(pool.map(walk, subtrees))
+    collected = files if files is not None else []
+    for subtree_found, subtree_files in results:
+        found.extend(subtree_found)
+        collected.extend(subtree_files)
+    return found, collected
+
+
+def _walk(
+    directory: str,
+    names: AbstractSet[str],
+    prune: PruneRules,
+    files: Optional[List[FileStat]],
+) -> List[str]:
+    """Serially walk one subtree, depth first in name order."""
+    found: List[str] = []
+    stack = [directory]
+    while stack:
+        matches, subdirs = _scan(stack.pop(), names, prune, files)
+        found.extend(matches)
+        stack.extend(reversed(subdirs))
+    return found
+
+
+def _scan(
+    directory: str,
+    names: AbstractSet[str],
+    prune: PruneRules,
+    files: Optional[List[FileStat]],
+) -> Tuple[List[str], List[str]]:
+    """List one directory, appending its regular files to ``files`` if given.
+
+    Returns:
+        ``(matches, subdirectories to walk)``, each sorted by name.
+    """
+    matches: List[str] = []
+    subdirs: List[str] = []
+    regular: List[FileStat] = []
+    marked = False
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if not is_dir:
+                        marked = marked or entry.name in prune.markers
+                        if files is not None and entry.is_file(follow_symlinks=False):
+                            regular.append((entry.path, entry.stat(follow_symlinks=False)))
+                        continue
+                except OSError:
+                    continue
+                if entry.name in names:
+                    matches.append(entry.path)
+                elif not prune.prunes(entry.name):
+                    subdirs.append(entry.path)
+    except OSError:
+        return [], []
+    if marked:
+        return [], []
+    if files is not None:
+        files.extend(sorted(regular, key=lambda item: item[0]))
+    matches.sort()
+    subdirs.sort()
+    return matches, subdirs
@@ -0,0 +1,579 @@
+"""Filesystem-event triggers for the GAIA task runner.
+
+A task can subscribe to path globs (``EventTrigger``). A FileWatcher thread
+collects filesystem events under the globs' directories, debounces them per
+task, and hands each task the batch of changed paths that match its globs,
+so maintenance reacts to edits within seconds instead of re-walking whole
+trees on a timer.
+
+Two backends produce the raw events:
+
+- ``"inotify"``: Linux inotify through ``ctypes`` (no third-party
+  packages). One watch per directory, added recursively and for
+  directories created later. Queue overflows are reported as "unknown
+  changes" so subscribers fall back to a full run.
+- ``"poll"``: a pure-Python fallback for every other platform, diffing
+  ``os.scandir`` snapshots of the watched trees every ``poll_seconds``.
+
+Directories named in ``prune`` (``.git``, ``node_modules``, caches...) are
+never watched or walked.
+
+Usage:
+    from runtime.task_watch import EventTrigger, FileWatcher
+    watcher = FileWatcher(lambda name, paths: print(name, paths))
+    watcher.subscribe("lint", EventTrigger(["runtime/**/*.py"], debounce_seconds=2))
+    watcher.start()
+    ...
+    watcher.stop()
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import re
+import select
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+try:
+    from runtime.task_inputs import DEFAULT_PRUNE
+except ImportError:  # imported as a top-level module with runtime/ on sys.path
+    from task_inputs import DEFAULT_PRUNE  # type: ignore[no-redef]
+
+logger = logging.getLogger("gaia.runtime.task_watch")
+
+#: Valid values for FileWatcher(backend=...).
+BACKENDS = ("auto", "inotify", "poll")
+
+#: Longest the watcher thread blocks before re-checking debounce deadlines
+#: and stop requests, in seconds.
+WATCH_TICK_SECONDS = 0.25
+
+#: Default rescan period of the polling backend, in seconds.
+DEFAULT_POLL_SECONDS = 2.0
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+def glob_to_regex(pattern: str) -> Pattern[str]:
+    """Compile a ``/``-separated glob into a full-match regex.
+
+    ``*`` and ``?`` stay within one path segment, ``[...]`` is a character
+    class (``[!...]`` negated) and a ``**`` segment matches any number of
+    directories, including none.
+
+    Args:
+        pattern: Glob such as ``"/srv/gaia/**/*.py"``.
+
+    Returns:
+        Compiled regex matching whole paths.
+    """
+    segments = pattern.split("/")
+    out = []
+    for i, segment in enumerate(segments):
+        last = i == len(segments) - 1
+        if segment == "**":
+            out.append(".*" if last else "(?:[^/]+/)*")
+            continue
+        out.append(_segment_regex(segment) + ("" if last else "/"))
+    return re.compile("".join(out) + r"\Z")
+
+
+def _segment_regex(segment: str) -> str:
+    """Translate one glob segment (no ``/``) to a regex fragment."""
+    out = []
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[" and "]" in segment[i + 2 :]:
+            end = segment.index("]", i + 2)
+            body = segment[i + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append("[" + body.replace("\\", "\\\\") + "]")
+            i = end
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return "".join(out)
+
+
+def _normalise(path: str) -> str:
+    """Absolute path with ``/`` separators, as globs are written."""
+    return os.path.abspath(path).replace(os.sep, "/")
+
+
+@dataclass(frozen=True)
+class EventTrigger:
+    """Path globs whose changes should run a task.
+
+    Attributes:
+        globs: Globs of files to react to, e.g. ``"runtime/**/*.py"``.
+            Relative globs are anchored at the working directory when the
+            trigger is created.
+        debounce_seconds: Quiet period after the last matching event before
+            the task is queued; a burst of saves becomes one run.
+        prune: Directory names never watched.
+    """
+
+    globs: Tuple[str, ...]
+    debounce_seconds: float = 1.0
+    prune: FrozenSet[str] = field(default=DEFAULT_PRUNE)
+
+    def __post_init__(self) -> None:
+        """Anchor the globs and validate the debounce.
+
+        Raises:
+            ValueError: If no globs are given or debounce_seconds < 0.
+        """
+        if isinstance(self.globs, str):
+            object.__setattr__(self, "globs", (self.globs,))
+        globs = tuple(
+            g.replace(os.sep, "/") if os.path.isabs(g) else _normalise(g) for g in self.globs
+        )
+        if not globs:
+            raise ValueError("EventTrigger needs at least one glob")
+        if self.debounce_seconds < 0:
+            raise ValueError(f"debounce_seconds must be >= 0, got {self.debounce_seconds}")
+        object.__setattr__(self, "globs", globs)
+        object.__setattr__(self, "_patterns", tuple(glob_to_regex(g) for g in globs))
+
+    def matches(self, path: str) -> bool:
+        """Return True if ``path`` (absolute, ``/``-separated) matches a glob."""
+        return any(p.match(path) for p in self._patterns)  # type: ignore[attr-defined]
+
+    def roots(self) -> List[Tuple[str, Optional[int]]]:
+        """Return the directories to watch for these globs.
+
+        Returns:
+            ``(directory, max_depth)`` pairs: the literal prefix of each glob
+            and how many levels below it can match (None for ``**``).
+        """
+        roots = []
+        for glob in self.globs:
+            segments = glob.split("/")
+            literal = next(
+                (i for i, s in enumerate(segments) if _GLOB_CHARS.search(s)), len(segments) - 1
+            )
+            rest = segments[literal:]
+            depth = None if "**" in rest else len(rest) - 1
+            roots.append(("/".join(segments[:literal]) or "/", depth))
+        return roots
+
+
+class InotifyBackend:
+    """Raw events from Linux inotify, watching directory trees recursively.
+
+    Args:
+        prune: Directory names never watched.
+
+    Raises:
+        OSError: If inotify is unavailable (not Linux, or no libc symbol).
+    """
+
+    _IN_ATTRIB = 0x00000004
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_FROM = 0x00000040
+    _IN_MOVED_TO = 0x00000080
+    _IN_CREATE = 0x00000100
+    _IN_DELETE = 0x00000200
+    _IN_DELETE_SELF = 0x00000400
+    _IN_Q_OVERFLOW = 0x00004000
+    _IN_IGNORED = 0x00008000
+    _IN_ONLYDIR = 0x01000000
+    _IN_ISDIR = 0x40000000
+    _IN_NONBLOCK = 0o4000
+    _IN_CLOEXEC = 0o2000000
+    _MASK = (
+        _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+        | _IN_DELETE_SELF | _IN_ONLYDIR
+    )
+    _HEADER = struct.Struct("iIII")
+
+    def __init__(self, prune: FrozenSet[str] = DEFAULT_PRUNE) -> None:
+        """Open an inotify instance.
+
+        Args:
+            prune: Directory names never watched.
+
+        Raises:
+            OSError: If inotify is unavailable.
+        """
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+            libc.inotify_init1
+        except (AttributeError, OSError, TypeError) as exc:
+            raise OSError(f"inotify is not available on this platform ({exc})") from None
+        self._libc = libc
+        self._prune = prune
+        self._fd = libc.inotify_init1(self._IN_NONBLOCK | self._IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+        # wd -> (directory, remaining depth or None for unlimited)
+        self._watches: Dict[int, Tuple[str, Optional[int]]] = {}
+
+    def add_tree(self, root: str, max_depth: Optional[int] = None) -> List[str]:
+        """Watch ``root`` and its subdirectories down to ``max_depth``.
+
+        Args:
+            root: Directory to watch; missing directories are ignored.
+            max_depth: Levels below root to watch, or None for all.
+
+        Returns:
+            Files already present in directories that were newly watched
+            (used when a directory appears after the watch started).
+        """
+        found: List[str] = []
+        stack: List[Tuple[str, Optional[int]]] = [(root, max_depth)]
+        while stack:
+            directory, depth = stack.pop()
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self._MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                level = logging.WARNING if errno == 28 else logging.DEBUG  # ENOSPC: watch limit
+                logger.log(level, "Cannot watch %s: %s", directory, os.strerror(errno))
+                continue
+            self._watches[wd] = (directory, depth)
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in self._prune and (depth is None or depth > 0):
+                        stack.append((entry.path, None if depth is None else depth - 1))
+                else:
+                    found.append(entry.path)
+        return found
+
+    def read(self, timeout: float) -> Optional[List[str]]:
+        """Wait up to ``timeout`` seconds and return the changed paths.
+
+        Returns:
+            Changed paths (possibly empty), or None if the kernel queue
+            overflowed and events were lost.
+        """
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        changed: List[str] = []
+        overflow = False
+        offset = 0
+        while offset + self._HEADER.size <= len(data):
+            wd, mask, _cookie, length = self._HEADER.unpack_from(data, offset)
+            offset += self._HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & self._IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            watch = self._watches.get(wd)
+            if mask & self._IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            if watch is None or not name:
+                continue
+            directory, depth = watch
+            path = os.path.join(directory, name)
+            if mask & self._IN_ISDIR:
+                if mask & (self._IN_CREATE | self._IN_MOVED_TO) and name not in self._prune:
+                    if depth is None or depth > 0:
+                        changed.extend(self.add_tree(path, None if depth is None else depth - 1))
+                continue
+            changed.append(path)
+        return None if overflow else changed
+
+    def close(self) -> None:
+        """Close the inotify descriptor, dropping every watch."""
+        fd, self._fd = self._fd, -1
+        if fd >= 0:
+            os.close(fd)
+
+
+class PollingBackend:
+    """Pure-Python fallback that diffs periodic ``os.scandir`` snapshots.
+
+    Args:
+        prune: Directory names never walked.
+        poll_seconds: Minimum time between rescans.
+    """
+
+    def __init__(
+        self, prune: FrozenSet[str] = DEFAULT_PRUNE, poll_seconds: float = DEFAULT_POLL_SECONDS
+    ) -> None:
+        """Start with no watched trees.
+
+        Args:
+            prune: Directory names never walked.
+            poll_seconds: Minimum time between rescans.
+        """
+        self._prune = prune
+        self._poll_seconds = poll_seconds
+        self._roots: List[Tuple[str, Optional[int]]] = []
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+        self._last_scan = time.monotonic()
+
+    def add_tree(self, root: str, max_depth: Optional[int] = None) -> List[str]:
+        """Include ``root`` (down to ``max_depth``) in future rescans.
+
+        Returns:
+            An empty list; files already present are not changes.
+        """
+        self._roots.append((root, max_depth))
+        self._snapshot.update(self._scan([(root, max_depth)]))
+        return []
+
+    def read(self, timeout: float) -> Optional[List[str]]:
+        """Rescan if ``poll_seconds`` elapsed, else sleep up to ``timeout``.
+
+        Returns:
+            Paths added, removed or modified since the previous scan.
+        """
+        wait = self._last_scan + self._poll_seconds - time.monotonic()
+        if wait > 0:
+            time.sleep(min(wait, timeout))
+            return []
+        self._last_scan = time.monotonic()
+        current = self._scan(self._roots)
+        previous, self._snapshot = self._snapshot, current
+        changed = [p for p, sig in current.items() if previous.get(p) != sig]
+        changed.extend(p for p in previous if p not in current)
+        return changed
+
+    def _scan(self, roots: Iterable[Tuple[str, Optional[int]]]) -> Dict[str, Tuple[int, int]]:
+        """Map every file under ``roots`` to its (mtime_ns, size)."""
+        snapshot: Dict[str, Tuple[int, int]] = {}
+        stack = list(roots)
+        while stack:
+            directory, depth = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in self._prune and (depth is None or depth > 0):
+                                    stack.append((entry.path, None if depth is None else depth - 1))
+                                continue
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        snapshot[entry.path] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                continue
+        return snapshot
+
+    def close(self) -> None:
+        """Forget all snapshots."""
+        self._roots.clear()
+        self._snapshot.clear()
+
+
+class FileWatcher:
+    """Debounced dispatch of filesystem events to subscribed tasks.
+
+    Args:
+        on_change: Called from the watcher thread as ``on_change(name,
+            paths)`` once a subscription's debounce window closes. ``paths``
+            is sorted; an empty list means events were lost and the
+            subscriber should treat everything as changed.
+        backend: ``"inotify"``, ``"poll"`` or ``"auto"`` (inotify when
+            available, else polling).
+        poll_seconds: Rescan period of the polling backend.
+    """
+
+    def __init__(
+        self,
+        on_change: Callable[[str, List[str]], None],
+        backend: str = "auto",
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+    ) -> None:
+        """Create an idle watcher; call start() to begin watching.
+
+        Raises:
+            ValueError: If backend is not one of ``BACKENDS``.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}")
+        self._on_change = on_change
+        self._backend_name = backend
+        self._poll_seconds = poll_seconds
+        self._backend: Optional[object] = None
+        self._subscriptions: Dict[str, EventTrigger] = {}
+        self._unwatched: List[EventTrigger] = []
+        self._pending: Dict[str, Set[str]] = {}
+        self._deadlines: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def backend(self) -> Optional[str]:
+        """Name of the active backend, or None before start()."""
+        if self._backend is None:
+            return None
+        return "inotify" if isinstance(self._backend, InotifyBackend) else "poll"
+
+    @property
+    def running(self) -> bool:
+        """True while the watcher thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscribe(self, name: str, trigger: EventTrigger) -> None:
+        """Route events matching ``trigger`` to ``name``, replacing any previous one.
+
+        Args:
+            name: Subscriber (task) name.
+            trigger: Globs and debounce for this subscriber.
+        """
+        with self._lock:
+            self._subscriptions[name] = trigger
+            self._unwatched.append(trigger)
+
+    def unsubscribe(self, name: str) -> None:
+        """Stop routing events to ``name``. Its directories stay watched."""
+        with self._lock:
+            self._subscriptions.pop(name, None)
+            self._pending.pop(name, None)
+            self._deadlines.pop(name, None)
+
+    def start(self) -> None:
+        """Open the backend, watch every subscription and start the thread."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._backend = self._open_backend()
+        self._watch_new_roots()
+        self._thread = threading.Thread(target=self._loop, name="gaia-watch", daemon=True)
+        self._thread.start()
+        logger.info(
+            "Watching %d task trigger(s) with %s backend", len(self._subscriptions), self.backend
+        )
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the thread and release the backend. Safe to call twice."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+        backend, self._backend = self._backend, None
+        if backend is not None:
+            backend.close()  # type: ignore[attr-defined]
+        with self._lock:
+            self._unwatched = list(self._subscriptions.values())
+
+    def _open_backend(self) -> object:
+        """Instantiate the configured backend, falling back to polling."""
+        prune = frozenset().union(*(t.prune for t in self._subscriptions.values())) or DEFAULT_PRUNE
+        if self._backend_name in ("auto", "inotify"):
+            try:
+                return InotifyBackend(prune)
+            except OSError as exc:
+                if self._backend_name == "inotify":
+                    raise
+                logger.info(
+                    "inotify unavailable (%s); polling every %.1fs", exc, self._poll_seconds
+                )
+        return PollingBackend(prune, self._poll_seconds)
+
+    def _watch_new_roots(self) -> None:
+        """Add watches for subscriptions registered since the last call."""
+        with self._lock:
+            triggers, self._unwatched = self._unwatched, []
+        watched: Set[Tuple[str, Optional[int]]] = set()
+        for trigger in triggers:
+            for root in trigger.roots():
+                if root not in watched:
+                    watched.add(root)
+                    self._backend.add_tree(*root)  # type: ignore[attr-defined]
+
+    def _loop(self) -> None:
+        """Read events, debounce per subscriber and fire callbacks."""
+        while not self._stop.is_set():
+            if self._unwatched:
+                self._watch_new_roots()
+            with self._lock:
+                next_deadline = min(self._deadlines.values(), default=None)
+            timeout = WATCH_TICK_SECONDS
+            if next_deadline is not None:
+                timeout = max(0.0, min(timeout, next_deadline - time.monotonic()))
+            try:
+                changed = self._backend.read(timeout)  # type: ignore[attr-defined]
+            except (OSError, ValueError) as exc:
+                if self._stop.is_set():
+                    return
+                logger.warning("File watcher read failed: %s", exc)
+                self._stop.wait(WATCH_TICK_SECONDS)
+                continue
+            if changed is None:
+                logger.warning("File watcher lost events; queueing full runs")
+                self._dispatch(None)
+            elif changed:
+                self._dispatch(changed)
+            self._fire_expired()
+
+    def _dispatch(self, changed: Optional[Sequence[str]]) -> None:
+        """Add changed paths to each matching subscriber's pending batch.
+
+        Args:
+            changed: Paths reported by the backend, or None for lost events
+                (every subscriber is marked with an empty batch).
+        """
+        if changed is not None and not changed:
+            return
+        now = time.monotonic()
+        paths = None if changed is None else [p.replace(os.sep, "/") for p in changed]
+        with self._lock:
+            for name, trigger in self._subscriptions.items():
+                if paths is None:
+                    hits: List[str] = []
+                else:
+                    hits = [p for p in paths if trigger.matches(p)]
+                    if not hits:
+                        continue
+                self._pending.setdefault(name, set()).update(hits)
+                if paths is None:
+                    self._pending[name].add("")
+                self._deadlines[name] = now + trigger.debounce_seconds
+
+    def _fire_expired(self) -> None:
+        """Invoke on_change for subscribers whose debounce window closed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [name for name, deadline in self._deadlines.items() if deadline <= now]
+            batches = {name: self._pending.pop(name, set()) for name in expired}
+            for name in expired:
+                del self._deadlines[name]
+        for name, paths in batches.items():
+            # "" marks lost events: report an empty batch (full run).
+            batch = [] if "" in paths else sorted(paths)
+            try:
+                self._on_change(name, batch)
+            except Exception:  # noqa: BLE001
+                logger.exception("File watcher callback for %s failed", name)
@@ -0,0 +1,138 @@
+"""Tests for the GAIA task runner's rlimit-enforced resource budgets."""
+from __future__ import annotations
+
+import functools
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Allow direct imports from the runtime package when run via pytest from root.
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from runtime.task_budget import (
+    BUDGETS_AVAILABLE,
+    BudgetedTaskError,
+    BudgetExceededError,
+    ResourceBudget,
+    run_with_budget,
+)
+
+pytestmark = pytest.mark.skipif(not BUDGETS_AVAILABLE, reason="posix_spawn/rlimits unavailable")
+
+
+def _spin() -> None:
+    while True:
+        pass
+
+
+def _echo(value: object) -> object:
+    return value
+
+
+def _hog() -> bytearray:
+    return bytearray(1024 * 1024 * 1024)
+
+
+def _hoard() -> int:
+    handles = [open(__file__) for _ in range(64)]
+    return len(handles)
+
+
+def _divide_by_zero() -> float:
+    return 1 / 0
+
+
+def _sleep() -> None:
+    time.sleep(30)
+
+
+def _unpicklable_output() -> dict:
+    return {"lock": threading.Lock()}
+
+
+def _log() -> str:
+    logging.getLogger("gaia.tests.budget_child").warning("from the child")
+    return "logged"
+
+
+class TestResourceBudget:
+    def test_validation(self) -> None:
+        with pytest.raises(ValueError):
+            ResourceBudget(max_rss_mb=0)
+        with pytest.raises(ValueError):
+            ResourceBudget(max_cpu_seconds=-1)
+        with pytest.raises(ValueError):
+            ResourceBudget(max_open_files=2)
+        assert ResourceBudget(max_cpu_seconds=5).limits() == {"max_cpu_seconds": 5}
+
+
+class TestRunWithBudget:
+    def test_success_returns_output_and_usage(self) -> None:
+        usage: dict = {}
+        local = {"partial": True}
+        fn = functools.partial(_echo, local)
+        assert run_with_budget(fn, ResourceBudget(max_rss_mb=200), usage=usage) == local
+        resources = usage["resources"]
+        assert resources["peak_rss_mb"] > 0
+        assert resources["limits"] == {"max_rss_mb": 200}
+        assert usage["cpu_seconds"] == resources["cpu_seconds"]
+
+    def test_memory_budget(self) -> None:
+        usage: dict = {}
+        with pytest.raises(BudgetExceededError) as info:
+            run_with_budget(_hog, ResourceBudget(max_rss_mb=64), usage=usage)
+        assert info.value.resource == "memory"
+        assert info.value.limit == 64
+        assert "resources" in usage
+
+    def test_cpu_budget(self) -> None:
+        usage: dict = {}
+        with pytest.raises(BudgetExceededError) as info:
+            run_with_budget(_spin, ResourceBudget(max_cpu_seconds=1), timeout=10, usage=usage)
+        assert info.value.resource == "cpu"
+        assert usage["resources"]["cpu_seconds"] >= 0.9
+
+    def test_open_files_budget(self) -> None:
+        with pytest.raises(BudgetExceededError) as info:
+            run_with_budget(_hoard, ResourceBudget(max_open_files=32))
+        assert info.value.resource == "open_files"
+
+    def test_task_error_is_not_a_budget_violation(self) -> None:
+        with pytest.raises(BudgetedTaskError, match="ZeroDivisionError"):
+            run_with_budget(_divide_by_zero, ResourceBudget(max_rss_mb=200))
+
+    def test_timeout_kills_the_child(self) -> None:
+        started = time.monotonic()
+        with pytest.raises(TimeoutError):
+            run_with_budget(_sleep, ResourceBudget(max_rss_mb=200), timeout=0.3)
+        assert time.monotonic() - started < 5
+
+    def test_unpicklable_output_is_converted(self) -> None:
+        output = run_with_budget(_unpicklable_output, ResourceBudget(max_rss_mb=200))
+        assert isinstance(output["lock"], str)
+
+    def test_unpicklable_task_is_refused(self) -> None:
+        with pytest.raises(Exception, match="pickle|lambda"):
+            run_with_budget(lambda: None, ResourceBudget(max_rss_mb=200))
+
+    def test_locks_held_by_other_threads_do_not_reach_the_child(self) -> None:
+        """A forked child would inherit the held logging lock and hang."""
+        held, release = threading.Event(), threading.Event()
+
+        def hold_logging_lock() -> None:
+            with logging._lock:  # type: ignore[attr-defined]
+                held.set()
+                release.wait(10)
+
+        holder = threading.Thread(target=hold_logging_lock)
+        holder.start()
+        try:
+            held.wait(5)
+            assert run_with_budget(_log, ResourceBudget(max_rss_mb=200), timeout=10) == "logged"
+        finally:
+            release.set()
+            holder.join()
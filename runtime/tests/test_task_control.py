@@ -0,0 +1,123 @@
+"""Tests for the GAIA task runner's Unix-socket control server."""
+from __future__ import annotations
+
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+# Allow direct imports from the runtime package when run via pytest from root.
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from runtime.task_control import (
+    CONTROL_AVAILABLE,
+    ControlError,
+    handle_command,
+    send_command,
+    start_control_server,
+)
+from runtime.task_runner import TaskRunner
+
+pytestmark = pytest.mark.skipif(not CONTROL_AVAILABLE, reason="Unix sockets unavailable")
+
+
+@pytest.fixture
+def runner() -> TaskRunner:
+    runner = TaskRunner(register_defaults=False)
+    runner.register("probe", lambda: {"ok": 1}, interval_seconds=3600)
+    return runner
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    # AF_UNIX paths are limited to ~100 bytes; pytest's tmp_path can exceed it.
+    with tempfile.TemporaryDirectory(prefix="gaia-ctl-") as directory:
+        yield Path(directory) / "runner.sock"
+
+
+class TestHandleCommand:
+    def test_run_queues_without_executing(self, runner: TaskRunner) -> None:
+        response = handle_command(runner, "run probe")
+        assert response == {"ok": True, "queued": "probe", "paused": False}
+        assert runner.get_results() == {}
+        assert runner.run_once() == 1
+
+    def test_pause_and_resume_scheduler_and_tasks(self, runner: TaskRunner) -> None:
+        assert handle_command(runner, "pause")["paused"] is True
+        assert runner.paused
+        assert handle_command(runner, "resume")["paused"] is False
+        handle_command(runner, "pause probe")
+        assert not runner.list_tasks()[0].enabled
+        handle_command(runner, "resume probe")
+        assert runner.list_tasks()[0].enabled
+
+    def test_stats_and_results(self, runner: TaskRunner) -> None:
+        runner.run_all()
+        stats = handle_command(runner, "stats")
+        assert stats["tasks"]["probe"]["runs"] == 1
+        assert stats["paused"] is False
+        results = handle_command(runner, "results probe")["results"]
+        assert results["probe"]["output"] == {"ok": 1}
+
+    def test_errors_are_reported_not_raised(self, runner: TaskRunner) -> None:
+        assert handle_command(runner, "")["ok"] is False
+        assert "unknown command" in handle_command(runner, "explode")["error"]
+        assert "unknown task" in handle_command(runner, "run nope")["error"]
+        assert "usage" in handle_command(runner, "run")["error"]
+
+
+class TestControlServer:
+    def test_round_trip(self, runner: TaskRunner, socket_path: Path) -> None:
+        server = start_control_server(runner, socket_path)
+        try:
+            assert send_command(socket_path, "ping")["ok"] is True
+            assert send_command(socket_path, "tasks")["tasks"]["probe"]["schedule"] == 3600
+            with pytest.raises(ControlError, match="unknown task"):
+                send_command(socket_path, "run nope")
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert not socket_path.exists()
+
+    def test_commands_are_served_while_a_task_runs(self, socket_path: Path) -> None:
+        runner = TaskRunner(register_defaults=False)
+        release = threading.Event()
+        runner.register("slow", lambda: release.wait(5), interval_seconds=0)
+        server = start_control_server(runner, socket_path)
+        worker = threading.Thread(target=runner.run_once)
+        worker.start()
+        try:
+            time.sleep(0.05)
+            started = time.monotonic()
+            send_command(socket_path, "stats", timeout=2)
+            assert time.monotonic() - started < 1
+        finally:
+            release.set()
+            worker.join(5)
+            server.shutdown()
+            server.server_close()
+
+    def test_stale_socket_is_replaced(self, runner: TaskRunner, socket_path: Path) -> None:
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+        server = start_control_server(runner, socket_path)
+        try:
+            assert send_command(socket_path, "ping")["ok"]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_live_socket_is_not_stolen(self, runner: TaskRunner, socket_path: Path) -> None:
+        server = start_control_server(runner, socket_path)
+        try:
+            with pytest.raises(RuntimeError, match="already listening"):
+                start_control_server(runner, socket_path)
+        finally:
+            server.shutdown()
+            server.server_close()
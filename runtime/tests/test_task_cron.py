@@ -0,0 +1,71 @@
+"""Tests for the GAIA task runner's cron-expression schedules."""
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Allow direct imports from the runtime package when run via pytest from root.
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from runtime.task_cron import CronSchedule, parse_schedule
+
+
+def _next(expression: str, after: datetime) -> datetime:
+    """Return the next fire time as a naive local datetime."""
+    return datetime.fromtimestamp(parse_schedule(expression).next_fire(after.timestamp()))
+
+
+class TestParseSchedule:
+    def test_fields_are_expanded_once(self) -> None:
+        cron = parse_schedule("*/15 9-17/4 1,15 jan-mar mon-fri")
+        assert cron.minutes == (0, 15, 30, 45)
+        assert cron.hours == (9, 13, 17)
+        assert cron.days == (1, 15)
+        assert cron.months == (1, 2, 3)
+        assert cron.weekdays == (1, 2, 3, 4, 5)
+
+    @pytest.mark.parametrize("text", ["hourly", "@hourly", " HOURLY "])
+    def test_aliases_and_legacy_words(self, text: str) -> None:
+        assert parse_schedule(text).expression == "0 * * * *"
+
+    def test_parsed_schedules_are_cached(self) -> None:
+        assert parse_schedule("0 3 * * *") is parse_schedule("0 3 * * *")
+
+    def test_sunday_as_seven(self) -> None:
+        assert parse_schedule("0 0 * * 7").weekdays == (0,)
+
+    @pytest.mark.parametrize(
+        "text",
+        ["* * * *", "60 * * * *", "* 24 * * *", "*/0 * * * *", "x * * * *", "@fortnightly", "0 0 30 2 *"],
+    )
+    def test_invalid(self, text: str) -> None:
+        with pytest.raises(ValueError):
+            parse_schedule(text)
+
+
+class TestNextFire:
+    def test_daily_at_three(self) -> None:
+        assert _next("0 3 * * *", datetime(2024, 5, 1, 2, 59)) == datetime(2024, 5, 1, 3, 0)
+        assert _next("0 3 * * *", datetime(2024, 5, 1, 3, 0)) == datetime(2024, 5, 2, 3, 0)
+
+    def test_strictly_after(self) -> None:
+        assert _next("* * * * *", datetime(2024, 5, 1, 3, 0, 30)) == datetime(2024, 5, 1, 3, 1)
+
+    def test_rolls_over_month_and_year(self) -> None:
+        assert _next("0 0 1 * *", datetime(2024, 12, 15)) == datetime(2025, 1, 1)
+        assert _next("30 6 31 * *", datetime(2024, 4, 1)) == datetime(2024, 5, 31, 6, 30)
+
+    def test_leap_day(self) -> None:
+        assert _next("0 0 29 2 *", datetime(2025, 1, 1)) == datetime(2028, 2, 29)
+
+    def test_day_of_month_or_day_of_week(self) -> None:
+        """With both day fields restricted, either one matching fires."""
+        # 2024-05-03 is a Friday.
+        assert _next("0 12 15 * fri", datetime(2024, 5, 1)) == datetime(2024, 5, 3, 12)
+        assert _next("0 12 * * fri", datetime(2024, 5, 4)) == datetime(2024, 5, 10, 12)
+
+    def test_repr(self) -> None:
+        assert repr(CronSchedule("0 3 * * *")) == "CronSchedule('0 3 * * *')"
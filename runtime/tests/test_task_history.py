@@ -0,0 +1,110 @@
+"""Tests for the GAIA task runner's SQLite execution history."""
+from __future__ import annotations
+
+import sqlite3
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+# Allow direct imports from the runtime package when run via pytest from root.
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from runtime.task_history import TaskHistoryStore, parse_duration
+
+
+def _result(task: str, status: str = "success", age: float = 0.0, **extra) -> dict:
+    """Build a runner-shaped result dict started ``age`` seconds ago."""
+    started = datetime.fromtimestamp(time.time() - age, timezone.utc).isoformat()
+    result = {"task": task, "status": status, "timestamp": started, "duration_seconds": 1.0}
+    result.update(extra)
+    return result
+
+
+class TestParseDuration:
+    @pytest.mark.parametrize(
+        "text,seconds",
+        [("45", 45), ("90s", 90), ("30m", 1800), ("12h", 43200), ("7d", 604800), ("1w", 604800)],
+    )
+    def test_units(self, text: str, seconds: float) -> None:
+        assert parse_duration(text) == seconds
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            parse_duration("soon")
+
+
+class TestTaskHistoryStore:
+    def test_query_returns_newest_first(self, tmp_path: Path) -> None:
+        """Runs come back newest first and can be filtered by task and age."""
+        store = TaskHistoryStore(tmp_path / "h.db")
+        store.append(_result("a", age=3600 * 48))
+        store.append(_result("a", status="error", age=60, error="boom"))
+        store.append(_result("b", age=30, reason="x"))
+        runs = store.query("a")
+        assert [r["status"] for r in runs] == ["error", "success"]
+        assert runs[0]["error"] == "boom"
+        assert len(store.query("a", since_seconds=parse_duration("1d"))) == 1
+        assert store.query("b")[0]["reason"] == "x"
+        store.close()
+
+    def test_large_outputs_compressed_out_of_line(self, tmp_path: Path) -> None:
+        """Big payloads live in the outputs table and round-trip intact."""
+        store = TaskHistoryStore(tmp_path / "h.db", inline_output_bytes=64)
+        components = {f"proj{i}": {"exists": True, "has_git": True} for i in range(200)}
+        store.append(_result("health_check", output={"components": components}))
+        store.append(_result("tiny", output={"ok": 1}))
+        assert store.query("health_check", include_output=True)[0]["output"]["components"] == components
+        assert store.query("tiny", include_output=True)[0]["output"] == {"ok": 1}
+        assert "output" not in store.query("health_check")[0]
+        store.close()
+
+        conn = sqlite3.connect(str(tmp_path / "h.db"))
+        (blob,) = conn.execute("SELECT data FROM outputs").fetchone()
+        conn.close()
+        assert len(blob) < len(str(components))
+
+    def test_retention_by_count_and_age(self, tmp_path: Path) -> None:
+        """Pruning keeps the newest N per task, drops old runs and orphan outputs."""
+        store = TaskHistoryStore(
+            tmp_path / "h.db",
+            max_age_seconds=86400,
+            max_runs_per_task=3,
+            inline_output_bytes=0,
+            prune_every=1000,
+        )
+        for i in range(10):
+            store.append(_result("t", age=100 - i, output={"i": i}))
+        store.append(_result("old", age=2 * 86400))
+        assert store.prune() == 8
+        assert [r["output"]["i"] for r in store.query("t", include_output=True)] == [9, 8, 7]
+        assert store.query("old") == []
+        store.close()
+
+        conn = sqlite3.connect(str(tmp_path / "h.db"))
+        assert conn.execute("SELECT COUNT(*) FROM outputs").fetchone()[0] == 3
+        conn.close()
+
+    def test_summary_aggregates(self, tmp_path: Path) -> None:
+        """summary() reports success rate and duration statistics per task."""
+        store = TaskHistoryStore(tmp_path / "h.db")
+        for status, duration in [("success", 1.0), ("success", 3.0), ("error", 5.0), ("timeout", 7.0)]:
+            store.append(_result("t", status=status, duration_seconds=duration))
+        summary = store.summary("t")["t"]
+        assert summary["runs"] == 4
+        assert summary["success_rate"] == 0.5
+        assert summary["mean_duration_seconds"] == pytest.approx(4.0)
+        assert summary["max_duration_seconds"] == 7.0
+        assert summary["statuses"] == {"success": 2, "error": 1, "timeout": 1}
+        store.close()
+
+    def test_history_persists_across_reopen(self, tmp_path: Path) -> None:
+        path = tmp_path / "h.db"
+        first = TaskHistoryStore(path)
+        first.append(_result("t"))
+        first.close()
+        second = TaskHistoryStore(path)
+        assert len(second.query("t")) == 1
+        second.close()
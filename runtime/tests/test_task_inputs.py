@@ -0,0 +1,80 @@
+"""Tests for the GAIA task runner's input fingerprints."""
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Allow direct imports from the runtime package when run via pytest from root.
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from runtime.task_inputs import InputSet, fingerprint_paths, fingerprint_tree
+
+
+class TestFingerprintPaths:
+    def test_stable_when_untouched(self, tmp_path: Path) -> None:
+        (tmp_path / "a").write_text("x")
+        paths = [tmp_path / "a", tmp_path]
+        assert fingerprint_paths(paths) == fingerprint_paths(paths)
+
+    def test_detects_content_and_metadata_changes(self, tmp_path: Path) -> None:
+        target = tmp_path / "a"
+        target.write_text("x")
+        before = fingerprint_paths([target])
+        target.write_text("xy")
+        assert fingerprint_paths([target]) != before
+        before = fingerprint_paths([target])
+        os.utime(target, ns=(0, 0))
+        assert fingerprint_paths([target]) != before
+
+    def test_detects_appearing_and_directory_entries(self, tmp_path: Path) -> None:
+        missing = tmp_path / "later"
+        before = fingerprint_paths([missing, tmp_path])
+        missing.write_text("")
+        assert fingerprint_paths([missing, tmp_path]) != before
+
+    def test_path_identity_matters(self, tmp_path: Path) -> None:
+        assert fingerprint_paths([tmp_path / "a"]) != fingerprint_paths([tmp_path / "b"])
+
+
+class TestFingerprintTree:
+    def test_descends_and_respects_depth(self, tmp_path: Path) -> None:
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+        shallow = fingerprint_tree([tmp_path], max_depth=1)
+        deep = fingerprint_tree([tmp_path])
+        (nested / "f").write_text("x")
+        assert fingerprint_tree([tmp_path], max_depth=1) == shallow
+        assert fingerprint_tree([tmp_path]) != deep
+
+    def test_pruned_directory_recorded_not_walked(self, tmp_path: Path) -> None:
+        before = fingerprint_tree([tmp_path])
+        (tmp_path / ".git").mkdir()
+        with_git = fingerprint_tree([tmp_path])
+        assert with_git != before
+        (tmp_path / ".git" / "HEAD").write_text("ref")
+        assert fingerprint_tree([tmp_path]) == with_git
+
+    def test_file_edit_in_subdirectory(self, tmp_path: Path) -> None:
+        target = tmp_path / "pkg" / "mod.py"
+        target.parent.mkdir()
+        target.write_text("a = 1")
+        before = fingerprint_tree([tmp_path])
+        target.write_text("a = 22")
+        assert fingerprint_tree([tmp_path]) != before
+
+
+class TestInputSet:
+    def test_callable_paths_resolved_each_time(self, tmp_path: Path) -> None:
+        roots = [tmp_path / "one"]
+        inputs = InputSet(lambda: list(roots), max_depth=0)
+        before = inputs.fingerprint()
+        roots.append(tmp_path / "two")
+        assert inputs.fingerprint() != before
+
+    def test_static_paths_are_frozen(self, tmp_path: Path) -> None:
+        assert InputSet([tmp_path]).paths == (str(tmp_path),)
+        with pytest.raises(ValueError):
+            InputSet([tmp_path], max_depth=-1)
@@ -0,0 +1,112 @@
+"""Tests for the GAIA task runner's cross-process locks and leases."""
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Allow direct imports from the runtime package when run via pytest from root.
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from runtime import task_lock
+from runtime.task_lock import FileLock, TaskLeaseManager, fcntl
+
+pytestmark = pytest.mark.skipif(fcntl is None, reason="fcntl locking unavailable")
+
+
+class TestFileLock:
+    def test_second_holder_is_refused(self, tmp_path: Path) -> None:
+        """flock is per open file, so two objects conflict even in one process."""
+        first = FileLock(tmp_path / "daemon.lock")
+        second = FileLock(tmp_path / "daemon.lock")
+        assert first.acquire({"pid": 1})
+        assert not second.acquire()
+        assert second.read_metadata() == {"pid": 1}
+        first.release()
+        assert second.acquire()
+        second.release()
+
+    def test_context_manager(self, tmp_path: Path) -> None:
+        with FileLock(tmp_path / "x.lock") as lock:
+            assert lock.held
+            with pytest.raises(RuntimeError):
+                with FileLock(tmp_path / "x.lock"):
+                    pass
+        assert not lock.held
+
+    def test_release_is_idempotent(self, tmp_path: Path) -> None:
+        lock = FileLock(tmp_path / "x.lock")
+        lock.release()
+        assert lock.acquire()
+        lock.release()
+        lock.release()
+
+
+class TestTaskLeaseManager:
+    def test_lease_excludes_other_managers(self, tmp_path: Path) -> None:
+        first = TaskLeaseManager(tmp_path)
+        second = TaskLeaseManager(tmp_path)
+        assert first.acquire("warden_scan")
+        assert not second.acquire("warden_scan")
+        assert second.acquire("health_check")
+        assert second.holder("warden_scan")["task"] == "warden_scan"
+        first.release("warden_scan")
+        assert second.acquire("warden_scan")
+
+    def test_same_manager_does_not_double_acquire(self, tmp_path: Path) -> None:
+        leases = TaskLeaseManager(tmp_path)
+        assert leases.acquire("t")
+        assert not leases.acquire("t")
+
+    def test_stale_lease_is_broken(self, tmp_path: Path) -> None:
+        """A holder that overran its expiry no longer blocks the task."""
+        hung = TaskLeaseManager(tmp_path)
+        assert hung.acquire("t", lease_seconds=0.01)
+        time.sleep(0.05)
+        fresh = TaskLeaseManager(tmp_path)
+        assert fresh.acquire("t")
+        assert fresh.holder("t")["expires_at"] > time.time()
+        # The hung holder releasing its orphaned lock must not free the new lease.
+        hung.release("t")
+        assert not TaskLeaseManager(tmp_path).acquire("t")
+
+    def test_unexpired_lease_is_kept(self, tmp_path: Path) -> None:
+        holder = TaskLeaseManager(tmp_path, lease_seconds=60)
+        assert holder.acquire("t")
+        assert not TaskLeaseManager(tmp_path).acquire("t")
+        data = json.loads((tmp_path / "leases" / "t.lease").read_text())
+        assert data["expires_at"] > time.time()
+
+    def test_breaking_cannot_delete_a_lease_taken_meanwhile(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A runner racing the breaker waits, then sees the breaker's fresh lease."""
+        hung = TaskLeaseManager(tmp_path)
+        assert hung.acquire("t", lease_seconds=0.01)
+        time.sleep(0.05)
+        racer = TaskLeaseManager(tmp_path)
+        outcome: dict = {}
+
+        def race() -> None:
+            outcome["acquired"] = racer.acquire("t")
+
+        def warning(*args: object) -> None:
+            thread = threading.Thread(target=race)
+            thread.start()
+            thread.join(0.2)
+            outcome["blocked"] = thread.is_alive()
+            outcome["thread"] = thread
+
+        monkeypatch.setattr(task_lock.logger, "warning", warning)
+        breaker = TaskLeaseManager(tmp_path)
+        assert breaker.acquire("t")
+        outcome["thread"].join(5)
+        assert outcome["blocked"] is True
+        assert outcome["acquired"] is False
+        assert not TaskLeaseManager(tmp_path).acquire("t")
+        breaker.release("t")
+        assert TaskLeaseManager(tmp_path).acquire("t")
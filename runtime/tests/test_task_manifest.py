@@ -0,0 +1,222 @@
+"""Tests for the GAIA incremental scan manifest."""
+from __future__ import annotations
+
+import os
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+import pytest
+
+# Allow direct imports from the runtime package when run via pytest from root.
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from runtime import task_manifest
+from runtime.task_manifest import (
+    ScanManifest,
+    count_findings,
+    finding_to_dict,
+    hash_file,
+    scanner_identity,
+)
+from runtime.task_walk import PruneRules
+
+
+@dataclass
+class Finding:
+    path: Path
+    line: int
+    rule: str
+
+
+class FakeScanner:
+    """Flags lines containing ``SECRET`` and records which files it saw."""
+
+    version = "1.0"
+
+    def __init__(self, rules=("SECRET",)) -> None:
+        self.rules = list(rules)
+        self.seen: List[str] = []
+
+    def scan_file(self, path: str) -> List[Finding]:
+        self.seen.append(Path(path).name)
+        text = Path(path).read_text(encoding="utf-8")
+        return [
+            Finding(Path(path), number, rule)
+            for number, line in enumerate(text.splitlines(), 1)
+            for rule in self.rules
+            if rule in line
+        ]
+
+
+@pytest.fixture(autouse=True)
+def no_racy_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Trust freshly written mtimes so tests need not wait out the window."""
+    monkeypatch.setattr(task_manifest, "RACY_WINDOW_NS", -(10**18))
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    root = tmp_path / "root"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "a.py").write_text("x = 1\nkey = 'SECRET'\n", encoding="utf-8")
+    (root / "pkg" / "b.py").write_text("y = 2\n", encoding="utf-8")
+    (root / "c.env").write_text("TOKEN=SECRET\n", encoding="utf-8")
+    return root
+
+
+def _update(manifest: ScanManifest, root: Path, scanner: FakeScanner) -> dict:
+    return manifest.update(root, scanner.scan_file, scanner_identity(scanner), max_workers=1)
+
+
+class TestHelpers:
+    def test_hash_file_is_content_based(self, tmp_path: Path) -> None:
+        one, two = tmp_path / "one", tmp_path / "two"
+        one.write_bytes(b"same")
+        two.write_bytes(b"same")
+        assert hash_file(one) == hash_file(two)
+        two.write_bytes(b"different")
+        assert hash_file(one) != hash_file(two)
+
+    def test_scanner_identity_tracks_version_and_rules(self) -> None:
+        base = FakeScanner()
+        assert scanner_identity(base) == scanner_identity(FakeScanner())
+        assert scanner_identity(base) != scanner_identity(FakeScanner(rules=("SECRET", "KEY")))
+        bumped = FakeScanner()
+        bumped.version = "1.1"  # type: ignore[misc]
+        assert scanner_identity(base) != scanner_identity(bumped)
+
+    def test_scanner_identity_sees_full_regex_patterns(self) -> None:
+        long_a = FakeScanner(rules=[re.compile("a" * 300 + "x")])
+        long_b = FakeScanner(rules=[re.compile("a" * 300 + "y")])
+        assert scanner_identity(long_a) != scanner_identity(long_b)
+
+    def test_finding_to_dict(self) -> None:
+        assert finding_to_dict(Finding(Path("a.py"), 2, "SECRET")) == {
+            "path": "a.py",
+            "line": 2,
+            "rule": "SECRET",
+        }
+        assert finding_to_dict({"line": 1}) == {"line": 1}
+        assert finding_to_dict("raw") == {"finding": "raw"}
+        assert count_findings({"a": [{}, {}], "b": [{}]}) == 3
+
+
+class TestScanManifest:
+    def test_first_run_scans_everything(self, tree: Path, tmp_path: Path) -> None:
+        scanner = FakeScanner()
+        outcome = _update(ScanManifest(tmp_path / "manifest.json"), tree, scanner)
+        assert sorted(scanner.seen) == ["a.py", "b.py", "c.env"]
+        assert outcome["full_rescan"] is True
+        assert (outcome["files"], outcome["rescanned"], outcome["hashed"]) == (3, 3, 3)
+        assert count_findings(outcome["findings"]) == 2
+        assert outcome["findings"][str(tree / "pkg" / "a.py")] == [
+            {"path": str(tree / "pkg" / "a.py"), "line": 2, "rule": "SECRET"}
+        ]
+
+    def test_only_changed_files_are_rescanned(self, tree: Path, tmp_path: Path) -> None:
+        manifest = ScanManifest(tmp_path / "manifest.json")
+        first = _update(manifest, tree, FakeScanner())
+
+        scanner = FakeScanner()
+        second = _update(manifest, tree, scanner)
+        assert scanner.seen == []
+        assert (second["full_rescan"], second["hashed"], second["rescanned"]) == (False, 0, 0)
+        assert second["findings"] == first["findings"]
+
+        (tree / "pkg" / "b.py").write_text("y = 'SECRET'\n", encoding="utf-8")
+        (tree / "c.env").unlink()
+        (tree / "new.py").write_text("z = 3\n", encoding="utf-8")
+        third = _update(manifest, tree, scanner)
+        assert sorted(scanner.seen) == ["b.py", "new.py"]
+        assert (third["rescanned"], third["removed"], third["files"]) == (2, 1, 3)
+        assert sorted(Path(path).name for path in third["findings"]) == ["a.py", "b.py"]
+
+    def test_touched_but_identical_files_are_not_rescanned(
+        self, tree: Path, tmp_path: Path
+    ) -> None:
+        manifest = ScanManifest(tmp_path / "manifest.json")
+        _update(manifest, tree, FakeScanner())
+        target = tree / "pkg" / "a.py"
+        st = target.stat()
+        os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        scanner = FakeScanner()
+        outcome = _update(manifest, tree, scanner)
+        assert (scanner.seen, outcome["hashed"]) == ([], 1)
+        assert count_findings(outcome["findings"]) == 2
+        again = FakeScanner()
+        assert _update(manifest, tree, again)["hashed"] == 0
+
+    def test_rule_change_forces_full_rescan(self, tree: Path, tmp_path: Path) -> None:
+        manifest = ScanManifest(tmp_path / "manifest.json")
+        _update(manifest, tree, FakeScanner())
+        scanner = FakeScanner(rules=("SECRET", "x ="))
+        outcome = _update(manifest, tree, scanner)
+        assert outcome["full_rescan"] is True
+        assert sorted(scanner.seen) == ["a.py", "b.py", "c.env"]
+        assert count_findings(outcome["findings"]) == 3
+
+    def test_scanner_errors_are_retried_next_run(self, tree: Path, tmp_path: Path) -> None:
+        manifest = ScanManifest(tmp_path / "manifest.json")
+        scanner = FakeScanner()
+
+        def flaky(path: str) -> List[Finding]:
+            if path.endswith("b.py"):
+                raise UnicodeDecodeError("utf-8", b"", 0, 1, "bad")
+            return scanner.scan_file(path)
+
+        outcome = manifest.update(tree, flaky, scanner_identity(scanner), max_workers=1)
+        assert (outcome["errors"], outcome["files"]) == (1, 2)
+        retry = FakeScanner()
+        assert _update(manifest, tree, retry)["rescanned"] == 1
+        assert retry.seen == ["b.py"]
+
+    def test_racy_mtimes_are_rehashed(
+        self, tree: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(task_manifest, "RACY_WINDOW_NS", 10**18)
+        manifest = ScanManifest(tmp_path / "manifest.json")
+        _update(manifest, tree, FakeScanner())
+        scanner = FakeScanner()
+        outcome = _update(manifest, tree, scanner)
+        assert (outcome["hashed"], outcome["rescanned"], scanner.seen) == (3, 0, [])
+
+    def test_manifest_inside_root_and_pruned_dirs_are_skipped(self, tree: Path) -> None:
+        (tree / ".git").mkdir()
+        (tree / ".git" / "config").write_text("SECRET", encoding="utf-8")
+        manifest = ScanManifest(tree / ".manifest.json")
+        _update(manifest, tree, FakeScanner())
+        scanner = FakeScanner()
+        outcome = manifest.update(
+            tree, scanner.scan_file, scanner_identity(scanner), prune=PruneRules(names={".git"})
+        )
+        assert outcome["files"] == 3
+        assert scanner.seen == []
+
+    def test_failed_rescan_keeps_previous_findings(self, tree: Path, tmp_path: Path) -> None:
+        manifest = ScanManifest(tmp_path / "manifest.json")
+        first = _update(manifest, tree, FakeScanner())
+        (tree / "c.env").write_text("TOKEN=SECRET\nOTHER=1\n", encoding="utf-8")
+
+        def broken(path: str) -> List[Finding]:
+            raise OSError("scanner crashed")
+
+        outcome = manifest.update(tree, broken, scanner_identity(FakeScanner()), max_workers=1)
+        assert (outcome["errors"], outcome["files"]) == (1, 3)
+        assert outcome["findings"] == first["findings"]
+        retry = FakeScanner()
+        assert _update(manifest, tree, retry)["rescanned"] == 1
+        assert retry.seen == ["c.env"]
+
+    def test_ignored_file_names_are_not_scanned(self, tree: Path, tmp_path: Path) -> None:
+        (tree / ".state.json").write_text("SECRET", encoding="utf-8")
+        (tree / "..state.json.x1.tmp").write_text("SECRET", encoding="utf-8")
+        manifest = ScanManifest(tmp_path / "manifest.json")
+        scanner = FakeScanner()
+        outcome = manifest.update(
+            tree, scanner.scan_file, scanner_identity(scanner), ignore=["*.state.json*"]
+        )
+        assert outcome["files"] == 3
+        assert sorted(scanner.seen) == ["a.py", "b.py", "c.env"]
@@ -0,0 +1,107 @@
+"""Tests for GAIA task runner execution metrics."""
+from __future__ import annotations
+
+import json
+import sys
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+# Allow direct imports from the runtime package when run via pytest from root.
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from runtime.task_metrics import TaskMetrics, percentile, start_metrics_server
+
+
+class TestPercentile:
+    def test_nearest_rank(self) -> None:
+        """percentile uses nearest-rank on a sorted list."""
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 0.5) == 50.0
+        assert percentile(values, 0.95) == 95.0
+        assert percentile(values, 0.99) == 99.0
+        assert percentile([3.0], 0.99) == 3.0
+
+
+class TestTaskMetrics:
+    def test_window_must_be_positive(self) -> None:
+        with pytest.raises(ValueError):
+            TaskMetrics(window=0)
+
+    def test_snapshot_summarises_samples(self) -> None:
+        """Snapshot reports counts, status totals and percentiles."""
+        metrics = TaskMetrics()
+        for i in range(1, 11):
+            metrics.observe("t", "success", wall_seconds=float(i), cpu_seconds=0.5)
+        metrics.observe("t", "error", wall_seconds=100.0)
+        entry = metrics.snapshot()["t"]
+        assert entry["runs"] == 11
+        assert entry["statuses"] == {"success": 10, "error": 1}
+        assert entry["wall_seconds"]["max"] == 100.0
+        assert entry["wall_seconds"]["p50"] == 6.0
+        assert entry["cpu_seconds"]["count"] == 10
+        assert entry["rss_delta_kb"]["count"] == 0
+        assert entry["last_wall_seconds"] == 100.0
+
+    def test_memory_is_bounded_by_window(self) -> None:
+        """Only the last `window` samples feed the percentiles."""
+        metrics = TaskMetrics(window=5)
+        for i in range(1000):
+            metrics.observe("t", "success", wall_seconds=float(i))
+        entry = metrics.snapshot()["t"]
+        assert entry["runs"] == 1000
+        assert entry["wall_seconds"]["count"] == 5
+        assert entry["wall_seconds"]["p50"] == 997.0
+
+    def test_prometheus_exposition(self) -> None:
+        """Prometheus text contains counters and summary quantiles."""
+        metrics = TaskMetrics()
+        metrics.observe('we"ird', "success", wall_seconds=0.25, cpu_seconds=0.1)
+        text = metrics.to_prometheus()
+        assert '# TYPE gaia_task_runs_total counter' in text
+        assert 'gaia_task_runs_total{task="we\\"ird",status="success"} 1' in text
+        assert 'gaia_task_wall_seconds{task="we\\"ird",quantile="0.95"} 0.25' in text
+        assert "gaia_task_rss_delta_kb_count" not in text
+        assert "gaia_lane_queue_seconds" not in text
+        assert text.endswith("\n")
+
+    def test_cache_counters(self) -> None:
+        metrics = TaskMetrics()
+        assert "gaia_task_cache" not in metrics.to_prometheus()
+        for hit in (False, True, True, True):
+            metrics.observe_cache("health_check", hit=hit)
+        assert metrics.cache_snapshot()["health_check"] == {"hits": 3, "misses": 1, "hit_rate": 0.75}
+        text = metrics.to_prometheus()
+        assert 'gaia_task_cache_hits_total{task="health_check"} 3' in text
+        assert 'gaia_task_cache_misses_total{task="health_check"} 1' in text
+
+    def test_lane_queue_delays(self) -> None:
+        metrics = TaskMetrics(window=3)
+        for delay in (0.5, 0.1, 0.2, 0.3):
+            metrics.observe_queue("bulk", delay)
+        metrics.observe_queue("critical", 0.0)
+        lanes = metrics.lane_snapshot()
+        assert lanes["bulk"]["count"] == 3
+        assert lanes["bulk"]["max"] == 0.3
+        assert lanes["critical"]["p99"] == 0.0
+        assert 'gaia_lane_queue_seconds{lane="bulk",quantile="0.5"} 0.2' in metrics.to_prometheus()
+
+
+class TestMetricsServer:
+    def test_serves_metrics_and_stats(self) -> None:
+        """The HTTP endpoint exposes /metrics and /stats and 404s elsewhere."""
+        metrics = TaskMetrics()
+        metrics.observe("t", "success", wall_seconds=0.1)
+        server = start_metrics_server(metrics, port=0)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            with urllib.request.urlopen(f"{base}/metrics", timeout=5) as resp:
+                assert b"gaia_task_wall_seconds" in resp.read()
+            with urllib.request.urlopen(f"{base}/stats", timeout=5) as resp:
+                assert json.loads(resp.read())["t"]["runs"] == 1
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"{base}/nope", timeout=5)
+        finally:
+            server.shutdown()
+            server.server_close()
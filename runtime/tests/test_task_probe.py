@@ -0,0 +1,248 @@
+"""Tests for the GAIA health-check project probes."""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+# Allow direct imports from the runtime package when run via pytest from root.
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from runtime.task_probe import (
+    git_head,
+    probe_project,
+    probe_projects,
+    probe_projects_cached,
+    project_fingerprint,
+)
+
+
+def _project(root: Path, git: bool = True, tests: bool = True, claude: bool = True) -> Path:
+    root.mkdir(parents=True)
+    if git:
+        (root / ".git").mkdir()
+    if claude:
+        (root / "CLAUDE.md").write_text("# notes", encoding="utf-8")
+    (root / "tests").mkdir()
+    if tests:
+        (root / "tests" / "test_core.py").write_text("", encoding="utf-8")
+    return root
+
+
+class TestProbeProject:
+    def test_complete_project(self, tmp_path: Path) -> None:
+        root = _project(tmp_path / "atlas")
+        assert probe_project(root) == {
+            "exists": True,
+            "has_git": True,
+            "has_tests": True,
+            "has_claude_md": True,
+        }
+
+    def test_missing_markers(self, tmp_path: Path) -> None:
+        root = _project(tmp_path / "atlas", git=False, tests=False, claude=False)
+        (root / "tests" / "conftest.py").write_text("", encoding="utf-8")
+        (root / "test_root.py").write_text("", encoding="utf-8")
+        assert probe_project(root) == {
+            "exists": True,
+            "has_git": False,
+            "has_tests": False,
+            "has_claude_md": False,
+        }
+
+    def test_git_file_counts_for_worktrees(self, tmp_path: Path) -> None:
+        root = _project(tmp_path / "atlas", git=False)
+        (root / ".git").write_text("gitdir: ../main/.git/worktrees/atlas", encoding="utf-8")
+        assert probe_project(root)["has_git"] is True
+
+    def test_missing_folder(self, tmp_path: Path) -> None:
+        assert probe_project(tmp_path / "nope") == {
+            "exists": False,
+            "has_git": False,
+            "has_tests": False,
+            "has_claude_md": False,
+        }
+
+    def test_file_instead_of_folder(self, tmp_path: Path) -> None:
+        path = tmp_path / "atlas"
+        path.write_text("", encoding="utf-8")
+        health = probe_project(path)
+        assert health["exists"] is True
+        assert not any(health[key] for key in ("has_git", "has_tests", "has_claude_md"))
+
+
+class TestProbeProjects:
+    def test_preserves_order_and_results(self, tmp_path: Path) -> None:
+        projects = {f"p{i}": _project(tmp_path / f"p{i}", git=i % 2 == 0) for i in range(6)}
+        projects["missing"] = tmp_path / "missing"
+        results = probe_projects(projects, max_workers=2)
+        assert list(results) == list(projects)
+        assert [results[f"p{i}"]["has_git"] for i in range(6)] == [True, False] * 3
+        assert results["missing"]["exists"] is False
+
+    def test_concurrency_is_bounded(self) -> None:
+        lock = threading.Lock()
+        active = {"now": 0, "peak": 0}
+
+        def probe(path: str) -> Dict[str, Any]:
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            return {"exists": True}
+
+        results = probe_projects({str(i): str(i) for i in range(9)}, max_workers=3, probe=probe)
+        assert len(results) == 9
+        assert active["peak"] == 3
+
+    def test_hung_probe_times_out_without_blocking_others(self) -> None:
+        release = threading.Event()
+
+        def probe(path: str) -> Dict[str, Any]:
+            if path == "hung":
+                release.wait(5)
+            return {"exists": True, "path": path}
+
+        started = time.monotonic()
+        try:
+            results = probe_projects(
+                {"hung": "hung", "a": "a", "b": "b"}, max_workers=1, timeout=0.2, probe=probe
+            )
+        finally:
+            release.set()
+        assert time.monotonic() - started < 2
+        assert results["hung"]["exists"] is False
+        assert "timed out" in results["hung"]["error"]
+        assert results["a"] == {"exists": True, "path": "a"}
+        assert results["b"] == {"exists": True, "path": "b"}
+
+    def test_still_hung_path_is_not_probed_again(self) -> None:
+        release = threading.Event()
+        calls = []
+
+        def probe(path: str) -> Dict[str, Any]:
+            calls.append(path)
+            if path == "stuck":
+                release.wait(5)
+            return {"exists": True}
+
+        try:
+            first = probe_projects({"s": "stuck"}, timeout=0.1, probe=probe)
+            started = time.monotonic()
+            second = probe_projects({"s": "stuck", "a": "a"}, timeout=0.1, probe=probe)
+            assert time.monotonic() - started < 0.1
+        finally:
+            release.set()
+        assert "timed out" in first["s"]["error"]
+        assert "still running" in second["s"]["error"]
+        assert second["a"] == {"exists": True}
+        assert calls == ["stuck", "a"]
+
+        deadline = time.monotonic() + 5
+        while any(t.name == "gaia-probe-s" for t in threading.enumerate()):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert probe_projects({"s": "stuck"}, timeout=1, probe=probe) == {"s": {"exists": True}}
+        assert calls == ["stuck", "a", "stuck"]
+
+    def test_probe_exception_is_reported(self) -> None:
+        def probe(path: str) -> Dict[str, Any]:
+            raise PermissionError("denied")
+
+        results = probe_projects({"x": "x"}, probe=probe)
+        assert results["x"]["exists"] is False
+        assert "denied" in results["x"]["error"]
+
+    def test_validation(self) -> None:
+        with pytest.raises(ValueError):
+            probe_projects({}, max_workers=0)
+        with pytest.raises(ValueError):
+            probe_projects({}, timeout=0)
+        assert probe_projects({}) == {}
+
+
+class TestGitHead:
+    def test_branch_loose_and_packed(self, tmp_path: Path) -> None:
+        root = _project(tmp_path / "atlas")
+        (root / ".git" / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+        assert git_head(root) == "refs/heads/main"
+        (root / ".git" / "packed-refs").write_text(
+            "# pack-refs with: peeled\nabc123 refs/heads/main\n", encoding="utf-8"
+        )
+        assert git_head(root) == "refs/heads/main abc123"
+        (root / ".git" / "refs" / "heads").mkdir(parents=True)
+        (root / ".git" / "refs" / "heads" / "main").write_text("def456\n", encoding="utf-8")
+        assert git_head(root) == "refs/heads/main def456"
+
+    def test_detached_and_worktree(self, tmp_path: Path) -> None:
+        main = _project(tmp_path / "main")
+        (main / ".git" / "HEAD").write_text("0123abcd\n", encoding="utf-8")
+        assert git_head(main) == "0123abcd"
+        worktree = _project(tmp_path / "wt", git=False)
+        (worktree / ".git").write_text("gitdir: ../main/.git\n", encoding="utf-8")
+        assert git_head(worktree) == "0123abcd"
+
+    def test_no_git(self, tmp_path: Path) -> None:
+        assert git_head(_project(tmp_path / "atlas", git=False)) is None
+        assert git_head(tmp_path / "missing") is None
+
+
+class TestProbeProjectsCached:
+    def _counting_probe(self, calls: list):
+        def probe(path: str) -> Dict[str, Any]:
+            calls.append(Path(path).name)
+            return probe_project(path)
+
+        return probe
+
+    def test_reprobes_only_changed_projects(self, tmp_path: Path) -> None:
+        projects = {name: _project(tmp_path / name) for name in ("a", "b", "c")}
+        calls: list = []
+        probe = self._counting_probe(calls)
+        results, cache, hits = probe_projects_cached(projects, {}, probe=probe)
+        assert (sorted(calls), hits) == (["a", "b", "c"], 0)
+        assert all(health["has_tests"] for health in results.values())
+
+        calls.clear()
+        again, cache, hits = probe_projects_cached(projects, cache, probe=probe)
+        assert (calls, hits, again) == ([], 3, results)
+
+        (projects["b"] / "tests" / "test_core.py").unlink()
+        changed, cache, hits = probe_projects_cached(projects, cache, probe=probe)
+        assert (calls, hits) == (["b"], 2)
+        assert changed["b"]["has_tests"] is False
+        assert list(changed) == ["a", "b", "c"]
+
+    def test_head_change_and_path_change_invalidate(self, tmp_path: Path) -> None:
+        root = _project(tmp_path / "a")
+        (root / ".git" / "HEAD").write_text("1111\n", encoding="utf-8")
+        _, cache, _ = probe_projects_cached({"a": root}, {})
+        fingerprint = cache["a"]["fingerprint"]
+        (root / ".git" / "HEAD").write_text("2222\n", encoding="utf-8")
+        assert project_fingerprint(root) != fingerprint
+        _, _, hits = probe_projects_cached({"a": root}, cache)
+        assert hits == 0
+        other = _project(tmp_path / "other")
+        _, _, hits = probe_projects_cached({"a": other}, cache)
+        assert hits == 0
+
+    def test_failures_are_not_cached(self, tmp_path: Path) -> None:
+        def probe(path: str) -> Dict[str, Any]:
+            raise OSError("stale handle")
+
+        projects = {"a": _project(tmp_path / "a")}
+        results, cache, hits = probe_projects_cached(projects, {}, probe=probe)
+        assert "stale handle" in results["a"]["error"]
+        assert (cache, hits) == ({}, 0)
+
+    def test_removed_projects_are_dropped(self, tmp_path: Path) -> None:
+        projects = {"a": _project(tmp_path / "a"), "b": _project(tmp_path / "b")}
+        _, cache, _ = probe_projects_cached(projects, {})
+        _, cache, hits = probe_projects_cached({"a": projects["a"]}, cache)
+        assert (list(cache), hits) == (["a"], 1)
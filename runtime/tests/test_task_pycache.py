@@ -0,0 +1,165 @@
+"""Tests for the GAIA bytecode cache eviction policy."""
+from __future__ import annotations
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Allow direct imports from the runtime package when run via pytest from root.
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from runtime.task_pycache import (
+    BytecodePolicy,
+    CachedBytecode,
+    evict_bytecode,
+    plan_eviction,
+    scan_bytecode,
+    source_name,
+)
+
+NOW = 1_700_000_000.0
+
+
+def _pyc(path: str, size: int = 10, used: float = NOW, dir_mtime: float = NOW, orphan=False):
+    return CachedBytecode(
+        path=path,
+        source=None,
+        size=size,
+        last_used=used,
+        cache_dir_mtime=dir_mtime,
+        orphan=orphan,
+    )
+
+
+class TestSourceName:
+    @pytest.mark.parametrize(
+        "pyc, source",
+        [
+            ("util.cpython-311.pyc", "util.py"),
+            ("util.cpython-312.opt-1.pyc", "util.py"),
+            ("util.cpython-313.opt-2.pyc", "util.py"),
+            ("a.b.cpython-39.pyc", "a.b.py"),
+            ("mod.pypy39.pyc", "mod.py"),
+            ("legacy.pyc", None),
+        ],
+    )
+    def test_maps_pep3147_names(self, pyc: str, source) -> None:
+        assert source_name(pyc) == source
+
+
+class TestBytecodePolicy:
+    def test_validation(self) -> None:
+        with pytest.raises(ValueError):
+            BytecodePolicy(max_age_seconds=0)
+        with pytest.raises(ValueError):
+            BytecodePolicy(max_total_bytes=-1)
+        assert BytecodePolicy(max_total_bytes=0).max_total_bytes == 0
+
+
+class TestScanBytecode:
+    def test_detects_orphans_per_interpreter(self, tmp_path: Path) -> None:
+        cache = tmp_path / "__pycache__"
+        cache.mkdir()
+        (tmp_path / "live.py").write_text("", encoding="utf-8")
+        for name in (
+            "live.cpython-311.pyc",
+            "live.cpython-312.opt-1.pyc",
+            "dead.cpython-311.pyc",
+            "legacy.pyc",
+        ):
+            (cache / name).write_bytes(b"x" * 7)
+        (cache / "notes.txt").write_text("", encoding="utf-8")
+        files = {Path(f.path).name: f for f in scan_bytecode([str(cache)])}
+        assert set(files) == {
+            "live.cpython-311.pyc",
+            "live.cpython-312.opt-1.pyc",
+            "dead.cpython-311.pyc",
+            "legacy.pyc",
+        }
+        assert [n for n, f in sorted(files.items()) if f.orphan] == ["dead.cpython-311.pyc"]
+        assert files["live.cpython-311.pyc"].source == str(tmp_path / "live.py")
+        assert files["legacy.pyc"].source is None
+        assert files["dead.cpython-311.pyc"].size == 7
+
+    def test_last_used_is_later_of_atime_and_mtime(self, tmp_path: Path) -> None:
+        cache = tmp_path / "__pycache__"
+        cache.mkdir()
+        pyc = cache / "m.cpython-311.pyc"
+        pyc.write_bytes(b"")
+        os.utime(pyc, (NOW + 50, NOW))
+        assert scan_bytecode([str(cache)])[0].last_used == NOW + 50
+        os.utime(pyc, (NOW - 50, NOW))
+        assert scan_bytecode([str(cache)])[0].last_used == NOW
+
+    def test_missing_dirs_are_skipped(self, tmp_path: Path) -> None:
+        assert scan_bytecode([str(tmp_path / "gone" / "__pycache__")]) == []
+
+
+class TestPlanEviction:
+    def test_orphans_then_stale_then_lru_budget(self) -> None:
+        files = [
+            _pyc("orphan", size=5, orphan=True),
+            _pyc("stale", size=5, dir_mtime=NOW - 2 * 86400),
+            _pyc("newest", size=10, used=NOW),
+            _pyc("oldest", size=10, used=NOW - 300),
+            _pyc("middle", size=10, used=NOW - 200),
+        ]
+        policy = BytecodePolicy(max_age_seconds=86400, max_total_bytes=15)
+        plan = [(pyc.path, reason) for pyc, reason in plan_eviction(files, policy, now=NOW)]
+        assert plan == [
+            ("orphan", "orphan"),
+            ("stale", "stale"),
+            ("oldest", "budget"),
+            ("middle", "budget"),
+        ]
+
+    def test_rules_can_be_disabled(self) -> None:
+        files = [_pyc("o", orphan=True), _pyc("s", dir_mtime=0.0)]
+        policy = BytecodePolicy(max_age_seconds=None, remove_orphans=False)
+        assert plan_eviction(files, policy, now=NOW) == []
+
+    def test_within_budget_evicts_nothing(self) -> None:
+        files = [_pyc("a", size=10), _pyc("b", size=10)]
+        assert plan_eviction(files, BytecodePolicy(max_total_bytes=20), now=NOW) == []
+
+
+class TestEvictBytecode:
+    def _tree(self, tmp_path: Path) -> Path:
+        cache = tmp_path / "__pycache__"
+        cache.mkdir()
+        (tmp_path / "keep.py").write_text("", encoding="utf-8")
+        (cache / "keep.cpython-311.pyc").write_bytes(b"k" * 30)
+        (cache / "gone.cpython-311.pyc").write_bytes(b"g" * 20)
+        return cache
+
+    def test_dry_run_reports_without_deleting(self, tmp_path: Path) -> None:
+        cache = self._tree(tmp_path)
+        report = evict_bytecode(scan_bytecode([str(cache)]), BytecodePolicy(), dry_run=True)
+        assert report["dry_run"] is True
+        assert (report["files"], report["total_bytes"]) == (2, 50)
+        assert (report["removed"], report["bytes_reclaimed"]) == (1, 20)
+        assert report["remaining_bytes"] == 30
+        assert report["by_reason"]["orphan"] == {"files": 1, "bytes": 20}
+        assert report["evictions"] == [
+            {"path": str(cache / "gone.cpython-311.pyc"), "reason": "orphan", "size": 20}
+        ]
+        assert (cache / "gone.cpython-311.pyc").exists()
+
+    def test_real_run_matches_dry_run(self, tmp_path: Path) -> None:
+        cache = self._tree(tmp_path)
+        policy = BytecodePolicy(max_total_bytes=0)
+        dry = evict_bytecode(scan_bytecode([str(cache)]), policy, dry_run=True, now=time.time())
+        real = evict_bytecode(scan_bytecode([str(cache)]), policy, now=time.time())
+        assert real["by_reason"] == dry["by_reason"]
+        assert real["remaining_bytes"] == 0
+        assert list(cache.iterdir()) == []
+
+    def test_already_deleted_files_are_not_counted(self, tmp_path: Path) -> None:
+        cache = self._tree(tmp_path)
+        files = scan_bytecode([str(cache)])
+        (cache / "gone.cpython-311.pyc").unlink()
+        report = evict_bytecode(files, BytecodePolicy())
+        assert (report["removed"], report["errors"]) == (0, 0)
@@ -6,8 +6,16 @@ both APIs remain tested simultaneously.
 """
 from __future__ import annotations
 
+import asyncio
+import io
+import json
+import logging
+import os
+import subprocess
 import sys
+import threading
 import time
+import types
 from pathlib import Path
 from unittest.mock import patch
 
@@ -16,13 +24,34 @@ import pytest
 # Allow direct imports from the runtime package when run via pytest from root.
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from runtime.task_budget import BUDGETS_AVAILABLE
 from runtime.task_runner import (
+    HISTORY_FILENAME,
+    LOCK_DIRNAME,
+    MAX_MISSED_RUNS,
     REGISTERED_TASKS,
+    STATE_FILENAME,
+    WARDEN_MANIFEST_FILENAME,
+    AdaptiveInterval,
+    AsyncTaskRunner,
+    EventTrigger,
+    RetryPolicy,
+    RunnerLockedError,
     ScheduledTask,
     TaskRunner,
+    _build_arg_parser,
+    _NdjsonWriter,
+    _peak_rss_kb,
+    _pickle_safe,
+    _task_health_check,
+    _task_stale_cache_cleanup,
+    _task_warden_scan,
     list_tasks,
+    main,
+    project_fields,
     register_task,
     run_all_once,
+    run_due_once,
     task_health_check,
     task_stale_cache_cleanup,
 )
@@ -37,6 +66,29 @@ def _make_runner() -> TaskRunner:
     return TaskRunner(register_defaults=False)
 
 
+# Process-executor and budgeted tasks must be importable module-level callables.
+
+
+def _proc_square() -> dict:
+    return {"pid": os.getpid(), "value": 7 * 7}
+
+
+def _proc_fail() -> None:
+    raise ValueError("worker boom")
+
+
+def _proc_crash() -> None:
+    os._exit(3)
+
+
+def _proc_hang() -> None:
+    time.sleep(30)
+
+
+def _proc_hog() -> bytearray:
+    return bytearray(1024 * 1024 * 1024)
+
+
 # ---------------------------------------------------------------------------
 # Class-based API — TaskRunner
 # ---------------------------------------------------------------------------
@@ -229,6 +281,1415 @@ class TestGetResults:
         assert "t" in results
 
 
+class TestConcurrentMode:
+    def test_max_workers_must_be_positive(self) -> None:
+        """max_workers below 1 is rejected."""
+        with pytest.raises(ValueError):
+            TaskRunner(register_defaults=False, max_workers=0)
+
+    def test_due_tasks_overlap_in_pool(self) -> None:
+        """With max_workers > 1 a cycle takes roughly the slowest task's time."""
+        runner = TaskRunner(register_defaults=False, max_workers=3)
+        for name in ("a", "b", "c"):
+            runner.register(name, lambda: time.sleep(0.2), interval_seconds=0)
+        start = time.monotonic()
+        count = runner.run_once()
+        elapsed = time.monotonic() - start
+        assert count == 3
+        assert elapsed < 0.5
+        assert set(runner.get_results()) == {"a", "b", "c"}
+
+    def test_exclusive_task_never_overlaps(self) -> None:
+        """An exclusive task runs only when no other task is in flight."""
+        runner = TaskRunner(register_defaults=False, max_workers=4)
+        active: list[str] = []
+        overlaps: list[int] = []
+        guard = threading.Lock()
+
+        def make(name: str):
+            def fn() -> None:
+                with guard:
+                    active.append(name)
+                    if "solo" in active and len(active) > 1:
+                        overlaps.append(len(active))
+                time.sleep(0.05)
+                with guard:
+                    active.remove(name)
+
+            return fn
+
+        runner.register("solo", make("solo"), interval_seconds=0, exclusive=True)
+        for name in ("a", "b", "c"):
+            runner.register(name, make(name), interval_seconds=0)
+        assert runner.run_all() == 4
+        assert overlaps == []
+        assert runner.list_tasks()[0].exclusive is True
+
+    def test_results_and_last_run_recorded_for_every_task(self) -> None:
+        """Concurrent execution records last_run and a result for each task."""
+        runner = TaskRunner(register_defaults=False, max_workers=8)
+        for i in range(20):
+            runner.register(f"t{i}", lambda i=i: i, interval_seconds=60)
+        runner.run_once()
+        results = runner.get_results()
+        assert len(results) == 20
+        assert all(r["status"] == "success" for r in results.values())
+        assert all(t.last_run is not None for t in runner.list_tasks())
+        assert runner.run_once() == 0
+
+
+class TestProcessExecutor:
+    def test_register_rejects_unknown_executor(self) -> None:
+        """Only 'thread' and 'process' executors are accepted."""
+        runner = _make_runner()
+        with pytest.raises(ValueError):
+            runner.register("t", _proc_square, interval_seconds=0, executor="gpu")
+
+    def test_process_task_runs_in_worker(self) -> None:
+        """A process task runs in another PID and its output reaches get_results."""
+        runner = TaskRunner(register_defaults=False, max_processes=1)
+        runner.register("sq", _proc_square, interval_seconds=0, executor="process")
+        try:
+            runner.run_once()
+        finally:
+            runner.close()
+        result = runner.get_results()["sq"]
+        assert result["status"] == "success"
+        assert result["output"]["value"] == 49
+        assert result["output"]["pid"] != os.getpid()
+
+    def test_process_task_exception_reported_as_error(self) -> None:
+        """An exception inside the worker becomes an error result."""
+        runner = TaskRunner(register_defaults=False, max_processes=1)
+        runner.register("bad", _proc_fail, interval_seconds=0, executor="process")
+        try:
+            runner.run_once()
+        finally:
+            runner.close()
+        result = runner.get_results()["bad"]
+        assert result["status"] == "error"
+        assert "worker boom" in result["error"]
+
+    def test_worker_crash_is_task_error_and_pool_recovers(self) -> None:
+        """A dying worker is recorded as an error and later tasks still run."""
+        runner = TaskRunner(register_defaults=False, max_processes=1)
+        runner.register("crash", _proc_crash, interval_seconds=0, executor="process")
+        runner.register("sq", _proc_square, interval_seconds=0, executor="process")
+        try:
+            runner.run_once()
+            runner.run_once()
+        finally:
+            runner.close()
+        results = runner.get_results()
+        assert results["crash"]["status"] == "error"
+        assert "crashed" in results["crash"]["error"]
+        assert results["sq"]["status"] == "success"
+
+    def test_pickle_safe_converts_unpicklable_output(self) -> None:
+        """Unpicklable values are marshalled to JSON-safe equivalents."""
+        lock = threading.Lock()
+        assert _pickle_safe({"a": 1}) == {"a": 1}
+        converted = _pickle_safe({"lock": lock})
+        assert isinstance(converted["lock"], str)
+
+    def test_default_cpu_bound_tasks_use_process_executor(self) -> None:
+        """warden_scan and guardrail_check are dispatched to the process pool."""
+        runner = TaskRunner(register_defaults=True)
+        executors = {t.name: t.executor for t in runner.list_tasks()}
+        assert executors["warden_scan"] == "process"
+        assert executors["guardrail_check"] == "process"
+        assert executors["health_check"] == "thread"
+
+
+class TestAsyncTaskRunner:
+    def test_async_tasks_run_concurrently(self) -> None:
+        """Many coroutine tasks complete in about the time of one."""
+        runner = AsyncTaskRunner(register_defaults=False, max_concurrency=200)
+
+        async def probe() -> str:
+            await asyncio.sleep(0.1)
+            return "up"
+
+        for i in range(200):
+            runner.register(f"p{i}", probe, interval_seconds=60)
+        start = time.monotonic()
+        count = asyncio.run(runner.run_once())
+        assert count == 200
+        assert time.monotonic() - start < 1.0
+        assert runner.get_results()["p0"]["output"] == "up"
+        assert asyncio.run(runner.run_once()) == 0
+
+    def test_state_and_history_survive_restart(self, tmp_path: Path) -> None:
+        state, history = tmp_path / "state.json", tmp_path / "history.db"
+
+        async def probe() -> str:
+            return "up"
+
+        first = AsyncTaskRunner(register_defaults=False, state_path=state, history_path=history)
+        first.register("ping", probe, interval_seconds=3600)
+        assert asyncio.run(first.run_once()) == 1
+        first.close()
+
+        second = AsyncTaskRunner(register_defaults=False, state_path=state, history_path=history)
+        second.register("ping", probe, interval_seconds=3600)
+        assert second.list_tasks()[0].last_run == first.list_tasks()[0].last_run
+        assert second.get_results()["ping"]["output"] == "up"
+        assert asyncio.run(second.run_once()) == 0
+        assert second.history.summary("ping")["ping"]["runs"] == 1
+        second.close()
+
+    def test_semaphore_bounds_in_flight_tasks(self) -> None:
+        """No more than max_concurrency tasks are awaited at once."""
+        runner = AsyncTaskRunner(register_defaults=False, max_concurrency=3)
+        in_flight = 0
+        peak = 0
+
+        async def probe() -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        for i in range(10):
+            runner.register(f"p{i}", probe, interval_seconds=0)
+        asyncio.run(runner.run_all())
+        assert peak == 3
+
+    def test_sync_tasks_wrapped_in_threads(self) -> None:
+        """Synchronous tasks run via asyncio.to_thread and record results."""
+        runner = AsyncTaskRunner(register_defaults=False)
+        loop_thread = threading.get_ident()
+        runner.register("sync", threading.get_ident, interval_seconds=0)
+        asyncio.run(runner.run_once())
+        assert runner.get_results()["sync"]["output"] != loop_thread
+
+    def test_async_task_error_recorded(self) -> None:
+        """Exceptions from coroutine tasks become error results."""
+        runner = AsyncTaskRunner(register_defaults=False)
+
+        async def bad() -> None:
+            raise RuntimeError("probe failed")
+
+        runner.register("bad", bad, interval_seconds=0)
+        asyncio.run(runner.run_once())
+        result = runner.get_results()["bad"]
+        assert result["status"] == "error"
+        assert "probe failed" in result["error"]
+
+    def test_coroutine_rejected_for_process_executor(self) -> None:
+        """Coroutine functions cannot be dispatched to worker processes."""
+        runner = AsyncTaskRunner(register_defaults=False)
+
+        async def probe() -> None:
+            return None
+
+        with pytest.raises(ValueError):
+            runner.register("p", probe, interval_seconds=0, executor="process")
+
+
+class TestNextDueScheduling:
+    def test_seconds_until_next_due(self) -> None:
+        """The heap reports None when empty, 0 when due, else the remaining wait."""
+        runner = _make_runner()
+        assert runner.seconds_until_next_due() is None
+        runner.register("t", lambda: None, interval_seconds=120)
+        assert runner.seconds_until_next_due() == 0.0
+        runner.run_once()
+        remaining = runner.seconds_until_next_due()
+        assert remaining is not None and 119 < remaining <= 120
+
+    def test_disabled_tasks_are_not_scheduled(self) -> None:
+        """disable() removes a task from the next-due computation; enable() restores it."""
+        runner = _make_runner()
+        runner.register("t", lambda: None, interval_seconds=60)
+        runner.disable("t")
+        assert runner.seconds_until_next_due() is None
+        assert runner.run_once() == 0
+        runner.enable("t")
+        assert runner.seconds_until_next_due() == 0.0
+
+    def test_wall_clock_jump_does_not_fire_tasks(self) -> None:
+        """After a run, a forward wall-clock jump leaves the task not due."""
+        runner = _make_runner()
+        runner.register("t", lambda: None, interval_seconds=60)
+        runner.run_once()
+        jumped = time.time() + 86400
+        with patch("runtime.task_runner.time.time", return_value=jumped):
+            assert runner.list_tasks()[0].is_due() is False
+
+    def test_run_forever_supports_sub_second_intervals(self) -> None:
+        """The daemon loop sleeps until the next due time, not a fixed minute."""
+        runner = _make_runner()
+        calls: list[float] = []
+        runner.register("fast", lambda: calls.append(time.monotonic()), interval_seconds=0.1)
+        worker = threading.Thread(target=runner.run_forever, kwargs={"min_sleep": 0.01})
+        worker.start()
+        time.sleep(0.55)
+        runner.stop()
+        worker.join(timeout=2)
+        assert not worker.is_alive()
+        assert 3 <= len(calls) <= 7
+
+    def test_register_wakes_sleeping_daemon(self) -> None:
+        """Registering a task wakes a daemon that is sleeping on a long interval."""
+        runner = _make_runner()
+        runner.register("slow", lambda: None, interval_seconds=3600)
+        ran = threading.Event()
+        worker = threading.Thread(target=runner.run_forever, kwargs={"min_sleep": 0.01})
+        worker.start()
+        time.sleep(0.1)
+        runner.register("new", ran.set, interval_seconds=3600)
+        assert ran.wait(timeout=2)
+        runner.stop()
+        worker.join(timeout=2)
+        assert not worker.is_alive()
+
+
+class TestPersistentState:
+    def test_last_run_survives_restart(self, tmp_path: Path) -> None:
+        """A restarted runner does not re-run a task that already ran."""
+        state = tmp_path / "state.json"
+        calls: list[int] = []
+        first = TaskRunner(register_defaults=False, state_path=state)
+        first.register("daily", lambda: calls.append(1), interval_seconds=86400)
+        first.run_once()
+
+        second = TaskRunner(register_defaults=False, state_path=state)
+        second.register("daily", lambda: calls.append(2), interval_seconds=86400)
+        assert second.run_once() == 0
+        assert calls == [1]
+        assert second.get_results()["daily"]["status"] == "success"
+
+    def test_enabled_flag_survives_restart(self, tmp_path: Path) -> None:
+        """disable() is persisted and re-applied on registration."""
+        state = tmp_path / "state.json"
+        first = TaskRunner(register_defaults=False, state_path=state)
+        first.register("t", lambda: None, interval_seconds=0)
+        first.disable("t")
+
+        second = TaskRunner(register_defaults=False, state_path=state)
+        second.register("t", lambda: None, interval_seconds=0)
+        assert second.list_tasks()[0].enabled is False
+
+    def test_unregistered_task_state_is_preserved(self, tmp_path: Path) -> None:
+        """Flushing from a runner with fewer tasks keeps other tasks' state."""
+        state = tmp_path / "state.json"
+        first = TaskRunner(register_defaults=False, state_path=state)
+        first.register("a", lambda: None, interval_seconds=60)
+        first.run_once()
+
+        second = TaskRunner(register_defaults=False, state_path=state)
+        second.register("b", lambda: None, interval_seconds=60)
+        second.run_once()
+
+        third = TaskRunner(register_defaults=False, state_path=state)
+        third.register("a", lambda: None, interval_seconds=60)
+        assert third.run_once() == 0
+
+    def test_no_state_path_writes_nothing(self, tmp_path: Path) -> None:
+        """Without state_path the runner keeps state in memory only."""
+        runner = TaskRunner(register_defaults=False)
+        runner.register("t", lambda: None, interval_seconds=0)
+        runner.run_once()
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestTimeouts:
+    def test_register_rejects_non_positive_timeout(self) -> None:
+        """timeout_seconds must be positive when given."""
+        runner = _make_runner()
+        with pytest.raises(ValueError):
+            runner.register("t", lambda: None, interval_seconds=0, timeout_seconds=0)
+
+    def test_hung_thread_task_records_timeout(self, caplog: pytest.LogCaptureFixture) -> None:
+        """An overrunning task is abandoned with status 'timeout' and stacks logged."""
+        runner = _make_runner()
+        release = threading.Event()
+        runner.register("hang", lambda: release.wait(5), interval_seconds=0, timeout_seconds=0.1)
+        runner.register("after", lambda: "ok", interval_seconds=0)
+        start = time.monotonic()
+        with caplog.at_level("ERROR", logger="gaia.runtime.task_runner"):
+            runner.run_once()
+        assert time.monotonic() - start < 2
+        results = runner.get_results()
+        assert results["hang"]["status"] == "timeout"
+        assert results["after"]["status"] == "success"
+        assert runner.list_tasks()[0].last_run is not None
+        assert "thread stacks" in caplog.text
+        assert "Thread" in caplog.text
+
+        # While the abandoned run is alive the task is not started again.
+        runner.run_once()
+        assert "still running" in runner.get_results()["hang"]["error"]
+        release.set()
+
+        # The abandoned thread clears its own entry once its call returns.
+        deadline = time.monotonic() + 5
+        while runner._hung_threads:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        runner.run_once()
+        assert runner.get_results()["hang"]["status"] == "success"
+
+    def test_concurrent_hung_runs_share_the_registry(self) -> None:
+        """Workers timing out together all register, and later runs are refused."""
+        runner = TaskRunner(register_defaults=False, max_workers=4)
+        release = threading.Event()
+        for i in range(4):
+            runner.register(
+                f"hang{i}", lambda: release.wait(5), interval_seconds=0, timeout_seconds=0.1
+            )
+        try:
+            runner.run_once()
+            assert sorted(runner._hung_threads) == [f"hang{i}" for i in range(4)]
+            runner.run_once()
+            results = runner.get_results()
+            assert all("still running" in results[f"hang{i}"]["error"] for i in range(4))
+        finally:
+            release.set()
+
+    def test_task_within_timeout_succeeds(self) -> None:
+        """A task finishing before its deadline keeps its output and errors."""
+        runner = _make_runner()
+        runner.register("ok", lambda: 42, interval_seconds=0, timeout_seconds=5)
+        runner.register("bad", lambda: 1 / 0, interval_seconds=0, timeout_seconds=5)
+        runner.run_once()
+        results = runner.get_results()
+        assert results["ok"]["output"] == 42
+        assert results["bad"]["status"] == "error"
+
+    def test_hung_process_task_is_terminated(self) -> None:
+        """A process task past its deadline has its worker killed."""
+        runner = TaskRunner(register_defaults=False, max_processes=1)
+        runner.register(
+            "hang", _proc_hang, interval_seconds=0, executor="process", timeout_seconds=0.5
+        )
+        start = time.monotonic()
+        try:
+            runner.run_once()
+        finally:
+            runner.close()
+        assert time.monotonic() - start < 10
+        assert runner.get_results()["hang"]["status"] == "timeout"
+
+    def test_async_task_timeout_cancels_coroutine(self) -> None:
+        """AsyncTaskRunner cancels coroutine tasks that overrun."""
+        runner = AsyncTaskRunner(register_defaults=False)
+
+        async def slow() -> None:
+            await asyncio.sleep(5)
+
+        runner.register("slow", slow, interval_seconds=0, timeout_seconds=0.1)
+        asyncio.run(runner.run_once())
+        assert runner.get_results()["slow"]["status"] == "timeout"
+
+
+class TestExecutionMetrics:
+    def test_results_include_duration_and_cpu(self) -> None:
+        """Each result records wall and CPU time for the run."""
+        runner = _make_runner()
+
+        def busy() -> int:
+            return sum(range(200_000))
+
+        runner.register("busy", busy, interval_seconds=0)
+        runner.register("nap", lambda: time.sleep(0.05), interval_seconds=0)
+        runner.run_once()
+        results = runner.get_results()
+        assert results["busy"]["cpu_seconds"] > 0
+        assert results["nap"]["duration_seconds"] >= 0.05
+        assert results["nap"]["cpu_seconds"] < results["nap"]["duration_seconds"]
+
+    def test_get_stats_tracks_runs_and_percentiles(self) -> None:
+        """get_stats aggregates repeated runs, including failures."""
+        runner = _make_runner()
+        runner.register("t", lambda: None, interval_seconds=0)
+        runner.register("bad", lambda: 1 / 0, interval_seconds=0)
+        for _ in range(5):
+            runner.run_once()
+        stats = runner.get_stats()
+        assert stats["t"]["runs"] == 5
+        assert stats["t"]["wall_seconds"]["count"] == 5
+        assert stats["t"]["wall_seconds"]["p99"] is not None
+        assert stats["bad"]["statuses"] == {"error": 5}
+
+    @pytest.mark.skipif(_peak_rss_kb() is None, reason="ru_maxrss unavailable")
+    def test_rss_delta_only_for_runs_without_overlap(self) -> None:
+        """Process-wide peak RSS growth is not attributed to overlapping tasks."""
+        serial = _make_runner()
+        serial.register("t", lambda: None, interval_seconds=0)
+        serial.run_once()
+        assert serial.get_stats()["t"]["rss_delta_kb"]["count"] == 1
+
+        runner = TaskRunner(register_defaults=False, max_workers=2)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def hog() -> int:
+            barrier.wait()
+            return len(bytearray(64 * 1024 * 1024))
+
+        runner.register("hog", hog, interval_seconds=0)
+        runner.register("small", barrier.wait, interval_seconds=0)
+        runner.run_once()
+        results = runner.get_results()
+        assert results["hog"]["status"] == results["small"]["status"] == "success"
+        stats = runner.get_stats()
+        assert stats["hog"]["rss_delta_kb"]["count"] == 0
+        assert stats["small"]["rss_delta_kb"]["count"] == 0
+
+    def test_process_task_reports_worker_cpu(self) -> None:
+        """CPU time of process tasks is measured in the worker."""
+        runner = TaskRunner(register_defaults=False, max_processes=1)
+        runner.register("sq", _proc_square, interval_seconds=0, executor="process")
+        try:
+            runner.run_once()
+        finally:
+            runner.close()
+        assert runner.get_results()["sq"]["cpu_seconds"] is not None
+        assert runner.get_stats()["sq"]["runs"] == 1
+
+
+class TestDependencies:
+    def test_cycle_rejected_at_registration(self) -> None:
+        """A registration closing a dependency loop raises and is not stored."""
+        runner = _make_runner()
+        runner.register("a", lambda: None, interval_seconds=0, depends_on=["c"])
+        runner.register("b", lambda: None, interval_seconds=0, depends_on=["a"])
+        with pytest.raises(ValueError, match="cycle"):
+            runner.register("c", lambda: None, interval_seconds=0, depends_on=["b"])
+        with pytest.raises(ValueError):
+            runner.register("self", lambda: None, interval_seconds=0, depends_on=["self"])
+        assert [t.name for t in runner.list_tasks()] == ["a", "b"]
+
+    def test_serial_mode_runs_prerequisites_first(self) -> None:
+        """Dependents run after prerequisites regardless of registration order."""
+        runner = _make_runner()
+        order: list[str] = []
+        runner.register("late", lambda: order.append("late"), interval_seconds=0, depends_on=["early"])
+        runner.register("early", lambda: order.append("early"), interval_seconds=0)
+        runner.run_once()
+        assert order == ["early", "late"]
+
+    def test_failure_skips_downstream_transitively(self) -> None:
+        """A failed prerequisite skips its dependents and their dependents."""
+        runner = _make_runner()
+        ran: list[str] = []
+        runner.register("root", lambda: 1 / 0, interval_seconds=0)
+        runner.register("mid", lambda: ran.append("mid"), interval_seconds=0, depends_on=["root"])
+        runner.register("leaf", lambda: ran.append("leaf"), interval_seconds=0, depends_on=["mid"])
+        runner.register("other", lambda: ran.append("other"), interval_seconds=0)
+        count = runner.run_once()
+        results = runner.get_results()
+        assert ran == ["other"]
+        assert count == 2
+        assert results["mid"]["status"] == "skipped"
+        assert "root" in results["mid"]["reason"]
+        assert results["leaf"]["status"] == "skipped"
+
+    def test_previous_failure_of_idle_prerequisite_skips(self) -> None:
+        """A prerequisite not due this cycle still blocks if it last failed."""
+        runner = _make_runner()
+        runner.register("check", lambda: 1 / 0, interval_seconds=3600)
+        runner.run_once()
+        runner.register("act", lambda: None, interval_seconds=0, depends_on=["check"])
+        runner.run_once()
+        assert runner.get_results()["act"]["status"] == "skipped"
+
+    def test_concurrent_dag_starts_dependents_early(self) -> None:
+        """Dependents start when their own prerequisites finish, not the batch."""
+        runner = TaskRunner(register_defaults=False, max_workers=4)
+        marks: dict[str, float] = {}
+        t0 = time.monotonic()
+
+        def make(name: str, delay: float):
+            def fn() -> None:
+                time.sleep(delay)
+                marks[name] = time.monotonic() - t0
+
+            return fn
+
+        runner.register("fast", make("fast", 0.05), interval_seconds=0)
+        runner.register("slow", make("slow", 0.4), interval_seconds=0)
+        runner.register("after_fast", make("after_fast", 0.05), interval_seconds=0, depends_on=["fast"])
+        runner.register(
+            "after_both", make("after_both", 0.0), interval_seconds=0, depends_on=["fast", "slow"]
+        )
+        assert runner.run_once() == 4
+        assert marks["after_fast"] < marks["slow"]
+        assert marks["after_both"] >= marks["slow"]
+
+    def test_async_runner_honours_dependencies(self) -> None:
+        """AsyncTaskRunner waits on prerequisites and skips after failures."""
+        runner = AsyncTaskRunner(register_defaults=False)
+        order: list[str] = []
+
+        async def first() -> None:
+            await asyncio.sleep(0.05)
+            order.append("first")
+
+        async def second() -> None:
+            order.append("second")
+
+        async def broken() -> None:
+            raise RuntimeError("down")
+
+        runner.register("second", second, interval_seconds=0, depends_on=["first"])
+        runner.register("first", first, interval_seconds=0)
+        runner.register("broken", broken, interval_seconds=0)
+        runner.register("blocked", second, interval_seconds=0, depends_on=["broken"])
+        assert asyncio.run(runner.run_once()) == 3
+        assert order == ["first", "second"]
+        assert runner.get_results()["blocked"]["status"] == "skipped"
+
+    def test_output_reported_failure_skips_dependents(self) -> None:
+        """A prerequisite that returns an error status or missing components blocks."""
+        runner = _make_runner()
+        runner.register("probe", lambda: {"status": "error", "message": "down"}, interval_seconds=0)
+        runner.register("act", lambda: None, interval_seconds=0, depends_on=["probe"])
+        runner.register(
+            "scan",
+            lambda: {"status": "success", "components": {"a": {"exists": False}}},
+            interval_seconds=0,
+        )
+        runner.register("fix", lambda: None, interval_seconds=0, depends_on=["scan"])
+        runner.run_once()
+        results = runner.get_results()
+        assert results["act"]["reason"] == "dependency probe reported error: down"
+        assert results["fix"]["reason"] == "dependency scan reported 1 missing components (a)"
+
+    def test_builtin_guardrail_skipped_after_failed_health_check(self, tmp_path: Path) -> None:
+        """With no registry.json, guardrail_check never runs after health_check."""
+        runner = TaskRunner(register_defaults=True)
+        for name in ("warden_scan", "stale_cache_cleanup", "baseline_update"):
+            runner.disable(name)
+        with patch("runtime.task_runner._GAIA_ROOT", str(tmp_path)):
+            runner.run_once()
+        runner.close()
+        results = runner.get_results()
+        assert results["health_check"]["output"]["status"] == "error"
+        assert results["guardrail_check"]["status"] == "skipped"
+        assert "health_check reported error" in results["guardrail_check"]["reason"]
+
+    def test_default_dependency_graph(self) -> None:
+        """Built-in tasks declare guardrail -> health and baseline -> scans."""
+        runner = TaskRunner(register_defaults=True)
+        deps = {t.name: set(t.depends_on) for t in runner.list_tasks()}
+        assert deps["guardrail_check"] == {"health_check"}
+        assert deps["baseline_update"] == {"warden_scan", "guardrail_check"}
+
+
+class TestRetryPolicy:
+    def test_delay_grows_exponentially_and_caps(self) -> None:
+        """Backoff doubles per failure up to max_delay_seconds."""
+        policy = RetryPolicy(max_attempts=10, base_delay_seconds=1, max_delay_seconds=5, jitter=0)
+        assert [policy.delay_for(n) for n in range(1, 6)] == [1, 2, 4, 5, 5]
+
+    def test_jitter_only_shortens_delay(self) -> None:
+        """Jittered delays fall within [(1 - jitter) * d, d]."""
+        policy = RetryPolicy(base_delay_seconds=10, jitter=0.5)
+        delays = [policy.delay_for(1) for _ in range(200)]
+        assert all(5 <= d <= 10 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_invalid_policy_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+        with pytest.raises(ValueError):
+            RetryPolicy(jitter=1.5)
+
+    def test_failure_retries_before_interval(self) -> None:
+        """A failing task becomes due after the backoff, not the full interval."""
+        runner = _make_runner()
+        calls: list[int] = []
+
+        def flaky() -> str:
+            calls.append(1)
+            if len(calls) < 3:
+                raise RuntimeError("transient")
+            return "ok"
+
+        policy = RetryPolicy(max_attempts=5, base_delay_seconds=0.05, jitter=0)
+        runner.register("flaky", flaky, interval_seconds=86400, retry=policy)
+        runner.run_once()
+        result = runner.get_results()["flaky"]
+        assert result["retry"]["attempt"] == 1
+        assert result["retry"]["backoff_seconds"] == pytest.approx(0.05)
+        assert "next_retry_at" in result["retry"]
+        assert runner.run_once() == 0
+        remaining = runner.seconds_until_next_due()
+        assert remaining is not None and remaining <= 0.05
+
+        time.sleep(0.06)
+        runner.run_once()
+        assert runner.get_results()["flaky"]["retry"]["backoff_seconds"] == pytest.approx(0.1)
+        time.sleep(0.11)
+        runner.run_once()
+        result = runner.get_results()["flaky"]
+        assert result["status"] == "success"
+        assert result["retry"] == {"attempt": 3, "max_attempts": 5}
+        assert runner.list_tasks()[0].retry_at is None
+        assert runner.run_once() == 0
+
+    def test_retries_exhaust_back_to_interval(self) -> None:
+        """After max_attempts failures the task waits its normal interval."""
+        runner = _make_runner()
+        policy = RetryPolicy(max_attempts=2, base_delay_seconds=0.01, jitter=0)
+        runner.register("broken", lambda: 1 / 0, interval_seconds=86400, retry=policy)
+        runner.run_once()
+        time.sleep(0.02)
+        runner.run_once()
+        result = runner.get_results()["broken"]
+        assert result["retry"]["exhausted"] is True
+        time.sleep(0.02)
+        assert runner.run_once() == 0
+        assert runner.list_tasks()[0].failures == 0
+
+    def test_retry_state_persists(self, tmp_path: Path) -> None:
+        """A pending retry survives a restart through the state store."""
+        state = tmp_path / "state.json"
+        policy = RetryPolicy(base_delay_seconds=3600, jitter=0)
+        first = TaskRunner(register_defaults=False, state_path=state)
+        first.register("t", lambda: 1 / 0, interval_seconds=86400, retry=policy)
+        first.run_once()
+
+        second = TaskRunner(register_defaults=False, state_path=state)
+        second.register("t", lambda: None, interval_seconds=86400, retry=policy)
+        task = second.list_tasks()[0]
+        assert task.failures == 1
+        remaining = second.seconds_until_next_due()
+        assert remaining is not None and 3500 < remaining <= 3600
+
+
+class TestExecutionHistory:
+    def test_every_result_is_appended(self, tmp_path: Path) -> None:
+        """Each execution, including skips, lands in the history store."""
+        runner = TaskRunner(register_defaults=False, history_path=tmp_path / "h.db")
+        runner.register("ok", lambda: {"n": 1}, interval_seconds=0)
+        runner.register("bad", lambda: 1 / 0, interval_seconds=0)
+        runner.register("after", lambda: None, interval_seconds=0, depends_on=["bad"])
+        runner.run_once()
+        runner.run_once()
+        history = runner.history
+        assert history is not None
+        assert len(history.query("ok")) == 2
+        assert history.summary("bad")["bad"]["success_rate"] == 0.0
+        assert history.query("after")[0]["status"] == "skipped"
+        runner.close()
+        assert runner.history is None
+
+    def test_history_disabled_by_default(self) -> None:
+        assert _make_runner().history is None
+
+
+class TestCrossProcessLocking:
+    def test_task_leased_elsewhere_is_skipped(self, tmp_path: Path) -> None:
+        """A second runner sharing lock_dir leaves a leased task alone."""
+        first = TaskRunner(register_defaults=False, lock_dir=tmp_path)
+        second = TaskRunner(register_defaults=False, lock_dir=tmp_path)
+        calls = []
+        second.register("shared", lambda: calls.append("shared"), interval_seconds=0)
+        second.register("other", lambda: calls.append("other"), interval_seconds=0)
+        assert first._leases.acquire("shared")
+        try:
+            assert second.run_once() == 1
+        finally:
+            first._leases.release("shared")
+        assert calls == ["other"]
+        assert "shared" not in second.get_results()
+        # The leased task waits out its backoff instead of retrying every tick.
+        assert second.run_once() == 1
+        shared = next(t for t in second.list_tasks() if t.name == "shared")
+        shared._lease_wait_until = time.monotonic()
+        assert second.run_once() == 2
+
+    def test_lease_retries_back_off_and_log_once(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        holder = TaskRunner(register_defaults=False, lock_dir=tmp_path)
+        runner = TaskRunner(register_defaults=False, lock_dir=tmp_path)
+        runner.register("shared", lambda: None, interval_seconds=60)
+        task = runner.list_tasks()[0]
+        assert holder._leases.acquire("shared")
+        delays = []
+        try:
+            with caplog.at_level(logging.DEBUG, logger="gaia.runtime.task_runner"):
+                for _ in range(6):
+                    task._lease_wait_until = None
+                    assert runner.run_once() == 0
+                    delays.append(round(task._lease_wait_until - time.monotonic()))
+        finally:
+            holder._leases.release("shared")
+        assert delays == [5, 10, 20, 40, 60, 60]
+        levels = [r.levelno for r in caplog.records if "lease held" in r.getMessage()]
+        assert levels == [logging.INFO] + [logging.DEBUG] * 5
+        task._lease_wait_until = None
+        assert runner.run_once() == 1
+        assert task._lease_misses == 0 and task._lease_wait_until is None
+
+    def test_lease_released_after_failure(self, tmp_path: Path) -> None:
+        runner = TaskRunner(register_defaults=False, max_workers=2, lock_dir=tmp_path)
+        runner.register("bad", lambda: 1 / 0, interval_seconds=0)
+        runner.register("ok", lambda: None, interval_seconds=0)
+        runner.run_once()
+        other = TaskRunner(register_defaults=False, lock_dir=tmp_path)
+        assert other._leases.acquire("bad")
+        other._leases.release("bad")
+
+    def test_async_runner_honours_leases(self, tmp_path: Path) -> None:
+        holder = TaskRunner(register_defaults=False, lock_dir=tmp_path)
+        runner = AsyncTaskRunner(register_defaults=False, lock_dir=tmp_path)
+        runner.register("shared", lambda: None, interval_seconds=0)
+        assert holder._leases.acquire("shared")
+        try:
+            assert asyncio.run(runner.run_once()) == 0
+        finally:
+            holder._leases.release("shared")
+        assert asyncio.run(runner.run_once()) == 0
+        runner.list_tasks()[0]._lease_wait_until = None
+        assert asyncio.run(runner.run_once()) == 1
+
+    def test_second_daemon_refuses_to_start(self, tmp_path: Path) -> None:
+        first = TaskRunner(register_defaults=False, lock_dir=tmp_path)
+        second = TaskRunner(register_defaults=False, lock_dir=tmp_path)
+        thread = threading.Thread(target=first.run_forever, kwargs={"min_sleep": 0.01})
+        thread.start()
+        try:
+            deadline = time.monotonic() + 5
+            while not first._daemon_lock.held and time.monotonic() < deadline:
+                time.sleep(0.01)
+            with pytest.raises(RunnerLockedError, match=str(os.getpid())):
+                second.run_forever()
+        finally:
+            first.stop()
+            thread.join(timeout=5)
+        assert not first._daemon_lock.held
+
+
+class TestCronSchedules:
+    def test_interval_or_schedule_required(self) -> None:
+        runner = _make_runner()
+        with pytest.raises(ValueError):
+            runner.register("t", lambda: None)
+        with pytest.raises(ValueError):
+            runner.register("t", lambda: None, interval_seconds=60, schedule="@daily")
+        with pytest.raises(ValueError):
+            runner.register("t", lambda: None, schedule="0 25 * * *")
+
+    def test_not_due_until_first_fire(self) -> None:
+        """A never-run cron task waits for its fire time instead of running now."""
+        runner = _make_runner()
+        runner.register("nightly", lambda: None, schedule="0 3 * * *")
+        task = runner.list_tasks()[0]
+        fire = task.next_fire_time()
+        assert fire is not None and fire > time.time()
+        assert not task.is_due()
+        assert runner.run_once() == 0
+        remaining = runner.seconds_until_next_due()
+        assert remaining is not None and abs(remaining - (fire - time.time())) < 1
+
+    def test_first_registration_anchor_shared_across_runners(self, tmp_path: Path) -> None:
+        """A fresh process measures a never-run cron task from its first registration."""
+        state = tmp_path / "state.json"
+        first = TaskRunner(register_defaults=False, state_path=state)
+        first.register("nightly", lambda: None, schedule="0 3 * * *")
+        anchor = first.list_tasks()[0]._cron_base
+        saved = json.loads(state.read_text(encoding="utf-8"))
+        assert saved["tasks"]["nightly"]["cron_base"] == anchor
+
+        # Pretend the first runner registered the task two days ago.
+        saved["tasks"]["nightly"]["cron_base"] = anchor - 2 * 86400
+        state.write_text(json.dumps(saved), encoding="utf-8")
+
+        calls: list[int] = []
+        second = TaskRunner(register_defaults=False, state_path=state)
+        second.register("nightly", lambda: calls.append(1), schedule="0 3 * * *")
+        assert second.list_tasks()[0].is_due()
+        assert second.run_once() == 1
+        assert calls == [1]
+        assert not second.list_tasks()[0].is_due()
+
+    def test_due_after_missed_fire(self) -> None:
+        runner = _make_runner()
+        runner.register("minutely", lambda: None, schedule="* * * * *")
+        task = runner.list_tasks()[0]
+        task.last_run = time.time() - 120
+        assert task.is_due()
+        assert runner.run_once() == 1
+        assert not task.is_due()
+        assert task.next_fire_time() > task.last_run
+
+    def test_fire_time_cached_per_reference(self) -> None:
+        runner = _make_runner()
+        runner.register("nightly", lambda: None, schedule="0 3 * * *")
+        task = runner.list_tasks()[0]
+        task.next_fire_time()
+        with patch.object(task.cron, "next_fire", side_effect=AssertionError("re-computed")):
+            task.next_due()
+            task.is_due()
+
+    def test_default_heavy_tasks_run_off_peak(self) -> None:
+        runner = TaskRunner(register_defaults=True)
+        schedules = {t.name: t.cron.expression for t in runner.list_tasks() if t.cron}
+        assert schedules == {"warden_scan": "0 3 * * *", "baseline_update": "0 3 * * *"}
+
+
+class TestMisfirePolicies:
+    def _late(self, misfire: str, missed: int = 3, **kwargs) -> tuple:
+        """Register a 60 s task whose last run was ``missed`` slots ago."""
+        runner = _make_runner()
+        calls: list[int] = []
+        runner.register(
+            "t", lambda: calls.append(1), interval_seconds=60, misfire=misfire, **kwargs
+        )
+        task = runner.list_tasks()[0]
+        task.last_run = time.time() - 60 * missed - 30
+        return runner, task, calls
+
+    def test_invalid_arguments(self) -> None:
+        runner = _make_runner()
+        with pytest.raises(ValueError):
+            runner.register("t", lambda: None, interval_seconds=1, misfire="later")
+        with pytest.raises(ValueError):
+            runner.register("t", lambda: None, interval_seconds=1, grace_seconds=-1)
+        with pytest.raises(ValueError):
+            runner.register("t", lambda: None, interval_seconds=1, priority="low")
+
+    def test_coalesce_runs_once(self) -> None:
+        runner, task, calls = self._late("coalesce")
+        assert task.missed_fires(time.time()) == 3
+        assert runner.run_once() == 1
+        assert runner.run_once() == 0
+        assert calls == [1]
+
+    def test_skip_records_and_waits_for_next_slot(self) -> None:
+        runner, task, calls = self._late("skip")
+        assert runner.run_once() == 0
+        result = runner.get_results()["t"]
+        assert result["status"] == "skipped"
+        assert "3 run(s) missed" in result["reason"]
+        assert calls == []
+        assert not task.is_due()
+
+    def test_within_grace_runs_normally(self) -> None:
+        runner, _, calls = self._late("skip", missed=1, grace_seconds=600)
+        assert runner.run_once() == 1
+        assert calls == [1]
+
+    def test_run_all_missed_catches_up(self) -> None:
+        runner, task, calls = self._late("run_all_missed")
+        for _ in range(3):
+            assert runner.run_once() == 1
+        assert task.pending_runs == 0
+        assert runner.run_once() == 0
+        assert len(calls) == 3
+
+    def test_missed_runs_are_capped(self) -> None:
+        _, task, _ = self._late("run_all_missed", missed=10 * MAX_MISSED_RUNS)
+        assert task.missed_fires(time.time()) == MAX_MISSED_RUNS
+
+    def test_cron_missed_fires(self) -> None:
+        runner = _make_runner()
+        runner.register("m", lambda: None, schedule="*/10 * * * *", misfire="skip")
+        task = runner.list_tasks()[0]
+        task.last_run = time.time() - 3600
+        assert 5 <= task.missed_fires(time.time()) <= 6
+        assert runner.run_once() == 0
+        assert runner.get_results()["m"]["status"] == "skipped"
+
+    def test_pending_runs_persist(self, tmp_path: Path) -> None:
+        state = tmp_path / "state.json"
+        runner = TaskRunner(register_defaults=False, state_path=state)
+        runner.register("t", lambda: None, interval_seconds=60, misfire="run_all_missed")
+        runner.list_tasks()[0].last_run = time.time() - 60 * 4 - 30
+        runner.run_once()
+        restored = TaskRunner(register_defaults=False, state_path=state)
+        restored.register("t", lambda: None, interval_seconds=60, misfire="run_all_missed")
+        assert restored.list_tasks()[0].pending_runs == 3
+        assert restored.list_tasks()[0].is_due()
+
+
+class TestCycleBudget:
+    def test_bulk_deferred_after_overrun(self) -> None:
+        runner = TaskRunner(register_defaults=False, cycle_budget_seconds=0.05)
+        calls: list[str] = []
+        runner.register("slow", lambda: time.sleep(0.1), interval_seconds=3600)
+        runner.register("bulk", lambda: calls.append("bulk"), interval_seconds=0, priority="bulk")
+        runner.register("urgent", lambda: calls.append("urgent"), interval_seconds=0)
+        assert runner.run_once() == 3
+        calls.clear()
+        assert runner.run_once() == 1  # previous cycle overran: bulk waits
+        assert calls == ["urgent"]
+        bulk = next(t for t in runner.list_tasks() if t.name == "bulk")
+        assert bulk.deferred and not bulk.is_due()
+
+    def test_bulk_never_deferred_twice_in_a_row(self) -> None:
+        runner = TaskRunner(register_defaults=False, cycle_budget_seconds=0.0)
+        runner.register("bulk", lambda: None, interval_seconds=0, priority="bulk")
+        bulk = runner.list_tasks()[0]
+        runner._last_cycle_seconds = 0.01
+        assert runner.run_once() == 0
+        time.sleep(0.02)
+        runner._last_cycle_seconds = 0.01
+        assert runner.run_once() == 1
+        assert not bulk.deferred
+
+    def test_guard_disabled_by_default(self) -> None:
+        runner = _make_runner()
+        runner.register("bulk", lambda: None, interval_seconds=0, priority="bulk")
+        runner._last_cycle_seconds = 1e6
+        assert runner.run_once() == 1
+
+
+class TestPriorityLanes:
+    def test_invalid_lanes(self) -> None:
+        with pytest.raises(ValueError):
+            TaskRunner(register_defaults=False, lanes={"urgent": 1})
+        with pytest.raises(ValueError):
+            TaskRunner(register_defaults=False, lanes={"bulk": 0})
+
+    def test_critical_does_not_wait_behind_bulk(self) -> None:
+        runner = TaskRunner(register_defaults=False, lanes={"critical": 1, "bulk": 1})
+        release = threading.Event()
+        probed = threading.Event()
+        runner.register("scan", lambda: release.wait(5), interval_seconds=0, priority="bulk")
+        runner.register(
+            "probe", lambda: probed.set() or release.set(), interval_seconds=0, priority="critical"
+        )
+        assert runner.run_once() == 2
+        assert probed.is_set()
+        assert runner.get_results()["probe"]["queue_seconds"] < 1
+
+    def test_lane_limit_bounds_concurrency(self) -> None:
+        runner = TaskRunner(register_defaults=False, lanes={"bulk": 1, "normal": 3})
+        active = {"bulk": 0, "normal": 0}
+        peak = {"bulk": 0, "normal": 0}
+        lock = threading.Lock()
+
+        def work(lane: str) -> None:
+            with lock:
+                active[lane] += 1
+                peak[lane] = max(peak[lane], active[lane])
+            time.sleep(0.05)
+            with lock:
+                active[lane] -= 1
+
+        for i in range(3):
+            runner.register(f"b{i}", lambda: work("bulk"), interval_seconds=0, priority="bulk")
+            runner.register(f"n{i}", lambda: work("normal"), interval_seconds=0)
+        assert runner.run_once() == 6
+        assert peak == {"bulk": 1, "normal": 3}
+        stats = runner.get_lane_stats()
+        assert stats["bulk"]["count"] == 3
+        assert stats["bulk"]["max"] >= 0.05
+
+    def test_tasks_due_mid_cycle_are_admitted(self) -> None:
+        runner = TaskRunner(register_defaults=False, lanes={"critical": 1, "bulk": 1})
+        release = threading.Event()
+        runner.register("scan", lambda: release.wait(5), interval_seconds=3600, priority="bulk")
+        with patch("runtime.task_runner.LANE_ADMISSION_POLL_SECONDS", 0.02):
+            cycle = threading.Thread(target=runner.run_once)
+            cycle.start()
+            time.sleep(0.05)
+            runner.register("probe", release.set, interval_seconds=3600, priority="critical")
+            cycle.join(timeout=5)
+        assert not cycle.is_alive()
+        assert set(runner.get_results()) == {"scan", "probe"}
+
+    def test_dependencies_across_lanes(self) -> None:
+        runner = TaskRunner(register_defaults=False, lanes={"critical": 1, "bulk": 1})
+        order: list[str] = []
+        runner.register("base", lambda: order.append("base"), interval_seconds=0, priority="bulk")
+        runner.register(
+            "after",
+            lambda: order.append("after"),
+            interval_seconds=0,
+            priority="critical",
+            depends_on=["base"],
+        )
+        assert runner.run_once() == 2
+        assert order == ["base", "after"]
+
+    def test_serial_mode_records_queue_delay(self) -> None:
+        runner = _make_runner()
+        runner.register("a", lambda: time.sleep(0.02), interval_seconds=0)
+        runner.register("b", lambda: None, interval_seconds=0)
+        runner.run_once()
+        assert runner.get_results()["b"]["queue_seconds"] >= 0.02
+        assert runner.get_lane_stats()["normal"]["count"] == 2
+
+    def test_async_lane_limits(self) -> None:
+        runner = AsyncTaskRunner(register_defaults=False, lanes={"bulk": 1})
+        active = []
+        peak = []
+
+        async def bulk() -> None:
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.02)
+            active.pop()
+
+        runner.register("b1", bulk, interval_seconds=0, priority="bulk")
+        runner.register("b2", bulk, interval_seconds=0, priority="bulk")
+        assert asyncio.run(runner.run_once()) == 2
+        assert max(peak) == 1
+        assert runner.get_results()["b2"]["queue_seconds"] >= 0.02
+
+
+class TestAdaptiveIntervals:
+    def _runner(self, tmp_path: Path, **kwargs) -> tuple:
+        watched = tmp_path / "registry.json"
+        watched.write_text("{}")
+        runner = TaskRunner(register_defaults=False, **kwargs)
+        policy = AdaptiveInterval(watch=(watched,), max_interval_seconds=400, factor=2.0)
+        runner.register("probe", lambda: None, interval_seconds=100, adaptive=policy)
+        return runner, runner.list_tasks()[0], watched
+
+    def _rerun(self, runner: TaskRunner, task: ScheduledTask) -> dict:
+        task.last_run = time.time() - 10_000
+        assert runner.run_once() == 1
+        return runner.get_results()["probe"]["adaptive"]
+
+    def test_policy_validation(self) -> None:
+        with pytest.raises(ValueError):
+            AdaptiveInterval(watch=(), max_interval_seconds=10)
+        with pytest.raises(ValueError):
+            AdaptiveInterval(watch=("a",), max_interval_seconds=10, factor=1.0)
+        policy = AdaptiveInterval(watch=(Path("a"),), max_interval_seconds=10)
+        assert policy.watch == ("a",)
+        with pytest.raises(ValueError):
+            _make_runner().register("t", lambda: None, schedule="@hourly", adaptive=policy)
+        with pytest.raises(ValueError):
+            _make_runner().register("t", lambda: None, interval_seconds=0, adaptive=policy)
+
+    def test_stretches_while_unchanged_and_snaps_back(self, tmp_path: Path) -> None:
+        runner, task, watched = self._runner(tmp_path)
+        assert self._rerun(runner, task) == {"inputs_changed": True, "interval_seconds": 100}
+        assert self._rerun(runner, task)["interval_seconds"] == 200
+        assert self._rerun(runner, task)["interval_seconds"] == 400
+        assert self._rerun(runner, task)["interval_seconds"] == 400  # capped
+        remaining = runner.seconds_until_next_due()
+        assert remaining is not None and 390 < remaining <= 400
+
+        watched.write_text('{"projects": {}}')
+        assert self._rerun(runner, task) == {"inputs_changed": True, "interval_seconds": 100}
+
+    def test_own_writes_do_not_count_as_change(self, tmp_path: Path) -> None:
+        watched = tmp_path / "log"
+        runner = _make_runner()
+        policy = AdaptiveInterval(watch=(watched,), max_interval_seconds=1000)
+        runner.register(
+            "writer", lambda: watched.write_text(str(time.time_ns())), interval_seconds=10, adaptive=policy
+        )
+        task = runner.list_tasks()[0]
+        runner.run_once()
+        task.last_run = 0.0
+        runner.run_once()
+        assert runner.get_results()["writer"]["adaptive"]["interval_seconds"] == 20
+
+    def test_state_survives_restart(self, tmp_path: Path) -> None:
+        state = tmp_path / "state.json"
+        runner, task, watched = self._runner(tmp_path, state_path=state)
+        self._rerun(runner, task)
+        self._rerun(runner, task)
+        restored, restored_task, _ = self._runner(tmp_path, state_path=state)
+        assert restored_task.current_interval == 200
+        assert restored_task.input_fingerprint == task.input_fingerprint
+
+
+class TestMemoization:
+    def _runner(self, tmp_path: Path, **kwargs) -> tuple:
+        if not (tmp_path / "src").exists():
+            (tmp_path / "src").mkdir()
+            (tmp_path / "src" / "a.txt").write_text("a")
+        runner = TaskRunner(register_defaults=False, **kwargs)
+        calls: list[int] = []
+        runner.register(
+            "pure",
+            lambda: calls.append(1) or {"files": len(list((tmp_path / "src").iterdir()))},
+            interval_seconds=0,
+            inputs=[tmp_path / "src"],
+        )
+        return runner, calls
+
+    def test_unchanged_inputs_serve_cached_result(self, tmp_path: Path) -> None:
+        runner, calls = self._runner(tmp_path)
+        runner.run_once()
+        first = runner.get_results()["pure"]
+        assert "cached" not in first
+        runner.run_once()
+        cached = runner.get_results()["pure"]
+        assert calls == [1]
+        assert cached["cached"] is True
+        assert cached["output"] == {"files": 1}
+        assert cached["cached_from"] == first["timestamp"]
+        assert runner.get_cache_stats()["pure"] == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    def test_nested_change_invalidates(self, tmp_path: Path) -> None:
+        runner, calls = self._runner(tmp_path)
+        runner.run_once()
+        (tmp_path / "src" / "deep").mkdir()
+        runner.run_once()
+        (tmp_path / "src" / "deep" / "b.txt").write_text("b")
+        runner.run_once()
+        assert len(calls) == 3
+        assert runner.get_results()["pure"]["output"] == {"files": 2}
+
+    def test_pruned_directories_are_not_walked(self, tmp_path: Path) -> None:
+        runner, calls = self._runner(tmp_path)
+        (tmp_path / "src" / "__pycache__").mkdir()
+        runner.run_once()
+        (tmp_path / "src" / "__pycache__" / "a.pyc").write_bytes(b"")
+        runner.run_once()
+        assert calls == [1]
+
+    def test_failures_are_not_cached(self, tmp_path: Path) -> None:
+        runner = _make_runner()
+        calls: list[int] = []
+
+        def flaky() -> None:
+            calls.append(1)
+            raise RuntimeError("boom")
+
+        runner.register("flaky", flaky, interval_seconds=0, inputs=[tmp_path])
+        runner.run_once()
+        runner.run_once()
+        assert len(calls) == 2
+        assert runner.get_cache_stats()["flaky"]["hits"] == 0
+
+    def test_memo_survives_restart(self, tmp_path: Path) -> None:
+        state = tmp_path / "state.json"
+        runner, calls = self._runner(tmp_path, state_path=state)
+        runner.run_once()
+        restored, restored_calls = self._runner(tmp_path, state_path=state)
+        restored.run_once()
+        assert restored_calls == []
+        assert restored.get_results()["pure"]["cached"] is True
+
+    def test_async_runner_memoizes(self, tmp_path: Path) -> None:
+        runner = AsyncTaskRunner(register_defaults=False)
+        calls: list[int] = []
+
+        async def pure() -> int:
+            calls.append(1)
+            return 7
+
+        runner.register("pure", pure, interval_seconds=0, inputs=[tmp_path])
+        asyncio.run(runner.run_once())
+        asyncio.run(runner.run_once())
+        assert calls == [1]
+        assert runner.get_results()["pure"]["output"] == 7
+
+
+class TestTriggerAndPause:
+    def test_trigger_runs_task_before_its_interval(self) -> None:
+        runner = _make_runner()
+        calls: list[int] = []
+        runner.register("t", lambda: calls.append(1), interval_seconds=3600)
+        runner.run_once()
+        runner.trigger("t")
+        assert runner.seconds_until_next_due() == 0.0
+        assert runner.run_once() == 1
+        assert runner.run_once() == 0
+        assert calls == [1, 1]
+
+    def test_trigger_rejects_unknown_and_disabled_tasks(self) -> None:
+        runner = _make_runner()
+        runner.register("t", lambda: None, interval_seconds=60)
+        runner.disable("t")
+        with pytest.raises(ValueError, match="disabled"):
+            runner.trigger("t")
+        with pytest.raises(KeyError):
+            runner.trigger("missing")
+
+    def test_pause_holds_due_tasks_until_resume(self) -> None:
+        runner = _make_runner()
+        calls: list[int] = []
+        runner.register("t", lambda: calls.append(1), interval_seconds=0)
+        runner.pause()
+        assert runner.paused
+        runner.trigger("t")
+        assert runner.run_once() == 0
+        runner.resume()
+        assert runner.run_once() == 1
+        assert calls == [1]
+
+    def test_resume_wakes_the_daemon(self) -> None:
+        runner = _make_runner()
+        ran = threading.Event()
+        runner.register("t", ran.set, interval_seconds=3600)
+        runner.pause()
+        thread = threading.Thread(target=runner.run_forever, daemon=True)
+        thread.start()
+        time.sleep(0.1)
+        assert not ran.is_set()
+        runner.resume()
+        assert ran.wait(2)
+        runner.stop()
+        thread.join(2)
+
+
+class TestEventTriggers:
+    def _runner(self, tmp_path: Path) -> tuple:
+        runner = TaskRunner(register_defaults=False)
+        calls: list = []
+        runner.register(
+            "react",
+            lambda paths: calls.append(paths) or len(paths),
+            interval_seconds=3600,
+            events=EventTrigger((str(tmp_path / "*.txt"),), debounce_seconds=0.05),
+        )
+        return runner, calls
+
+    def test_scheduled_runs_get_an_empty_path_list(self, tmp_path: Path) -> None:
+        runner, calls = self._runner(tmp_path)
+        runner.run_once()
+        assert calls == [[]]
+        assert runner.get_results()["react"]["events"] == {"changed": 0, "paths": []}
+
+    def test_changes_queue_a_run_with_the_changed_paths(self, tmp_path: Path) -> None:
+        runner, calls = self._runner(tmp_path)
+        runner.run_once()
+        changed = [str(tmp_path / "a.txt"), str(tmp_path / "b.txt")]
+        runner._on_files_changed("react", changed[:1])
+        runner._on_files_changed("react", changed)
+        assert runner.seconds_until_next_due() == 0.0
+        assert runner.run_once() == 1
+        assert calls[-1] == changed
+        assert runner.get_results()["react"]["events"]["changed"] == 2
+        assert runner.run_once() == 0
+
+    def test_lost_events_queue_a_full_run(self, tmp_path: Path) -> None:
+        runner, calls = self._runner(tmp_path)
+        runner.run_once()
+        runner._on_files_changed("react", [])
+        assert runner.run_once() == 1
+        assert calls == [[], []]
+
+    def test_daemon_reacts_to_file_changes(self, tmp_path: Path) -> None:
+        runner, calls = self._runner(tmp_path)
+        runner.run_once()
+        thread = threading.Thread(target=runner.run_forever, kwargs={"min_sleep": 0.01}, daemon=True)
+        thread.start()
+        try:
+            time.sleep(0.2)
+            (tmp_path / "new.txt").write_text("x")
+            (tmp_path / "ignored.log").write_text("x")
+            deadline = time.monotonic() + 5
+            while len(calls) < 2 and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            runner.stop()
+            thread.join(5)
+        assert [Path(p).name for p in calls[1]] == ["new.txt"]
+
+    def test_process_executor_receives_paths(self, tmp_path: Path) -> None:
+        runner = TaskRunner(register_defaults=False, watch_backend="poll")
+        runner.register(
+            "count",
+            len,
+            interval_seconds=3600,
+            executor="process",
+            events=EventTrigger((str(tmp_path / "*"),)),
+        )
+        runner._on_files_changed("count", ["/a", "/b", "/c"])
+        try:
+            runner.run_once()
+        finally:
+            runner.close()
+        assert runner.get_results()["count"]["output"] == 3
+
+
+class TestResultStreaming:
+    def test_listener_sees_each_result_as_it_completes(self) -> None:
+        runner = TaskRunner(register_defaults=False, max_workers=2)
+        seen: list = []
+        runner.add_result_listener(
+            lambda result: seen.append((result["task"], len(runner.get_results())))
+        )
+        runner.register("a", lambda: 1, interval_seconds=0)
+        runner.register("b", lambda: 2, interval_seconds=0, depends_on=["a"])
+        runner.run_once()
+        assert seen == [("a", 1), ("b", 2)]
+
+    def test_failing_listener_does_not_break_the_run(self) -> None:
+        runner = _make_runner()
+        runner.add_result_listener(lambda result: 1 / 0)
+        runner.register("a", lambda: 1, interval_seconds=0)
+        assert runner.run_once() == 1
+        assert runner.get_results()["a"]["status"] == "success"
+
+    def test_ndjson_writer_emits_compact_projected_lines(self) -> None:
+        stream = io.StringIO()
+        runner = _make_runner()
+        runner.add_result_listener(_NdjsonWriter(stream, ("task", "output.status")))
+        runner.register("a", lambda: {"status": "ok", "components": {"x": 1}}, interval_seconds=0)
+        runner.register("b", lambda: {"status": "warn"}, interval_seconds=0)
+        runner.run_once()
+        assert stream.getvalue().splitlines() == [
+            '{"task":"a","output":{"status":"ok"}}',
+            '{"task":"b","output":{"status":"warn"}}',
+        ]
+
+    def test_project_fields_keep_and_drop(self) -> None:
+        result = {"task": "h", "status": "success", "output": {"status": "ok", "components": {}}}
+        assert project_fields(result, None) is result
+        assert project_fields(result, ("status", "missing.key")) == {"status": "success"}
+        assert project_fields(result, ("-output.components", "-nope.x")) == {
+            "task": "h",
+            "status": "success",
+            "output": {"status": "ok"},
+        }
+        assert "components" in result["output"]
+
+
+@pytest.mark.skipif(not BUDGETS_AVAILABLE, reason="fork/rlimits unavailable")
+class TestResourceBudgets:
+    def test_budgeted_task_records_peak_usage(self) -> None:
+        runner = _make_runner()
+        runner.register("ok", _proc_square, interval_seconds=0, max_rss_mb=256)
+        runner.run_once()
+        result = runner.get_results()["ok"]
+        assert result["status"] == "success"
+        assert result["output"]["pid"] != os.getpid()
+        assert result["resources"]["limits"] == {"max_rss_mb": 256}
+        assert result["resources"]["peak_rss_mb"] > 0
+
+    def test_violation_has_distinct_status(self) -> None:
+        runner = _make_runner()
+        runner.register("hog", _proc_hog, interval_seconds=0, max_rss_mb=64)
+        runner.run_once()
+        result = runner.get_results()["hog"]
+        assert result["status"] == "budget_exceeded"
+        assert result["budget"] == {"resource": "memory", "limit": 64}
+        assert runner.get_stats()["hog"]["statuses"] == {"budget_exceeded": 1}
+
+    def test_timeout_applies_to_budgeted_tasks(self) -> None:
+        runner = _make_runner()
+        runner.register(
+            "slow", _proc_hang, interval_seconds=0, max_cpu_seconds=60, timeout_seconds=0.3
+        )
+        runner.run_once()
+        assert runner.get_results()["slow"]["status"] == "timeout"
+
+    def test_budgets_reject_process_and_coroutine_tasks(self) -> None:
+        runner = _make_runner()
+
+        async def probe() -> None:
+            return None
+
+        with pytest.raises(ValueError, match="budget"):
+            runner.register(
+                "p", _proc_square, interval_seconds=0, executor="process", max_rss_mb=64
+            )
+        with pytest.raises(ValueError, match="budget"):
+            runner.register("c", probe, interval_seconds=0, max_cpu_seconds=1)
+        with pytest.raises(ValueError):
+            runner.register("n", _proc_square, interval_seconds=0, max_open_files=1)
+        with pytest.raises(ValueError, match="picklable"):
+            runner.register("l", lambda: None, interval_seconds=0, max_rss_mb=64)
+
+
 # ---------------------------------------------------------------------------
 # Default tasks (registered via register_defaults=True)
 # ---------------------------------------------------------------------------
@@ -283,6 +1744,21 @@ class TestLegacyModuleAPI:
         results = run_all_once()
         assert "error" in results["bad"]
 
+    def test_schedule_string_is_interpreted(self) -> None:
+        register_task("leg", lambda: None, "hourly")
+        assert REGISTERED_TASKS["leg"]["cron"].expression == "0 * * * *"
+        assert REGISTERED_TASKS["leg"]["next_run"] > time.time()
+
+    def test_run_due_once_honours_schedule(self) -> None:
+        calls: list[str] = []
+        register_task("hourly", lambda: calls.append("hourly"), "hourly")
+        register_task("adhoc", lambda: calls.append("adhoc"), "on demand")
+        assert set(run_due_once()) == {"adhoc"}
+        REGISTERED_TASKS["hourly"]["next_run"] = time.time() - 1
+        assert set(run_due_once()) == {"hourly", "adhoc"}
+        assert REGISTERED_TASKS["hourly"]["next_run"] > time.time()
+        assert calls == ["adhoc", "hourly", "adhoc"]
+
     def test_list_tasks_prints_names(self, capsys: pytest.CaptureFixture) -> None:
         register_task("mytask", lambda: None, "daily", "desc")
         list_tasks()
@@ -294,7 +1770,209 @@ class TestLegacyModuleAPI:
             result = task_health_check()
         assert result == {"error": "Registry not found"}
 
+    def test_task_health_check_probes_registry(self, tmp_path: Path) -> None:
+        project = tmp_path / "atlas"
+        (project / "tests").mkdir(parents=True)
+        (project / "tests" / "test_atlas.py").write_text("", encoding="utf-8")
+        (project / "CLAUDE.md").write_text("", encoding="utf-8")
+        registry = {"projects": {"atlas": {"path": str(project)}, "gone": {"path": "/no/such"}}}
+        (tmp_path / "registry.json").write_text(json.dumps(registry), encoding="utf-8")
+        with patch("runtime.task_runner._GAIA_ROOT", str(tmp_path)):
+            result = task_health_check()
+        assert result == {
+            "atlas": {"exists": True, "has_git": False, "has_tests": True, "has_claude_md": True},
+            "gone": {"exists": False, "has_git": False, "has_tests": False, "has_claude_md": False},
+        }
+
+    def test_health_check_task_serves_unchanged_projects_from_cache(self, tmp_path: Path) -> None:
+        projects = {}
+        for name in ("atlas", "hermes"):
+            (tmp_path / name / "tests").mkdir(parents=True)
+            projects[name] = {"path": str(tmp_path / name)}
+        (tmp_path / "registry.json").write_text(
+            json.dumps({"projects": projects}), encoding="utf-8"
+        )
+        with patch("runtime.task_runner._GAIA_ROOT", str(tmp_path)):
+            first = _task_health_check()
+            (tmp_path / "hermes" / "CLAUDE.md").write_text("", encoding="utf-8")
+            second = _task_health_check()
+        assert first["from_cache"] == 0
+        assert second["from_cache"] == 1
+        assert second["message"] == "2 components checked (1 from cache)"
+        assert second["components"]["hermes"]["has_claude_md"] is True
+        assert (tmp_path / ".gaia_health_cache.json").exists()
+
+    def test_stale_cache_cleanup_task_counts_bytes_and_skips_pruned(self, tmp_path: Path) -> None:
+        old = time.time() - 2 * 86400
+        for rel in ("_AURORA/pkg/__pycache__", ".venv/lib/__pycache__", "_LOOM/__pycache__"):
+            cache_dir = tmp_path / rel
+            cache_dir.mkdir(parents=True)
+            (cache_dir / "mod.cpython-311.pyc").write_bytes(b"x" * 100)
+            (cache_dir.parent / "mod.py").write_text("", encoding="utf-8")
+        for rel in ("_AURORA/pkg/__pycache__", ".venv/lib/__pycache__"):
+            os.utime(tmp_path / rel, (old, old))
+        with patch("runtime.task_runner._GAIA_ROOT", str(tmp_path)):
+            result = _task_stale_cache_cleanup()
+        assert (result["scanned"], result["removed"], result["bytes_reclaimed"]) == (2, 1, 100)
+        assert not (tmp_path / "_AURORA/pkg/__pycache__/mod.cpython-311.pyc").exists()
+        assert (tmp_path / ".venv/lib/__pycache__/mod.cpython-311.pyc").exists()
+        assert (tmp_path / "_LOOM/__pycache__/mod.cpython-311.pyc").exists()
+
+    def test_stale_cache_cleanup_does_not_back_off(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """New stale bytecode is evicted one base interval later, however quiet GAIA is."""
+        monkeypatch.setattr("runtime.task_runner._GAIA_ROOT", str(tmp_path))
+        runner = TaskRunner(register_defaults=True)
+        for name in ("health_check", "guardrail_check", "warden_scan", "baseline_update"):
+            runner.disable(name)
+        task = next(t for t in runner.list_tasks() if t.name == "stale_cache_cleanup")
+        for _ in range(3):
+            task.last_run = time.time() - task.interval_seconds - 1
+            assert runner.run_once() == 1
+
+        orphan = tmp_path / "_LOOM" / "__pycache__" / "gone.cpython-311.pyc"
+        orphan.parent.mkdir(parents=True)
+        orphan.write_bytes(b"x" * 40)
+        task.last_run = time.time() - task.interval_seconds - 1
+        assert runner.run_once() == 1
+        assert runner.get_results()["stale_cache_cleanup"]["output"]["removed"] == 1
+        assert not orphan.exists()
+
+    def test_stale_cache_cleanup_dry_run_reports_orphans(self, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "_LOOM" / "__pycache__"
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "gone.cpython-312.pyc").write_bytes(b"x" * 40)
+        (cache_dir / "kept.cpython-312.pyc").write_bytes(b"x" * 60)
+        (tmp_path / "_LOOM" / "kept.py").write_text("", encoding="utf-8")
+        with patch("runtime.task_runner._GAIA_ROOT", str(tmp_path)):
+            result = _task_stale_cache_cleanup(dry_run=True)
+        assert (result["removed"], result["bytes_reclaimed"]) == (1, 40)
+        assert result["report"]["dry_run"] is True
+        assert result["report"]["by_reason"]["orphan"] == {"files": 1, "bytes": 40}
+        assert "would remove 1 .pyc files" in result["message"]
+        assert (cache_dir / "gone.cpython-312.pyc").exists()
+
+    def test_warden_scan_task_rescans_only_changed_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        seen: list = []
+
+        class SecretScanner:
+            rules = ["SECRET"]
+
+            def scan_file(self, path: Path) -> list:
+                seen.append(path.name)
+                text = path.read_text(encoding="utf-8")
+                return [{"file": str(path)}] if "SECRET" in text else []
+
+        scanner_module = types.ModuleType("warden.scanner")
+        scanner_module.SecretScanner = SecretScanner  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "warden", types.ModuleType("warden"))
+        monkeypatch.setitem(sys.modules, "warden.scanner", scanner_module)
+        monkeypatch.setattr("runtime.task_manifest.RACY_WINDOW_NS", -(10**18))
+        monkeypatch.setattr("runtime.task_runner._GAIA_ROOT", str(tmp_path))
+        monkeypatch.setattr(sys, "path", list(sys.path))
+        (tmp_path / "registry.json").write_text("{}", encoding="utf-8")
+        (tmp_path / "leak.env").write_text("SECRET", encoding="utf-8")
+
+        first = _task_warden_scan()
+        assert first["issues"] == 1
+        assert first["manifest"]["full_rescan"] is True
+        assert sorted(seen) == ["leak.env", "registry.json"]
+
+        seen.clear()
+        (tmp_path / "notes.txt").write_text("nothing here", encoding="utf-8")
+        # The runner's own churning files are never scanned.
+        (tmp_path / STATE_FILENAME).write_text("{}", encoding="utf-8")
+        (tmp_path / f"{HISTORY_FILENAME}-wal").write_text("", encoding="utf-8")
+        (tmp_path / LOCK_DIRNAME / "leases").mkdir(parents=True)
+        (tmp_path / LOCK_DIRNAME / "leases" / "t.lease").write_text("{}", encoding="utf-8")
+        second = _task_warden_scan()
+        assert seen == ["notes.txt"]
+        assert second["issues"] == 1
+        assert second["message"] == "1 issues found (incremental: 1 of 3 files scanned)"
+        assert "findings" not in second["manifest"]
+        assert second["mode"] == "incremental"
+
+    def test_warden_scan_without_scan_file_runs_full_scan(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        roots: list = []
+
+        class SecretScanner:
+            def scan(self, root: Path) -> list:
+                roots.append(root)
+                if not root.is_dir():
+                    return []
+                return [
+                    {"file": str(path)}
+                    for path in root.rglob("*")
+                    if path.is_file() and "SECRET" in path.read_text(encoding="utf-8")
+                ]
+
+        scanner_module = types.ModuleType("warden.scanner")
+        scanner_module.SecretScanner = SecretScanner  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "warden", types.ModuleType("warden"))
+        monkeypatch.setitem(sys.modules, "warden.scanner", scanner_module)
+        monkeypatch.setattr("runtime.task_runner._GAIA_ROOT", str(tmp_path))
+        monkeypatch.setattr(sys, "path", list(sys.path))
+        (tmp_path / "registry.json").write_text("{}", encoding="utf-8")
+        (tmp_path / "leak.env").write_text("SECRET", encoding="utf-8")
+
+        for _ in range(2):
+            result = _task_warden_scan()
+            assert (result["issues"], result["mode"]) == (1, "full")
+        assert roots == [tmp_path, tmp_path]
+        assert "manifest" not in result
+        assert not (tmp_path / WARDEN_MANIFEST_FILENAME).exists()
+
     def test_task_stale_cache_cleanup_no_registry(self) -> None:
         with patch("pathlib.Path.exists", return_value=False):
             result = task_stale_cache_cleanup()
         assert result is None
+
+
+class TestCommandLine:
+    def test_lanes_are_opt_in(self) -> None:
+        args = _build_arg_parser().parse_args([])
+        assert (args.workers, args.lanes) == (None, None)
+        args = _build_arg_parser().parse_args(["--lanes", "critical=2,bulk=1"])
+        assert args.lanes == {"critical": 2, "bulk": 1}
+
+    def test_workers_and_lanes_conflict(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+    ) -> None:
+        monkeypatch.setattr(sys, "argv", ["task_runner", "--workers", "4", "--lanes", "bulk=1"])
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+        assert excinfo.value.code == 2
+        assert "mutually exclusive" in capsys.readouterr().err
+
+    def test_once_outside_gaia_root_leaves_cwd_untouched(self, tmp_path: Path) -> None:
+        """Without a GAIA root or --state-dir, --once writes no state, history or locks."""
+        env = dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parents[2]))
+        completed = subprocess.run(
+            [sys.executable, "-m", "runtime.task_runner", "--once"],
+            cwd=tmp_path,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        assert completed.returncode == 0, completed.stderr
+        assert list(tmp_path.iterdir()) == []
+
+        state_dir = tmp_path / "state"
+        completed = subprocess.run(
+            [sys.executable, "-m", "runtime.task_runner", "--once", "--state-dir", "state"],
+            cwd=tmp_path,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        assert completed.returncode == 0, completed.stderr
+        assert [p.name for p in tmp_path.iterdir()] == ["state"]
+        assert (state_dir / STATE_FILENAME).exists()
+        assert (state_dir / HISTORY_FILENAME).exists()
@@ -0,0 +1,53 @@
+"""Tests for the GAIA task runner's persistent state store."""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Allow direct imports from the runtime package when run via pytest from root.
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from runtime.task_state import STATE_FORMAT_VERSION, TaskStateStore
+
+
+class TestTaskStateStore:
+    def test_load_missing_file_returns_empty(self, tmp_path: Path) -> None:
+        """A store whose file does not exist loads as empty."""
+        assert TaskStateStore(tmp_path / "state.json").load() == {}
+
+    def test_save_then_load_round_trips(self, tmp_path: Path) -> None:
+        """Saved task state is returned unchanged by load()."""
+        store = TaskStateStore(tmp_path / "nested" / "state.json")
+        state = {"t": {"last_run": 123.5, "enabled": False, "last_result": {"status": "success"}}}
+        store.save(state)
+        assert store.load() == state
+
+    def test_corrupt_file_is_ignored(self, tmp_path: Path) -> None:
+        """A truncated journal loads as empty instead of raising."""
+        path = tmp_path / "state.json"
+        path.write_text('{"version": 1, "tasks": {', encoding="utf-8")
+        assert TaskStateStore(path).load() == {}
+
+    def test_unknown_format_version_is_ignored(self, tmp_path: Path) -> None:
+        """State written by an incompatible format version is not applied."""
+        path = tmp_path / "state.json"
+        path.write_text(json.dumps({"version": STATE_FORMAT_VERSION + 1, "tasks": {"t": {}}}))
+        assert TaskStateStore(path).load() == {}
+
+    def test_failed_write_keeps_previous_state(self, tmp_path: Path) -> None:
+        """A crash during replace leaves the old file intact and no temp files."""
+        path = tmp_path / "state.json"
+        store = TaskStateStore(path)
+        store.save({"t": {"last_run": 1.0}})
+        with patch("runtime.task_state.os.replace", side_effect=OSError("disk full")):
+            store.save({"t": {"last_run": 2.0}})
+        assert store.load() == {"t": {"last_run": 1.0}}
+        assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+    def test_non_json_values_are_stringified(self, tmp_path: Path) -> None:
+        """Task outputs that are not JSON-serialisable are stored as strings."""
+        store = TaskStateStore(tmp_path / "state.json")
+        store.save({"t": {"last_result": {"output": Path("/x")}}})
+        assert store.load()["t"]["last_result"]["output"] == str(Path("/x"))
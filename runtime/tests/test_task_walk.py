@@ -0,0 +1,128 @@
+"""Tests for the GAIA pruned parallel tree walker."""
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Allow direct imports from the runtime package when run via pytest from root.
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from runtime.task_walk import PruneRules, find_dirs, walk_files
+
+
+def _touch(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("", encoding="utf-8")
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    for rel in (
+        "__pycache__/top.pyc",
+        "_AURORA/__pycache__/a.pyc",
+        "_AURORA/pkg/__pycache__/b.pyc",
+        "_AURORA/pkg/__pycache__/nested/__pycache__/x.pyc",
+        "_LOOM/src/deep/__pycache__/c.pyc",
+        ".git/objects/__pycache__/no.pyc",
+        "node_modules/lib/__pycache__/no.pyc",
+        "archive/old/__pycache__/no.pyc",
+        "_LOOM/.venv/lib/__pycache__/no.pyc",
+        "_LOOM/env311/pyvenv.cfg",
+        "_LOOM/env311/lib/__pycache__/no.pyc",
+        "_LOOM/loom.egg-info/__pycache__/no.pyc",
+    ):
+        _touch(tmp_path / rel)
+    return tmp_path
+
+
+def _rel(root: Path, paths: list) -> list:
+    return [Path(p).relative_to(root).as_posix() for p in paths]
+
+
+class TestPruneRules:
+    def test_prunes_names_and_globs(self) -> None:
+        rules = PruneRules()
+        assert rules.prunes(".git") and rules.prunes("archive")
+        assert rules.prunes("gaia.egg-info")
+        assert not rules.prunes("src")
+
+    def test_rejects_bare_strings(self) -> None:
+        with pytest.raises(TypeError):
+            PruneRules(names=".git")  # type: ignore[arg-type]
+        assert PruneRules(names=[".git"], globs=[]).names == frozenset({".git"})
+
+
+class TestFindDirs:
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_finds_matches_outside_pruned_subtrees(self, tree: Path, workers: int) -> None:
+        found = find_dirs(tree, {"__pycache__"}, max_workers=workers)
+        assert _rel(tree, found) == [
+            "__pycache__",
+            "_AURORA/__pycache__",
+            "_AURORA/pkg/__pycache__",
+            "_LOOM/src/deep/__pycache__",
+        ]
+
+    def test_parallel_and_serial_agree(self, tree: Path) -> None:
+        for i in range(12):
+            _touch(tree / f"_C{i:02d}" / "m" / "__pycache__" / "m.pyc")
+        assert find_dirs(tree, {"__pycache__"}, max_workers=1) == find_dirs(
+            tree, {"__pycache__"}, max_workers=8
+        )
+
+    def test_custom_rules_walk_everything_but_git(self, tree: Path) -> None:
+        rules = PruneRules(names={".git"}, globs=(), markers=())
+        found = _rel(tree, find_dirs(tree, {"__pycache__"}, prune=rules))
+        assert "archive/old/__pycache__" in found
+        assert "_LOOM/env311/lib/__pycache__" in found
+        assert not any(path.startswith(".git") for path in found)
+
+    def test_symlinks_are_not_followed(self, tree: Path, tmp_path_factory) -> None:
+        outside = tmp_path_factory.mktemp("outside")
+        _touch(outside / "__pycache__" / "o.pyc")
+        try:
+            os.symlink(outside, tree / "link", target_is_directory=True)
+            os.symlink(outside / "__pycache__", tree / "_AURORA" / "linked_cache")
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks unavailable")
+        found = _rel(tree, find_dirs(tree, {"__pycache__"}))
+        assert not any("link" in path for path in found)
+
+    def test_missing_root_and_validation(self, tmp_path: Path) -> None:
+        assert find_dirs(tmp_path / "missing", {"__pycache__"}) == []
+        with pytest.raises(ValueError):
+            find_dirs(tmp_path, {"__pycache__"}, max_workers=0)
+
+
+class TestWalkFiles:
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_lists_files_outside_pruned_subtrees(self, tmp_path: Path, workers: int) -> None:
+        for rel in (
+            "registry.json",
+            "_AURORA/app.py",
+            "_AURORA/sub/config.yaml",
+            "_LOOM/loom.py",
+            "archive/old.txt",
+            ".git/config",
+            "_LOOM/node_modules/lib.js",
+        ):
+            _touch(tmp_path / rel)
+        (tmp_path / "_AURORA" / "app.py").write_text("abc", encoding="utf-8")
+        rules = PruneRules(names={".git", "node_modules"}, globs=(), markers=())
+        found = walk_files(tmp_path, prune=rules, max_workers=workers)
+        assert _rel(tmp_path, [path for path, _ in found]) == [
+            "registry.json",
+            "_AURORA/app.py",
+            "_AURORA/sub/config.yaml",
+            "_LOOM/loom.py",
+            "archive/old.txt",
+        ]
+        assert [st.st_size for _, st in found] == [0, 3, 0, 0, 0]
+
+    def test_validation(self, tmp_path: Path) -> None:
+        assert walk_files(tmp_path / "missing") == []
+        with pytest.raises(ValueError):
+            walk_files(tmp_path, max_workers=0)
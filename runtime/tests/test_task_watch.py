@@ -0,0 +1,152 @@
+"""Tests for the GAIA task runner's filesystem-event triggers."""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+# Allow direct imports from the runtime package when run via pytest from root.
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from runtime.task_watch import (
+    EventTrigger,
+    FileWatcher,
+    InotifyBackend,
+    PollingBackend,
+    glob_to_regex,
+)
+
+try:
+    InotifyBackend().close()
+    HAVE_INOTIFY = True
+except OSError:
+    HAVE_INOTIFY = False
+
+BACKENDS = ["poll"] + (["inotify"] if HAVE_INOTIFY else [])
+
+
+def _posix(path: Path) -> str:
+    return str(path).replace("\\", "/")
+
+
+class TestGlobs:
+    @pytest.mark.parametrize(
+        ("pattern", "path", "expected"),
+        [
+            ("/r/*.py", "/r/a.py", True),
+            ("/r/*.py", "/r/sub/a.py", False),
+            ("/r/**/*.py", "/r/a.py", True),
+            ("/r/**/*.py", "/r/x/y/a.py", True),
+            ("/r/**", "/r/x/y", True),
+            ("/r/t?st_[!x].py", "/r/test_a.py", True),
+            ("/r/t?st_[!x].py", "/r/test_x.py", False),
+            ("/r/a+b.json", "/r/a+b.json", True),
+        ],
+    )
+    def test_glob_to_regex(self, pattern: str, path: str, expected: bool) -> None:
+        assert bool(glob_to_regex(pattern).match(path)) is expected
+
+    def test_roots_and_depths(self, tmp_path: Path) -> None:
+        root = _posix(tmp_path)
+        trigger = EventTrigger((f"{root}/**/*.py", f"{root}/a/*/x.txt", f"{root}/registry.json"))
+        assert trigger.roots() == [(root, None), (f"{root}/a", 1), (root, 0)]
+
+    def test_relative_globs_are_anchored(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        trigger = EventTrigger("src/*.py")
+        assert trigger.globs == (_posix(Path.cwd() / "src" / "*.py"),)
+        assert trigger.matches(_posix(Path.cwd() / "src" / "m.py"))
+
+    def test_validation(self) -> None:
+        with pytest.raises(ValueError):
+            EventTrigger(())
+        with pytest.raises(ValueError):
+            EventTrigger("/x/*", debounce_seconds=-1)
+
+
+class TestBackends:
+    def test_polling_backend_reports_added_modified_removed(self, tmp_path: Path) -> None:
+        (tmp_path / "keep.txt").write_text("a")
+        (tmp_path / "gone.txt").write_text("a")
+        (tmp_path / ".git").mkdir()
+        backend = PollingBackend(poll_seconds=0)
+        backend.add_tree(str(tmp_path))
+        (tmp_path / "keep.txt").write_text("longer")
+        (tmp_path / "gone.txt").unlink()
+        (tmp_path / "new.txt").write_text("n")
+        (tmp_path / ".git" / "HEAD").write_text("ref")
+        changed = {Path(p).name for p in backend.read(0)}
+        assert changed == {"keep.txt", "gone.txt", "new.txt"}
+
+    @pytest.mark.skipif(not HAVE_INOTIFY, reason="inotify unavailable")
+    def test_inotify_backend_follows_new_directories(self, tmp_path: Path) -> None:
+        backend = InotifyBackend()
+        try:
+            backend.add_tree(str(tmp_path))
+            (tmp_path / "sub").mkdir()
+            changed: List[str] = list(backend.read(1) or [])
+            (tmp_path / "sub" / "a.txt").write_text("x")
+            deadline = time.monotonic() + 2
+            while time.monotonic() < deadline and str(tmp_path / "sub" / "a.txt") not in changed:
+                changed += backend.read(0.1) or []
+            assert str(tmp_path / "sub" / "a.txt") in changed
+        finally:
+            backend.close()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestFileWatcher:
+    def _watch(self, backend: str, trigger: EventTrigger) -> tuple:
+        batches: List[List[str]] = []
+        fired = threading.Event()
+
+        def on_change(name: str, paths: List[str]) -> None:
+            batches.append(paths)
+            fired.set()
+
+        watcher = FileWatcher(on_change, backend=backend, poll_seconds=0.05)
+        watcher.subscribe("t", trigger)
+        watcher.start()
+        return watcher, batches, fired
+
+    def test_burst_is_debounced_into_one_batch(self, tmp_path: Path, backend: str) -> None:
+        trigger = EventTrigger((f"{_posix(tmp_path)}/**/*.py",), debounce_seconds=0.3)
+        watcher, batches, fired = self._watch(backend, trigger)
+        try:
+            assert watcher.backend == backend
+            (tmp_path / "pkg").mkdir()
+            for i in range(3):
+                (tmp_path / f"m{i}.py").write_text("x")
+                time.sleep(0.02)
+            (tmp_path / "notes.txt").write_text("ignored")
+            assert fired.wait(5)
+            time.sleep(0.5)
+        finally:
+            watcher.stop()
+        assert len(batches) == 1
+        assert [Path(p).name for p in batches[0]] == ["m0.py", "m1.py", "m2.py"]
+
+    def test_pruned_directories_are_ignored(self, tmp_path: Path, backend: str) -> None:
+        (tmp_path / "node_modules").mkdir()
+        trigger = EventTrigger((f"{_posix(tmp_path)}/**",), debounce_seconds=0.05)
+        watcher, batches, fired = self._watch(backend, trigger)
+        try:
+            (tmp_path / "node_modules" / "x.js").write_text("x")
+            assert not fired.wait(0.5)
+        finally:
+            watcher.stop()
+        assert batches == []
+
+
+class TestLostEvents:
+    def test_lost_events_yield_empty_batch(self, tmp_path: Path) -> None:
+        batches: Dict[str, List[str]] = {}
+        watcher = FileWatcher(lambda name, paths: batches.setdefault(name, paths))
+        watcher.subscribe("t", EventTrigger((f"{_posix(tmp_path)}/*",), debounce_seconds=0))
+        watcher._dispatch(None)
+        watcher._fire_expired()
+        assert batches == {"t": []}